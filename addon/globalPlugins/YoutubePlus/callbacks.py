@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# callbacks.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import threading
+import time
+import weakref
+import wx
+from logHandler import log
+from .metrics import metrics
+from .responsiveness import ui_probe
+
+class _CallbackRef:
+    """
+    Refers to a registered callback. Bound methods are held weakly, so registering a
+    dialog's method does not keep the dialog alive; plain functions are held strongly.
+    """
+
+    def __init__(self, func, on_dead):
+        if hasattr(func, '__self__') and hasattr(func, '__func__'):
+            self._ref = weakref.WeakMethod(func, on_dead)
+        else:
+            self._ref = lambda: func
+
+    def resolve(self):
+        """Returns the callback, or None once its owner is gone or is a destroyed wx window."""
+        func = self._ref()
+        if func is None:
+            return None
+        owner = getattr(func, '__self__', None)
+        # A destroyed wx window stays a valid Python object but evaluates to False.
+        if isinstance(owner, wx.Window) and not owner:
+            return None
+        return func
+
+class CallbackBus:
+    """
+    Delivers the add-on's events to the callbacks registered for their topic, on the GUI thread.
+    Events notified between two GUI ticks are delivered together by a single wx.CallAfter,
+    instead of one queued call per event and subscriber.
+    Coalesced topics (progress reports) keep only their latest value and are delivered at most
+    max_per_second times; the latest value is always delivered eventually.
+    Callbacks of windows that were destroyed or garbage collected without unregistering
+    are pruned automatically. notify can be called from any thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+        self._min_intervals = {}
+        self._pending = []
+        self._latest = {}
+        self._last_delivery = {}
+        self._flush_scheduled = False
+        self._timer = None
+        # Set from weakref callbacks, which may run during garbage collection on any thread,
+        # so they must not take the lock; the lists are pruned on the next access instead.
+        self._has_dead_refs = False
+
+    def _on_ref_dead(self, ref):
+        self._has_dead_refs = True
+
+    def _prune(self):
+        """Drops the references whose callbacks are gone. Called with the lock held."""
+        pruned = 0
+        for topic, refs in self._subscribers.items():
+            live = [ref for ref in refs if ref.resolve() is not None]
+            pruned += len(refs) - len(live)
+            self._subscribers[topic] = live
+        self._has_dead_refs = False
+        if pruned:
+            metrics.increment("callbacks.pruned", pruned)
+            log.debug(f"Pruned {pruned} callbacks of closed windows.")
+
+    def _find(self, topic, func):
+        for ref in self._subscribers.get(topic, ()):
+            if ref.resolve() == func:
+                return ref
+        return None
+
+    def coalesce(self, topic, max_per_second):
+        """Makes topic latest-value-wins, delivered at most max_per_second times."""
+        with self._lock:
+            self._min_intervals[topic] = 1.0 / max_per_second
+
+    def register(self, topic, func):
+        with self._lock:
+            if self._has_dead_refs:
+                self._prune()
+            if self._find(topic, func):
+                return
+            self._subscribers.setdefault(topic, []).append(_CallbackRef(func, self._on_ref_dead))
+        log.debug(f"Callback registered for topic '{topic}': {getattr(func, '__name__', func)}")
+
+    def unregister(self, topic, func):
+        with self._lock:
+            ref = self._find(topic, func)
+            if not ref:
+                return
+            self._subscribers[topic].remove(ref)
+        log.debug(f"Callback unregistered for topic '{topic}': {getattr(func, '__name__', func)}")
+
+    def notify(self, topic, data=None):
+        """Queues an event; the callbacks receive data, or no argument when it is None."""
+        queued_at = time.perf_counter()
+        with self._lock:
+            if self._has_dead_refs:
+                self._prune()
+            if not self._subscribers.get(topic):
+                return
+            if topic in self._min_intervals:
+                self._latest[topic] = (data, queued_at)
+            else:
+                self._pending.append((topic, data, queued_at))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        wx.CallAfter(self._flush)
+
+    def _flush(self):
+        """Delivers the queued events and the coalesced values that are due. Runs on the GUI thread."""
+        now = time.perf_counter()
+        next_delay = None
+        with self._lock:
+            self._flush_scheduled = False
+            batch, self._pending = self._pending, []
+            for topic, (data, queued_at) in list(self._latest.items()):
+                wait = self._last_delivery.get(topic, 0.0) + self._min_intervals[topic] - now
+                if wait > 0:
+                    next_delay = wait if next_delay is None else min(next_delay, wait)
+                    continue
+                del self._latest[topic]
+                self._last_delivery[topic] = now
+                batch.append((topic, data, queued_at))
+        for topic, data, queued_at in batch:
+            self._deliver(topic, data, queued_at)
+        if next_delay is not None and self._timer is None:
+            self._timer = wx.CallLater(int(next_delay * 1000) + 1, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._flush()
+
+    def _deliver(self, topic, data, queued_at):
+        with self._lock:
+            # Subscribers are looked up at delivery time, so a dialog that unregistered or
+            # was destroyed after the event was queued is not called.
+            refs = list(self._subscribers.get(topic, ()))
+        subscribers = [ref.resolve() for ref in refs]
+        if None in subscribers:
+            with self._lock:
+                self._prune()
+        args = () if data is None else (data,)
+        for func in filter(None, subscribers):
+            started = time.perf_counter()
+            metrics.observe("callbacks.queue_delay", started - queued_at, label=topic)
+            handler = f"{topic}: {getattr(func, '__qualname__', None) or repr(func)}"
+            try:
+                with ui_probe.activity(handler):
+                    func(*args)
+            except Exception:
+                log.exception(f"Error in callback for topic '{topic}'.")
+            finally:
+                metrics.observe("callbacks.handler", time.perf_counter() - started, label=handler)
+
+    def subscriber_counts(self):
+        """Returns the number of live callbacks per topic."""
+        with self._lock:
+            self._prune()
+            return {topic: len(refs) for topic, refs in self._subscribers.items() if refs}
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# category_index.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import threading
+from .metrics import metrics
+
+class CategoryMembershipIndex:
+    """
+    Which subscribed channels belong to which user category, read from
+    channel_category_links once and then answered from memory.
+    Every code path that changes the links must call invalidate().
+    """
+
+    def __init__(self, db):
+        self._db = db
+        self._lock = threading.Lock()
+        self._channels_by_category = None
+        # Bumped by invalidate(), so a load that raced with a change is not kept.
+        self._generation = 0
+
+    def _index(self):
+        with self._lock:
+            if self._channels_by_category is not None:
+                metrics.increment("cache.hit", label="category_membership")
+                return self._channels_by_category
+            generation = self._generation
+        metrics.increment("cache.miss", label="category_membership")
+        channels_by_category = {}
+        with self._db.connection() as con, metrics.timer("db.query", label="category_membership.load"):
+            for channel_url, category_id in con.execute("SELECT channel_url, category_id FROM channel_category_links"):
+                channels_by_category.setdefault(category_id, set()).add(channel_url)
+        channels_by_category = {category_id: frozenset(urls) for category_id, urls in channels_by_category.items()}
+        with self._lock:
+            if generation == self._generation:
+                self._channels_by_category = channels_by_category
+        return channels_by_category
+
+    def channels_in(self, category_id):
+        """Returns the URLs of the channels in a category."""
+        return self._index().get(category_id, frozenset())
+
+    def categories_of(self, channel_url):
+        """Returns the ids of the categories a channel is in."""
+        return {category_id for category_id, urls in self._index().items() if channel_url in urls}
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._channels_by_category = None
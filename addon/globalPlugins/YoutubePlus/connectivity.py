@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# connectivity.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import socket
+import threading
+import time
+import urllib.request
+from urllib.parse import urlparse
+from logHandler import log
+from .metrics import metrics
+
+PROBE_HOST = "www.youtube.com"
+PROBE_PORT = 443
+PROBE_TIMEOUT_SECONDS = 3
+# How often reachability is checked while online, and while offline waiting for the connection to return.
+ONLINE_CHECK_SECONDS = 300
+OFFLINE_CHECK_SECONDS = 10
+# A probe result is reused for this long, so parallel failing workers don't all probe.
+PROBE_REUSE_SECONDS = 5
+
+class ConnectivityMonitor:
+    """
+    Tracks whether YouTube can be reached at all.
+    Network failures reported by the workers trigger an immediate reachability probe
+    (a TCP connection to YouTube, or to the system proxy when one is set); a failed
+    probe switches to offline mode. A background thread probes occasionally while
+    online and frequently while offline, and switches back once a probe succeeds.
+    on_change(online) is called from that thread, or from a worker, on every switch.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Held while probing, so concurrent callers wait for one probe and reuse its result.
+        self._probe_lock = threading.Lock()
+        self._online = True
+        self._last_probe_at = None
+        self._last_probe_result = True
+        self._on_change = None
+        self._enabled_func = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+    def start(self, on_change, enabled_func):
+        """enabled_func returns False when offline detection is turned off in the settings."""
+        if self._thread is not None:
+            return
+        self._on_change = on_change
+        self._enabled_func = enabled_func
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,), name="YoutubePlusConnectivity", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake_event.set()
+        self._thread = None
+
+    @property
+    def enabled(self):
+        try:
+            return self._enabled_func is None or bool(self._enabled_func())
+        except Exception:
+            return True
+
+    @property
+    def is_offline(self):
+        return not self._online and self.enabled
+
+    @staticmethod
+    def _probe_address():
+        """Returns where to connect: the HTTPS proxy if one is configured, YouTube otherwise."""
+        proxies = urllib.request.getproxies()
+        proxy = proxies.get('https') or proxies.get('http')
+        if proxy:
+            parsed = urlparse(proxy if '://' in proxy else f"http://{proxy}")
+            if parsed.hostname:
+                return parsed.hostname, parsed.port or 80
+        return PROBE_HOST, PROBE_PORT
+
+    def probe(self, force=False):
+        """Checks whether YouTube is reachable and updates the mode. Returns True if online."""
+        with self._probe_lock:
+            now = time.monotonic()
+            if not force and self._last_probe_at is not None and now - self._last_probe_at < PROBE_REUSE_SECONDS:
+                reachable = self._last_probe_result
+            else:
+                started = time.perf_counter()
+                try:
+                    with socket.create_connection(self._probe_address(), timeout=PROBE_TIMEOUT_SECONDS):
+                        reachable = True
+                except OSError as e:
+                    log.debug(f"Connectivity probe failed: {e}")
+                    reachable = False
+                metrics.observe("connectivity.probe", time.perf_counter() - started, label="reachable" if reachable else "unreachable")
+                self._last_probe_at = time.monotonic()
+                self._last_probe_result = reachable
+        self._set_online(reachable)
+        return reachable
+
+    def report_failure(self, error):
+        """
+        Called by a worker after a network failure. Confirms with a probe whether the
+        connection itself is down; returns True if the add-on is now offline.
+        """
+        if not self.enabled:
+            return False
+        log.debug(f"Network failure reported, checking connectivity: {error}")
+        return not self.probe()
+
+    def report_success(self):
+        """Called after a successful request; a working request proves the connection is back."""
+        self._set_online(True)
+
+    def _set_online(self, online):
+        with self._lock:
+            if online == self._online:
+                return
+            self._online = online
+        metrics.increment("connectivity.switches", label="online" if online else "offline")
+        if online:
+            log.info("YouTube is reachable again; leaving offline mode.")
+        else:
+            log.warning("YouTube cannot be reached; switching to offline mode.")
+        self._wake_event.set()
+        if self._on_change is not None:
+            try:
+                self._on_change(online)
+            except Exception:
+                log.error("Error handling a connectivity change.", exc_info=True)
+
+    def _run(self, stop_event):
+        # Check once right away, so an update scheduled at startup already knows the mode.
+        if self.enabled:
+            self.probe(force=True)
+        while not stop_event.is_set():
+            interval = ONLINE_CHECK_SECONDS if self._online else OFFLINE_CHECK_SECONDS
+            woken = self._wake_event.wait(interval)
+            self._wake_event.clear()
+            if stop_event.is_set():
+                return
+            if woken:
+                # The mode changed; wait again with the interval of the new mode.
+                continue
+            if self.enabled:
+                self.probe(force=True)
+            elif not self._online:
+                # Detection was turned off while offline; stop blocking commands.
+                self._set_online(True)
+
+# Shared by the whole add-on.
+connectivity = ConnectivityMonitor()
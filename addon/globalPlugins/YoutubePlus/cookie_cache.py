@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# cookie_cache.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import glob
+import os
+import threading
+import time
+from logHandler import log
+from .metrics import metrics
+
+# Cookie databases per browser, relative to %LOCALAPPDATA% or %APPDATA%.
+_COOKIE_DB_PATTERNS = {
+    'chrome': [('LOCALAPPDATA', r"Google\Chrome\User Data\*\Cookies"), ('LOCALAPPDATA', r"Google\Chrome\User Data\*\Network\Cookies")],
+    'edge': [('LOCALAPPDATA', r"Microsoft\Edge\User Data\*\Cookies"), ('LOCALAPPDATA', r"Microsoft\Edge\User Data\*\Network\Cookies")],
+    'brave': [('LOCALAPPDATA', r"BraveSoftware\Brave-Browser\User Data\*\Cookies"), ('LOCALAPPDATA', r"BraveSoftware\Brave-Browser\User Data\*\Network\Cookies")],
+    'vivaldi': [('LOCALAPPDATA', r"Vivaldi\User Data\*\Cookies"), ('LOCALAPPDATA', r"Vivaldi\User Data\*\Network\Cookies")],
+    'opera': [('APPDATA', r"Opera Software\Opera Stable\Cookies"), ('APPDATA', r"Opera Software\Opera Stable\Network\Cookies"), ('APPDATA', r"Opera Software\Opera Stable\*\Network\Cookies")],
+    'firefox': [('APPDATA', r"Mozilla\Firefox\Profiles\*\cookies.sqlite")],
+}
+
+class _CookieLogger:
+    """Quiet logger for yt-dlp's cookie extraction, which passes extra keyword arguments."""
+    def debug(self, msg, *args, **kwargs):
+        log.debug("yt-dlp cookies: %s", msg)
+    def info(self, msg, *args, **kwargs):
+        log.debug("yt-dlp cookies: %s", msg)
+    def warning(self, msg, *args, **kwargs):
+        log.debug("yt-dlp cookies (warning): %s", msg)
+    def error(self, msg, *args, **kwargs):
+        log.warning("yt-dlp cookies: %s", msg)
+
+class BrowserCookieCache:
+    """
+    Extracts a browser's cookie jar once and keeps it in memory.
+    The jar is re-extracted when it is older than the TTL, or when the browser's
+    cookie database has been modified since the last extraction.
+    """
+
+    # Browsers rewrite their cookie database constantly while in use,
+    # so a changed mtime only forces a refresh once the jar is at least this old.
+    MIN_REFRESH_SECONDS = 60
+    # How often the cookie database mtime is checked at most.
+    FINGERPRINT_CHECK_SECONDS = 10
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._browser = None
+        self._jar = None
+        self._extracted_at = 0.0
+        self._fingerprint = None
+        self._fingerprint_checked_at = 0.0
+
+    @staticmethod
+    def _cookie_db_fingerprint(browser):
+        """Returns the newest mtime among the browser's cookie database files, or None if not found."""
+        newest = None
+        for env_var, pattern in _COOKIE_DB_PATTERNS.get(browser, []):
+            base = os.environ.get(env_var)
+            if not base:
+                continue
+            for path in glob.glob(os.path.join(base, pattern)):
+                for candidate in (path, path + "-wal", path + "-journal"):
+                    try:
+                        mtime = os.path.getmtime(candidate)
+                    except OSError:
+                        continue
+                    if newest is None or mtime > newest:
+                        newest = mtime
+        return newest
+
+    def _needs_refresh(self, browser, ttl, now):
+        if browser != self._browser or not self._extracted_at:
+            return True
+        age = now - self._extracted_at
+        if age >= ttl:
+            log.debug("Cached %s cookies expired after %d seconds.", browser, age)
+            return True
+        if age < self.MIN_REFRESH_SECONDS:
+            return False
+        if self._jar is None:
+            return True
+        if now - self._fingerprint_checked_at < self.FINGERPRINT_CHECK_SECONDS:
+            return False
+        self._fingerprint_checked_at = now
+        fingerprint = self._cookie_db_fingerprint(browser)
+        if fingerprint != self._fingerprint:
+            log.debug("Cookie database of %s changed since last extraction.", browser)
+            return True
+        return False
+
+    def get_jar(self, browser, ttl):
+        """
+        Returns the cached cookie jar for browser, extracting it first if needed.
+        Returns None when the cookies could not be extracted.
+        """
+        now = time.time()
+        with self._lock:
+            if not self._needs_refresh(browser, ttl, now):
+                metrics.increment("cache.hit", label="browser_cookies")
+                return self._jar
+            metrics.increment("cache.miss", label="browser_cookies")
+            fingerprint = self._cookie_db_fingerprint(browser)
+            jar = None
+            try:
+                from yt_dlp.cookies import extract_cookies_from_browser
+                log.debug("Extracting cookies from browser: %s", browser)
+                started = time.time()
+                jar = extract_cookies_from_browser(browser, logger=_CookieLogger())
+                log.debug("Extracted %d cookies from %s in %.2fs.", len(jar), browser, time.time() - started)
+            except Exception as e:
+                # A failed extraction is also cached, so it is only retried after MIN_REFRESH_SECONDS.
+                log.warning(f"Could not extract cookies from {browser}: {e}")
+            self._browser = browser
+            self._jar = jar
+            self._extracted_at = now
+            self._fingerprint = fingerprint
+            self._fingerprint_checked_at = now
+            return jar
+
+    def invalidate(self):
+        """Drops the cached jar so the next request extracts the cookies again."""
+        with self._lock:
+            self._browser = None
+            self._jar = None
+            self._extracted_at = 0.0
+            self._fingerprint = None
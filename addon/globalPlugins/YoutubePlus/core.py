@@ -28,7 +28,7 @@ import tones
 import nvwave
 import gui
 import wx
-import concurrent.futures
+import queue
 import urllib.request
 from urllib.parse import urlparse, parse_qs, unquote
 from collections import OrderedDict
@@ -63,8 +63,6 @@ if is64Bit and v_year >= 2026 and hasattr(os, 'add_dll_directory'):
         _dllDirHandle = os.add_dll_directory(archLibPath)
     except Exception:
         pass
-import sqlite3
-
 # Local addon modules
 from .dialogs import (
     HelpDialog,
@@ -79,10 +77,24 @@ from .dialogs import (
     ChannelCollectionDialog,
     ManageSubscriptionsDialog,
     ProfileManagementDialog,
-    DownloadProgressDialog
+    DownloadProgressDialog,
+    DiagnosticsDialog
 )
 from . import utils 
+from .cookie_cache import BrowserCookieCache
+from .feeds import ChannelFeedPoller, uploads_playlist_url
+from .scheduler import PollScheduler
+from .database import Database, SIDE_FILE_SUFFIXES
+from .schema import SUBSCRIPTION_MIGRATIONS
+from .category_index import CategoryMembershipIndex
+from .metadata_cache import VideoMetadataCache, METADATA_CACHE_FILENAME
 from .errors import NetworkRetryError, HandledError
+from .metrics import metrics, DIAGNOSTICS_FILENAME
+from .callbacks import CallbackBus
+from .extraction import ExtractionService
+from .responsiveness import ui_probe
+from .connectivity import connectivity
+from .tasks import TaskExecutor, STATE_RUNNING, PRIORITY_BACKGROUND, CATEGORY_NETWORK, CATEGORY_UI, CATEGORY_DISK, CATEGORY_DOWNLOAD, CATEGORY_DB, CATEGORY_FEED, FEED_UPDATE_TASK
 import globalVars
 import addonHandler
 addonHandler.initTranslation()
@@ -95,9 +107,11 @@ def finally_(func, final):
     return new
 
 class _SilentLogger:
-    def debug(self, msg): pass
-    def info(self, msg): pass
-    def warning(self, msg): pass
+    # yt-dlp reports every page and entry it extracts through the logger, which makes it
+    # the place to stop an extraction whose worker has been cancelled.
+    def debug(self, msg): utils.check_cancelled()
+    def info(self, msg): utils.check_cancelled()
+    def warning(self, msg): utils.check_cancelled()
     def error(self, msg):
         ignored = [
             "does not have a",
@@ -110,6 +124,137 @@ class _SilentLogger:
             return
         log.error("yt-dlp: %s", msg)
 
+_silent_logger = _SilentLogger()
+
+class _PagedFetchLogger(_SilentLogger):
+    # Fetching all comments or a live chat replay can take longer than the operation timeout,
+    # so every page yt-dlp reports restarts the task's deadline, which then bounds a stall.
+    def debug(self, msg):
+        super().debug(msg)
+        utils.extend_current_deadline()
+    def info(self, msg):
+        super().info(msg)
+        utils.extend_current_deadline()
+
+_paged_fetch_logger = _PagedFetchLogger()
+
+# Shared request budget for youtube.com during feed refreshes, across all refresh workers.
+YOUTUBE_REQUESTS_PER_SECOND = 4
+YOUTUBE_REQUEST_BURST = 8
+# Uploads playlist entries this short are treated as shorts when nothing else identifies them.
+SHORTS_MAX_DURATION_SECONDS = 60
+# Entries the streams tab lists above past broadcasts; a known one is skipped rather than stopped at.
+PENDING_LIVE_STATUSES = ('is_upcoming', 'is_live')
+# Progress reports beyond these rates are coalesced so they don't flood NVDA's GUI thread.
+DOWNLOAD_PROGRESS_UPDATES_PER_SECOND = 4
+FEED_PROGRESS_UPDATES_PER_SECOND = 10
+# Wall-clock budget of a whole subscription feed update; each channel is limited by the operation timeout.
+FEED_UPDATE_DEADLINE_MINUTES = 60
+# Known IDs a channel tab fetch may stop at: the channel's most recently stored videos, which
+# is where a fetch of its newest uploads meets them. Older IDs would only bloat each request.
+STOP_AT_IDS_PER_CHANNEL = 200
+SUBSCRIPTION_DB_FILENAME = "subscription.db"
+
+class YoutubeDLPool:
+    """
+    Hands out warm yt_dlp.YoutubeDL instances keyed by their effective option set.
+    An instance is leased to one thread at a time and returned to the pool afterwards,
+    so extractor setup, cookie loading and open HTTP connections are reused between calls.
+    """
+
+    def __init__(self, max_idle_per_key=2, max_keys=12):
+        self._lock = threading.Lock()
+        self._idle = OrderedDict()
+        self._max_idle_per_key = max_idle_per_key
+        self._max_keys = max_keys
+
+    @classmethod
+    def make_key(cls, value):
+        """Builds a hashable key from an options dict (nested dicts, lists and callables included)."""
+        if isinstance(value, dict):
+            return tuple(sorted((str(k), cls.make_key(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return tuple(cls.make_key(v) for v in value)
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        if hasattr(value, '__self__') and hasattr(value, '__func__'):
+            # Bound methods are recreated on every attribute access, so key them by owner and function.
+            return ('method', id(value.__self__), value.__func__.__qualname__)
+        return ('object', id(value))
+
+    def _checkout(self, key):
+        with self._lock:
+            instances = self._idle.get(key)
+            if not instances:
+                return None
+            self._idle.move_to_end(key)
+            return instances.pop()
+
+    def _checkin(self, key, ydl):
+        evicted = []
+        with self._lock:
+            instances = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if len(instances) < self._max_idle_per_key:
+                instances.append(ydl)
+            else:
+                evicted.append(ydl)
+            while len(self._idle) > self._max_keys:
+                __, old_instances = self._idle.popitem(last=False)
+                evicted.extend(old_instances)
+        for old in evicted:
+            self._close(old)
+
+    @staticmethod
+    def _close(ydl):
+        try:
+            ydl.close()
+        except Exception:
+            log.debug("Failed to close pooled YoutubeDL instance.", exc_info=True)
+
+    @contextmanager
+    def lease(self, opts, cookiejar=None, operation=None):
+        """
+        Context manager yielding a YoutubeDL for opts; the instance goes back to the pool on exit.
+        If cookiejar is given, the instance uses that shared jar instead of loading its own.
+        The lease is timed as a yt-dlp extraction of the given operation.
+        """
+        key = (self.make_key(opts), id(cookiejar) if cookiejar is not None else None)
+        ydl = self._checkout(key)
+        metrics.increment("cache.hit" if ydl is not None else "cache.miss", label="youtube_dl_pool")
+        if ydl is None:
+            log.debug("YoutubeDL pool miss, creating a new instance.")
+            ydl = yt_dlp.YoutubeDL(opts)
+            if cookiejar is not None:
+                # YoutubeDL.cookiejar is a cached property, so setting it before the first request
+                # makes the instance (and its HTTP handlers) use the shared jar.
+                ydl.cookiejar = cookiejar
+        reusable = True
+        started = time.perf_counter()
+        try:
+            yield ydl
+        except yt_dlp.utils.YoutubeDLError as e:
+            utils.report_network_failure(e)
+            raise
+        except BaseException:
+            # Unknown failures may leave the instance in a bad state, so don't hand it out again.
+            reusable = False
+            raise
+        finally:
+            metrics.observe("ytdlp.extract", time.perf_counter() - started, label=operation or "other")
+            if reusable:
+                self._checkin(key, ydl)
+            else:
+                self._close(ydl)
+
+    def clear(self):
+        """Closes every idle instance, e.g. after settings that affect yt-dlp options changed."""
+        with self._lock:
+            instances = [ydl for group in self._idle.values() for ydl in group]
+            self._idle.clear()
+        for ydl in instances:
+            self._close(ydl)
+
 # The getCurrentURL functions are taken from BrowserNav's via Tony Malykh
 
 globalUpdateUrlCounter = 0
@@ -193,7 +338,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         log.info("YoutubePlus addon initializing.")
         GlobalPlugin.instance = self
         global originalSetFocusObject, originalVirtualBufferHandleUpdate
-        self._callbacks = {}
+        self._callback_bus = CallbackBus()
+        self._callback_bus.coalesce("download_progress", DOWNLOAD_PROGRESS_UPDATES_PER_SECOND)
         self.chat = None
         self.active = False
         self.messages = []
@@ -203,7 +349,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         self.toggling = False
         self.last_message_index = -1
         self.fav_dialog_instance = None
-        self.is_long_task_running = False
         self._download_cancelled = False
         self._messages_lock = threading.Lock()
         self._fav_file_lock = threading.Lock()
@@ -213,15 +358,36 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         self._pause_indicator_event = threading.Event()
         self.choice_made_event = threading.Event()
         self.user_choice = None
+        self._ydl_pool = YoutubeDLPool()
+        self._cookie_cache = BrowserCookieCache()
+        self._single_flight = utils.SingleFlight()
+        self._feed_poller = ChannelFeedPoller()
+        self._feed_unmatched_ids = set()
+        self._update_token = utils.CancellationToken()
+        self._youtube_rate_limiter = utils.TokenBucket(rate=YOUTUBE_REQUESTS_PER_SECOND, capacity=YOUTUBE_REQUEST_BURST)
+        self.subscription_db = Database(lambda: self.get_profile_path(SUBSCRIPTION_DB_FILENAME), name="subscriptions", migrations=SUBSCRIPTION_MIGRATIONS)
+        self.category_index = CategoryMembershipIndex(self.subscription_db)
+        self._metadata_cache = VideoMetadataCache(lambda: self.get_profile_path(METADATA_CACHE_FILENAME))
+        self._extraction_service = ExtractionService(lambda: config.conf["YoutubePlus"].get("extractionPython", ""))
+        self._feed_update_missed = False
+        self.tasks = TaskExecutor(deadline_func=self._task_deadline, on_abandoned=self._on_task_abandoned, admission_func=self._admit_task)
 
         self.update_timer = wx.Timer(gui.mainFrame)
         gui.mainFrame.Bind(wx.EVT_TIMER, self.on_auto_update_tick, self.update_timer)
         self.register_callback("settings_saved", self.manage_auto_update_timer)
+        self.register_callback("settings_saved", self._ydl_pool.clear)
+        self.register_callback("settings_saved", self._cookie_cache.invalidate)
+        self.register_callback("settings_saved", self._extraction_service.shutdown)
         self._init_sub_database()
-        def _delayed_startup_update():
-            time.sleep(15)
-            self._update_subscription_feed_worker(silent=True)
-        threading.Thread(target=_delayed_startup_update, daemon=True).start()
+        connectivity.start(
+            on_change=self._on_connectivity_changed,
+            enabled_func=lambda: config.conf["YoutubePlus"].get("offlineDetection", True),
+        )
+        ui_probe.start(
+            busy_func=lambda: self.active or self.tasks.has_running_tasks(include_queued=True),
+            running_tasks_func=lambda: [task['name'] for task in self.tasks.list_tasks() if task['state'] == STATE_RUNNING],
+        )
+        wx.CallLater(15000, self._start_background_feed_update)
         #threading.Thread(target=self._update_subscription_feed_worker, kwargs={'silent': True}, daemon=True).start()
         self.manage_auto_update_timer()
         originalSetFocusObject = api.setFocusObject
@@ -239,91 +405,32 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         return base_path
 
     def _init_sub_database(self):
-        """
-        Initializes the subscription database and creates/updates tables
-        to support the new comprehensive category system.
-        """
+        """Creates the subscription database or brings its schema up to date."""
         try:
-            db_path = self.get_profile_path("subscription.db")
-            con = sqlite3.connect(db_path)
-            cur = con.cursor()
-            
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS subscribed_channels (
-                    channel_url TEXT PRIMARY KEY,
-                    channel_name TEXT NOT NULL,
-                    content_types TEXT NOT NULL DEFAULT 'videos,shorts,streams'
-                )
-            ''')
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS videos (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT, video_id TEXT UNIQUE NOT NULL,
-                    channel_url TEXT NOT NULL, channel_name TEXT NOT NULL,
-                    title TEXT, duration_str TEXT, upload_date TEXT
-                )
-            ''')
-            cur.execute("PRAGMA table_info(videos)")
-            columns = [col[1] for col in cur.fetchall()]
-            if 'content_type' not in columns:
-                cur.execute("ALTER TABLE videos ADD COLUMN content_type TEXT NOT NULL DEFAULT 'videos'")
-
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS seen_videos (video_id TEXT PRIMARY KEY)
-            ''')
-
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS categories (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT UNIQUE NOT NULL,
-                    position INTEGER NOT NULL
-                )
-            ''')
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS channel_category_links (
-                    channel_url TEXT NOT NULL,
-                    category_id INTEGER NOT NULL,
-                    PRIMARY KEY (channel_url, category_id),
-                    FOREIGN KEY (channel_url) REFERENCES subscribed_channels (channel_url) ON DELETE CASCADE,
-                    FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE CASCADE
-                )
-            ''')
-
-            cur.execute("SELECT COUNT(*) FROM categories")
-            if cur.fetchone()[0] == 0:
-                log.debug("No categories found. Creating initial 'General' category.")
-                cur.execute("INSERT INTO categories (name, position) VALUES (?, ?)", ('General', 0))
-
-            con.commit()
-            con.close()
+            self.subscription_db.migrate()
         except Exception:
             log.exception("Failed to initialize subscription database.")
             
     def register_callback(self, topic, callback_func):
-        if topic not in self._callbacks:
-            self._callbacks[topic] = []
-        if callback_func not in self._callbacks[topic]:
-            self._callbacks[topic].append(callback_func)
-        log.debug(f"Callback registered for topic '{topic}': {callback_func.__name__}")
+        self._callback_bus.register(topic, callback_func)
 
     def unregister_callback(self, topic, callback_func):
-        if topic in self._callbacks and callback_func in self._callbacks[topic]:
-            self._callbacks[topic].remove(callback_func)
-            log.debug(f"Callback unregistered for topic '{topic}': {callback_func.__name__}")
+        self._callback_bus.unregister(topic, callback_func)
+
+    def callback_subscriber_counts(self):
+        return self._callback_bus.subscriber_counts()
 
     def _notify_callbacks(self, topic, data=None):
-        if topic in self._callbacks:
-            log.debug(f"Notifying callbacks for topic: {topic}")
-            for func in self._callbacks[topic]:
-                if data is not None:
-                    wx.CallAfter(func, data)
-                else:
-                    wx.CallAfter(func)
-                    
+        """Queues topic for its callbacks, which run on the GUI thread. Safe to call from any thread."""
+        self._callback_bus.notify(topic, data)
+
     def manage_auto_update_timer(self):
         interval_minutes = config.conf["YoutubePlus"].get("autoUpdateIntervalMinutes", 0)
         if self.update_timer.IsRunning():
             self.update_timer.Stop()
-        if interval_minutes > 0:
+        if interval_minutes > 0 and connectivity.is_offline:
+            log.info("Auto-update timer stays paused until YouTube is reachable again.")
+        elif interval_minutes > 0:
             interval_ms = interval_minutes * 60 * 1000
             log.info(f"Starting/restarting auto-update timer with interval: {interval_minutes} minutes.")
             self.update_timer.Start(interval_ms)
@@ -332,11 +439,101 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             
     def on_auto_update_tick(self, event):
         log.debug("Auto-update timer ticked.")
-        if self.is_long_task_running:
-            log.debug("Skipping auto-update because another long task is running.")
+        self._start_background_feed_update()
+
+    def _start_background_feed_update(self):
+        if connectivity.is_offline:
+            log.debug("Postponing auto-update until YouTube is reachable again.")
+            self._feed_update_missed = True
+            return
+        if self.is_feed_update_running:
+            log.debug("Skipping auto-update because a feed update is already queued or running.")
             return
         log.info("Starting scheduled background feed update.")
-        threading.Thread(target=self._update_subscription_feed_worker, kwargs={'silent': True}, daemon=True).start()
+        self.tasks.submit(self._scheduled_feed_update, priority=PRIORITY_BACKGROUND, category=CATEGORY_FEED, key=FEED_UPDATE_TASK)
+
+    @property
+    def is_long_task_running(self):
+        """True while any worker submitted to the task executor is running."""
+        return self.tasks.has_running_tasks()
+
+    @property
+    def is_feed_update_running(self):
+        return self.tasks.is_active(FEED_UPDATE_TASK)
+
+    def _task_deadline(self, task):
+        """Returns the wall-clock budget of a task in seconds, or None for tasks without one."""
+        if task.key == FEED_UPDATE_TASK:
+            return FEED_UPDATE_DEADLINE_MINUTES * 60
+        if task.category == CATEGORY_NETWORK:
+            return config.conf["YoutubePlus"].get("operationTimeoutMinutes", 10) * 60
+        if task.category == CATEGORY_DOWNLOAD:
+            # Downloads may take hours, so their budget restarts with every progress report.
+            return config.conf["YoutubePlus"].get("downloadStallMinutes", 5) * 60
+        # Tasks that wait for the user or only touch local files have no deadline.
+        return None
+
+    def _admit_task(self, task):
+        """Refuses network-bound tasks in offline mode, telling the user at once instead of after retries."""
+        if not connectivity.is_offline:
+            return True
+        if task.category not in (CATEGORY_NETWORK, CATEGORY_DOWNLOAD) and task.key != FEED_UPDATE_TASK:
+            return True
+        metrics.increment("connectivity.refused_tasks", label=task.name)
+        if not self.tasks.has_running_tasks():
+            self._stop_indicator()
+        # Translators: Error message when a command needs YouTube but the computer is offline.
+        self._notify_error(_("YouTube cannot be reached. Check your internet connection and try again."), log_message=f"Refused task {task.name} for {task.subject} in offline mode.")
+        return False
+
+    def _on_connectivity_changed(self, online):
+        """Called by the connectivity monitor when YouTube becomes reachable or unreachable."""
+        wx.CallAfter(self._apply_connectivity, online)
+        self._notify_callbacks("connectivity_changed", {'online': online})
+
+    def _apply_connectivity(self, online):
+        """Pauses the auto-update timer while offline; resumes it, catching up a missed update, once online."""
+        if not online:
+            if self.update_timer.IsRunning():
+                self.update_timer.Stop()
+                log.info("Auto-update timer paused while YouTube is unreachable.")
+            return
+        self.manage_auto_update_timer()
+        if self._feed_update_missed:
+            self._feed_update_missed = False
+            self._start_background_feed_update()
+
+    def _on_task_abandoned(self, task):
+        """Releases what a hung task held, so the indicator and dialogs don't wait for it forever."""
+        if not self.tasks.has_running_tasks():
+            self._stop_indicator()
+        if task.category == CATEGORY_DOWNLOAD:
+            self._download_cancelled = False
+            self._notify_callbacks("download_progress", {'status': 'error'})
+        # Translators: Error message when an operation stopped responding and was given up.
+        self._notify_error(_("An operation stopped responding and was cancelled."), log_message=f"Task {task.name} for {task.subject} was abandoned.")
+
+    def _scheduled_feed_update(self):
+        """
+        Runs a silent background feed update. With adaptive polling, only the channels
+        that are due according to their upload cadence are checked.
+        """
+        channel_urls = None
+        if config.conf["YoutubePlus"].get("adaptivePolling", True):
+            interval_minutes = config.conf["YoutubePlus"].get("autoUpdateIntervalMinutes", 0)
+            scheduler = PollScheduler(min_seconds=max(interval_minutes, 15) * 60)
+            try:
+                with self.subscription_db.connection() as con, metrics.timer("db.query", label="poll_scheduler.due_channels"):
+                    channel_urls = scheduler.due_channels(con)
+            except Exception:
+                log.exception("Could not compute due channels, checking all channels instead.")
+                channel_urls = None
+            if channel_urls is not None and not channel_urls:
+                log.debug("No channels are due for a background check.")
+                return
+            if channel_urls is not None:
+                log.info(f"Adaptive polling: {len(channel_urls)} channels are due.")
+        self._update_subscription_feed_worker(silent=True, channel_urls=channel_urls)
         
     def is_youtube_url(self, text):
         """Checks if a given string contains a YouTube domain."""
@@ -350,6 +547,13 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         virtualBuffers.VirtualBuffer._handleUpdate = originalVirtualBufferHandleUpdate
         self.stopChatMonitoring(silent=True)
         self._stop_indicator()
+        self.tasks.shutdown()
+        ui_probe.stop()
+        connectivity.stop()
+        self._ydl_pool.clear()
+        self._extraction_service.shutdown()
+        self.subscription_db.close()
+        self._metadata_cache.close()
         if MessagesDialog._instance:
             wx.CallAfter(MessagesDialog._instance.Close)
         super().terminate()
@@ -439,7 +643,24 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             video_id = match.group(1)
             return f"https://www.youtube.com/watch?v={video_id}"
         return url
+
+    def _normalize_url_key(self, url):
+        """Normalizes a YouTube URL so equivalent spellings map to the same in-flight key."""
+        if not isinstance(url, str):
+            return url
+        url = url.strip().rstrip('/')
+        return re.sub(r'^(?:https?://)?(?:www\.|m\.)?youtube\.com', 'https://www.youtube.com', url, flags=re.IGNORECASE)
+
+    def _extract_video_id(self, url_or_id):
+        """Returns the 11-character video ID of a single-video URL or bare ID, or None."""
+        if not isinstance(url_or_id, str):
+            return None
+        if re.fullmatch(r'[0-9A-Za-z_-]{11}', url_or_id):
+            return url_or_id
+        match = re.search(r'(?:[?&]v=|youtu\.be/|shorts/|live/|embed/)([0-9A-Za-z_-]{11})', url_or_id)
+        return match.group(1) if match else None
     
+    @utils.cancellable
     def get_data_for_url(self, url):
         """
         The main worker entry point for getting any video data.
@@ -451,12 +672,11 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             return
         self._start_indicator()
         try:
-            self.is_long_task_running = True
             info = self.get_video_info(url)
             if info.get('is_live'):
-                threading.Thread(target=self._start_monitoring_worker, args=(url, info), daemon=True).start()
+                self.tasks.submit(self._start_monitoring_worker, args=(url, info))
             else:
-                wx.CallAfter(self._process_video_type, url, info)
+                wx.CallAfter(self._process_video_type, url, info, utils.submitted_cancel_token())
         except (DownloadError, NetworkRetryError) as e:
             self._stop_indicator()
             # Translators: Error message shown to the user when the add-on fails to retrieve video information.
@@ -465,8 +685,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             self._stop_indicator()
             # Translators: General error message shown to the user when an unknown or unhandled problem occurs.
             self._notify_error(_("An unexpected error occurred."), log_message=f"An unexpected error occurred in get_data_for_url: {e}")
-        finally:
-            self.is_long_task_running = False
             
     def _validate_video_url_and_notify(self, url):
         """
@@ -490,84 +708,86 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
              return None
         return self._clean_youtube_url(url)
 
-    def _get_ydl_instance(self, extra_opts=None):
+    def _build_ydl_options(self, extra_opts=None):
         """
-        Creates and configures a yt_dlp.YoutubeDL instance.
+        Returns the yt-dlp options and the shared browser cookie jar (or None) for a call.
         This method is now the single source of truth for cookie management.
         """
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
-                'logger': _SilentLogger(),
+            'logger': _silent_logger,
+            'socket_timeout': config.conf["YoutubePlus"].get("socketTimeoutSeconds", 20),
             'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36',
         }
         cookie_mode = config.conf["YoutubePlus"].get("cookieMode", "none")
-        browser_to_use = None
-        temp_cookie_file = None
+        cookie_jar = None
         if cookie_mode != 'none':
-            browser_to_use = cookie_mode.lower() 
-            log.debug(f"Cookie mode set to: {browser_to_use}")
+            browser_to_use = cookie_mode.lower()
+            ttl_seconds = config.conf["YoutubePlus"].get("cookieCacheMinutes", 30) * 60
+            cookie_jar = self._cookie_cache.get_jar(browser_to_use, ttl_seconds)
+            if cookie_jar is None:
+                log.debug(f"No cookies available from {browser_to_use} - proceeding without cookies")
         else:
             log.debug("Cookie mode is 'none' - proceeding without cookies")
-        if browser_to_use:
-            try:
-                log.debug(f"Attempting to use cookies from browser: {browser_to_use}")
-                ydl_opts['cookies_from_browser'] = (browser_to_use,) 
-            except Exception as e:
-                log.warning(f"Could not set cookies_from_browser for {browser_to_use}: {e}")
-                try:
-                    from yt_dlp.cookies import extract_cookies_from_browser
-                    from yt_dlp.utils import YoutubeDLError
-                    import tempfile
-                    log.debug(f"Attempting manual cookie extraction from {browser_to_use}")
-                    jar = extract_cookies_from_browser(browser_to_use)
-                    if jar and len(jar) > 0:
-                        tmp = tempfile.NamedTemporaryFile(
-                            prefix='yt_cookies_',
-                            delete=False,
-                            suffix='.txt',
-                            mode='w'
-                        )
-                        temp_cookie_file = tmp.name
-                        jar.filename = temp_cookie_file
-                        jar.save(temp_cookie_file, ignore_discard=True, ignore_expires=True)
-                        tmp.close()
-                        ydl_opts['cookiefile'] = temp_cookie_file
-                        log.debug(f"Successfully wrote browser cookies to temporary file: {temp_cookie_file}")
-                    else:
-                        log.warning(f"No cookies found in {browser_to_use}")
-                except (YoutubeDLError, FileNotFoundError, PermissionError) as extract_error:
-                    log.error(f"Cookie extraction workaround failed for {browser_to_use}: {extract_error}")
-                except Exception as unexpected_error:
-                    log.exception(f"Unexpected error during cookie extraction: {unexpected_error}")
         if extra_opts:
             ydl_opts.update(extra_opts)
-        ydl = yt_dlp.YoutubeDL(ydl_opts)
-        if temp_cookie_file:
-            original_close = ydl.__exit__
-            def cleanup_close(*args, **kwargs):
-                try:
-                    result = original_close(*args, **kwargs)
-                    if temp_cookie_file and os.path.exists(temp_cookie_file):
-                        os.remove(temp_cookie_file)
-                        log.debug(f"Cleaned up temporary cookie file: {temp_cookie_file}")
-                    return result
-                except Exception as e:
-                    log.warning(f"Failed to cleanup temp cookie file: {e}")
-            ydl.__exit__ = cleanup_close
-        return ydl
+        return ydl_opts, cookie_jar
+
+    def _get_ydl_instance(self, extra_opts=None, operation=None):
+        """
+        Leases a configured yt_dlp.YoutubeDL instance from the session pool.
+        Use it as a context manager; the instance is returned to the pool on exit.
+        operation names the kind of extraction for the diagnostics timings.
+        """
+        utils.raise_if_offline()
+        ydl_opts, cookie_jar = self._build_ydl_options(extra_opts)
+        return self._ydl_pool.lease(ydl_opts, cookiejar=cookie_jar, operation=operation)
+
+    def _extract_out_of_process(self, operation, url, extra_opts=None, **params):
+        """
+        Runs an extraction in the extraction worker process when that is enabled.
+        Returns None when it is disabled or no worker can serve the request; the caller
+        then extracts in-process.
+        """
+        if not config.conf["YoutubePlus"].get("extractionWorker", False):
+            return None
+        ydl_opts, cookie_jar = self._build_ydl_options(extra_opts)
+        return self._extraction_service.extract(operation, url, ydl_opts, cookiejar=cookie_jar, **params)
 
-    @utils.retry_on_network_error(retries=3, delay=5)
-    def get_video_info(self, url_or_id, extra_opts=None, fetch_channel_details=False):
+    def get_video_info(self, url_or_id, extra_opts=None, fetch_channel_details=False, stable_only=False):
         """
         Fetches information using yt-dlp.
+        Single videos are served from the metadata cache while fresh. Pass stable_only
+        when views, likes and live status are not needed, so an entry whose volatile
+        fields have expired can still be reused.
+        """
+        video_id = None
+        if not extra_opts and not fetch_channel_details:
+            video_id = self._extract_video_id(url_or_id)
+        if video_id:
+            cached_info = self._metadata_cache.get(video_id, stable_only=stable_only)
+            if cached_info:
+                return cached_info
+        def _fetch():
+            info = self._extract_video_info(url_or_id, extra_opts, fetch_channel_details)
+            if video_id:
+                self._metadata_cache.put(info)
+            return info
+        flight_key = ('video_info', video_id or self._normalize_url_key(url_or_id), YoutubeDLPool.make_key(extra_opts or {}), fetch_channel_details)
+        # Callers may add keys to the dict, so each one gets its own copy of a shared result.
+        return dict(self._single_flight.do(flight_key, _fetch))
+
+    @utils.retry_with_backoff(retries=3, breaker=utils.youtube_circuit_breaker)
+    def _extract_video_info(self, url_or_id, extra_opts=None, fetch_channel_details=False):
+        """
+        Runs the actual yt-dlp extraction for get_video_info.
         Now with corrected logic to prevent infinite playlist fetching.
         """
         log.debug("Attempting to get info for: %s", url_or_id)
         channel_regex = re.compile(r"/channel/|/c/|/@")
         is_channel = isinstance(url_or_id, str) and bool(channel_regex.search(url_or_id))
-        if extra_opts is None:
-            extra_opts = {}
+        extra_opts = dict(extra_opts) if extra_opts else {}
         if is_channel:
             if fetch_channel_details:
                 extra_opts['playlistend'] = 1
@@ -576,8 +796,10 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         else:
             extra_opts['noplaylist'] = True
         try:
-            with self._get_ydl_instance(extra_opts=extra_opts) as ydl:
-                info = ydl.extract_info(url_or_id, download=False)
+            info = self._extract_out_of_process('video_info', url_or_id, extra_opts)
+            if info is None:
+                with self._get_ydl_instance(extra_opts=extra_opts, operation='video_info') as ydl:
+                    info = ydl.extract_info(url_or_id, download=False)
             return info
         except DownloadError as e:
             error_str = str(e)
@@ -590,13 +812,69 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         except Exception:
             raise
             
-    @utils.retry_on_network_error(retries=3, delay=5)
-    def get_channel_videos(self, channel_url, detailed_fetch=False, channel_name_override=None):
+    def get_channel_videos(self, channel_url, detailed_fetch=False, channel_name_override=None, stop_at_ids=None, classify=False, fetch_limit=None):
         """
         Fetches videos from a channel URL.
         Can receive a channel_name_override to ensure consistency.
+        With stop_at_ids, the tab is paged lazily and only the videos newer than the
+        first already known past video are returned (incremental mode, flat fetch only).
+        With classify, each video gets a content_type guessed from its metadata, for
+        lists that mix videos, shorts and streams such as the uploads playlist.
+        fetch_limit overrides the playlist_fetch_count setting.
+        Concurrent calls for the same channel tab share one extraction.
         """
-        fetch_count = config.conf["YoutubePlus"].get("playlist_fetch_count", 20)
+        fetch_count = fetch_limit or config.conf["YoutubePlus"].get("playlist_fetch_count", 20)
+        flight_key = (
+            'channel_videos', self._normalize_url_key(channel_url), detailed_fetch, channel_name_override,
+            id(stop_at_ids) if stop_at_ids is not None else None, classify, fetch_count,
+            config.conf["YoutubePlus"].get("sortOrder", "newest"),
+        )
+        video_list = self._single_flight.do(
+            flight_key, self._fetch_channel_videos, channel_url, detailed_fetch, channel_name_override,
+            stop_at_ids, classify, fetch_count
+        )
+        return [dict(video) for video in video_list]
+
+    def _classify_upload(self, entry):
+        """Guesses whether an uploads playlist entry belongs to the videos, shorts or streams tab."""
+        if entry.get('was_live') or entry.get('live_status') in ('is_live', 'is_upcoming', 'was_live', 'post_live'):
+            return 'streams'
+        entry_url = entry.get('url') or entry.get('webpage_url') or ''
+        if '/shorts/' in entry_url:
+            return 'shorts'
+        duration = entry.get('duration')
+        if duration and duration <= SHORTS_MAX_DURATION_SECONDS:
+            return 'shorts'
+        return 'videos'
+
+    def _extract_until_known(self, ydl, channel_url, stop_at_ids, limit):
+        """
+        Iterates a channel tab lazily, so later pages are only requested when needed,
+        and stops at the first past entry whose ID is in stop_at_ids. Known upcoming and
+        live streams are skipped, as the streams tab lists them above finished ones.
+        Returns None when the URL resolves to a redirect that needs full processing.
+        """
+        info = ydl.extract_info(channel_url, download=False, process=False)
+        if not info or info.get('_type') in ('url', 'url_transparent') or 'entries' not in info:
+            return None
+        entries = []
+        for entry in info['entries']:
+            if len(entries) >= limit:
+                break
+            if not entry:
+                continue
+            if entry.get('id') in stop_at_ids:
+                if entry.get('live_status') in PENDING_LIVE_STATUSES:
+                    continue
+                break
+            entries.append(entry)
+        log.debug("Incremental fetch of %s found %d new entries.", channel_url, len(entries))
+        info['entries'] = entries
+        return info
+
+    @utils.retry_with_backoff(retries=3, breaker=utils.youtube_circuit_breaker)
+    def _fetch_channel_videos(self, channel_url, detailed_fetch=False, channel_name_override=None, stop_at_ids=None, classify=False, fetch_count=20):
+        """Runs the actual yt-dlp extraction for get_channel_videos."""
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
@@ -607,11 +885,20 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         }
         if not detailed_fetch:
             ydl_opts['extract_flat'] = 'in_playlist'
+        incremental = stop_at_ids is not None and not detailed_fetch
         try:
-            with open(os.devnull, 'w') as devnull:
-                with redirect_stderr(devnull):
-                    with self._get_ydl_instance(extra_opts=ydl_opts) as ydl:
-                        playlist_info = ydl.extract_info(channel_url, download=False)
+            playlist_info = self._extract_out_of_process(
+                'channel_videos', channel_url, ydl_opts,
+                stop_at_ids=list(stop_at_ids) if incremental else None, limit=fetch_count
+            )
+            if playlist_info is None:
+                with open(os.devnull, 'w') as devnull:
+                    with redirect_stderr(devnull):
+                        with self._get_ydl_instance(extra_opts=ydl_opts, operation='channel_videos') as ydl:
+                            if incremental:
+                                playlist_info = self._extract_until_known(ydl, channel_url, stop_at_ids, fetch_count)
+                            if playlist_info is None:
+                                playlist_info = ydl.extract_info(channel_url, download=False)
         except (DownloadError, ExtractorError) as e:
             if "The channel is not currently live" in str(e) or "does not have a" in str(e):
                 return []
@@ -644,6 +931,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                     }
                     if detailed_fetch:
                         video_data['upload_date'] = entry.get('upload_date')
+                    if classify:
+                        video_data['content_type'] = self._classify_upload(entry)
                     video_list.append(video_data)
         if detailed_fetch:
             sort_order = config.conf["YoutubePlus"].get("sortOrder", "newest")
@@ -978,7 +1267,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         else: self.user_choice = 'cancel'
         event.set()
 
-    def _process_video_type(self, url, info):
+    def _process_video_type(self, url, info, cancel_token=None):
         """Determines if a VOD has replay or just comments and starts the fetch process."""
         log.debug("Processing VOD type for video: %s", info.get('title'))
         self.video_title = info.get('title', 'Unknown Title')
@@ -996,12 +1285,15 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         else:
             self.user_choice = 'comments'
             self.choice_made_event.set()
-        threading.Thread(target=self._start_fetch_worker_after_choice, args=(url, comment_count), daemon=True).start()
+        # A UI task has no deadline, so the time the user takes to choose is not counted against the fetch.
+        self.tasks.submit(self._start_fetch_worker_after_choice, args=(url, comment_count), kwargs={'cancel_token': cancel_token}, category=CATEGORY_UI)
 
+    @utils.cancellable
     def _start_fetch_worker_after_choice(self, url, comment_count=0):
         """Waits for the user's choice (replay vs comments) and starts the actual fetch worker."""
         log.debug("Waiting for user choice...")
-        self.choice_made_event.wait()
+        while not self.choice_made_event.wait(0.25):
+            utils.check_cancelled()
         data_to_fetch = self.user_choice
         if data_to_fetch == 'cancel' or data_to_fetch is None:
             self._stop_indicator()
@@ -1018,15 +1310,15 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Status message shown when the add-on starts loading the live chat replay.
             wx.CallAfter(ui.message, _("Loading live chat replay..."))
         self._resume_indicator()
-        threading.Thread(target=self._fetch_and_process_data_worker, args=(url, self.video_title, data_to_fetch, ), daemon=True).start()
+        self.tasks.submit(self._fetch_and_process_data_worker, args=(url, self.video_title, data_to_fetch, ), kwargs={'cancel_token': utils.submitted_cancel_token()})
         
+    @utils.cancellable
     def _get_info_worker(self, url):
         clean_url = self._validate_video_url_and_notify(url)
         if not clean_url:
             return
         self._start_indicator()
         try:
-            self.is_long_task_running = True
             info = self.get_video_info(url)
             if info.get('is_live'):
                 # Translators: Message shown when a user tries to get video info for a live stream, 
@@ -1067,22 +1359,24 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             log.warning("Could not get video info: %s", error_msg)
             # Translators: Error message shown when the add-on cannot retrieve video details. {error} is the reason.
             self._notify_error(_("Could not get video info: {error}").format(error=error_msg))
+        except NetworkRetryError as e:
+            # Translators: Error message shown when the add-on cannot retrieve video details. {error} is the reason.
+            self._notify_error(_("Could not get video info: {error}").format(error=e), log_message=f"Could not get video info: {e}")
         except Exception as e:
             log.exception("Unexpected error in 'Get Info' worker.")
             # Translators: General error message encouraging the user to check the log file for more technical information.
             self._notify_error(_("An unexpected error occurred. Please check the log for details."))
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
             
+    @utils.cancellable
     def _show_chapters_worker(self, url):
         clean_url = self._validate_video_url_and_notify(url)
         if not clean_url:
             return
         self._start_indicator()
         try:
-            self.is_long_task_running = True
-            info = self.get_video_info(url)
+            info = self.get_video_info(url, stable_only=True)
             chapters = info.get('chapters')
             if chapters and len(chapters) > 0:
                 title = info.get('title', 'Unknown Video')
@@ -1100,17 +1394,22 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: General error message encouraging the user to check the log file for more technical information.
             self._notify_error(_("An unexpected error occurred. Please check the log for details."))
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
 
+    def _paged_fetch_progress_hook(self, d):
+        """Progress hook for the live chat replay download; each fragment restarts the task's deadline."""
+        utils.check_cancelled()
+        utils.extend_current_deadline()
+
+    @utils.cancellable
     def _fetch_and_process_data_worker(self, url_or_id, video_title, data_to_fetch):
         try:
             display_list, dialog_title = None, None
             is_replay_data = False # Flag to pass to CommentsDialog
             if data_to_fetch == 'comments':
                 log.debug("Fetching comments via yt-dlp.")
-                opts = {'getcomments': True, 'extract_flat': True}
-                with self._get_ydl_instance(extra_opts=opts) as ydl:
+                opts = {'getcomments': True, 'extract_flat': True, 'logger': _paged_fetch_logger}
+                with self._get_ydl_instance(extra_opts=opts, operation='comments') as ydl:
                     info = ydl.extract_info(url_or_id, download=False)
                 raw_data = info.get('comments')
                 if not raw_data: raise ValueError("No comments found in video data.")
@@ -1119,8 +1418,11 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                 dialog_title = _("{count} comments of {title}").format(count=len(display_list), title=video_title)
             elif data_to_fetch == 'replay':
                 log.debug("Fetching live chat replay subtitles via yt-dlp.")
-                opts = {'skip_download': True, 'writesubtitles': True, 'subtitleslangs': ['live_chat']}
-                with self._get_ydl_instance(extra_opts=opts) as ydl:
+                opts = {
+                    'skip_download': True, 'writesubtitles': True, 'subtitleslangs': ['live_chat'],
+                    'logger': _paged_fetch_logger, 'progress_hooks': [self._paged_fetch_progress_hook],
+                }
+                with self._get_ydl_instance(extra_opts=opts, operation='live_chat_replay') as ydl:
                     res = ydl.extract_info(url_or_id, download=True)
                 requested_subs = res.get('requested_subtitles')
                 if not requested_subs or 'live_chat' not in requested_subs:
@@ -1265,7 +1567,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         result = dlg.ShowModal()
         dlg.Destroy()
         if result == wx.ID_YES:
-            threading.Thread(target=self._perform_export, daemon=True).start()
+            self.tasks.submit(self._perform_export, category=CATEGORY_DISK)
         else:
             return
                         
@@ -1315,14 +1617,14 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         except Exception as e:
             log.error(f"Failed to save search history: {e}")
 
+    @utils.cancellable
     def add_item_to_favorites_worker(self, url):
         """Worker to handle adding a favorite in the background with file lock and dialog refresh."""
         # Translators: Status message shown when a video is being added to the favorites list.
         ui.message(_("Adding to favorites..."))
         self._start_indicator()
-        self.is_long_task_running = True
         try:
-            info = self.get_video_info(url)
+            info = self.get_video_info(url, stable_only=True)
             if not info or info.get('_type', 'video') != 'video':
                 # Translators: Error message shown when the user provides a link that is not a direct video URL (e.g., a playlist or channel link).
                 wx.CallAfter(ui.message, _("The provided link is not for a single video."))
@@ -1354,9 +1656,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown to the user when a video could not be added to the favorites list.
             self._notify_error(_("Failed to add favorite. Details: {}").format(e), log_message=f"Failed to add favorite for URL {url}: {e}")
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
 
+    @utils.cancellable
     def add_channel_to_favorites_worker(self, url):
         """
         Worker to handle adding a channel to favorites.
@@ -1365,7 +1667,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         # Translators: Status message shown when a channel is being added to the favorites list.
         ui.message(_("Adding to favorite channels..."))
         self._start_indicator()
-        self.is_long_task_running = True
         try:
             initial_info = self.get_video_info(url, extra_opts={'playlist_items': '1'})
             if isinstance(initial_info, dict) and initial_info.get('entries'):
@@ -1403,15 +1704,14 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown to the user when a channel could not be added to the favorites list.
             self._notify_error(_("Failed to add favorite."), log_message=f"Failed to add favorite for URL {url}: {e}")
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
             
+    @utils.cancellable
     def add_playlist_to_favorites_worker(self, url):
         """Worker to handle adding a playlist to favorites."""
         # Translators: Status message shown when the add-on starts the process of adding a playlist to favorites.
         ui.message(_("Adding playlist to favorites..."))
         self._start_indicator()
-        self.is_long_task_running = True
         try:
             list_match = re.search(r'[?&]list=([^&]+)', url)
             if not list_match or 'youtube.com' not in url.lower():
@@ -1420,7 +1720,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             clean_playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
             log.debug(f"Cleaned mixed URL to pure playlist URL: {clean_playlist_url}")
             ydl_opts = {'quiet': True, 'no_warnings': True, 'extract_flat': True}
-            with self._get_ydl_instance(extra_opts=ydl_opts) as ydl:
+            with self._get_ydl_instance(extra_opts=ydl_opts, operation='playlist') as ydl:
                 info = ydl.extract_info(clean_playlist_url, download=False)
             with self._fav_file_lock:
                 fav_playlist_path = self.get_profile_path("fav_playlist.json")
@@ -1450,9 +1750,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when the process of adding a playlist to favorites fails for any reason.
             self._notify_error(_("Failed to add favorite playlist."), log_message=f"Failed to add playlist for URL {url}: {e}")
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
             
+    @utils.cancellable
     def _update_playlist_count_worker(self, playlist_id, new_count):
         """
         Safely updates the video_count for a specific playlist and notifies the UI
@@ -1478,10 +1778,11 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                 except IOError:
                     log.error("Could not save updated playlist file.")
 
+    @utils.cancellable
     def add_to_watchlist_worker(self, url, mark_seen=False):
         self._start_indicator()
         try:
-            info = self.get_video_info(url)
+            info = self.get_video_info(url, stable_only=True)
             if not info:
                 return
             video_id = info.get('id')
@@ -1517,6 +1818,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         finally:
             self._stop_indicator()
     
+    @utils.cancellable
     def _view_channel_worker(self, url, dialog_title_template, content_type_label="videos", base_channel_url=None, base_channel_name=None, load_all=False, is_collection=False):
         """
         Generic worker to fetch a list of videos from any URL (channel or playlist)
@@ -1525,7 +1827,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         message = dialog_title_template.format(type=content_type_label)
         ui.message(message)
         self._start_indicator()
-        self.is_long_task_running = True
         try:
             is_playlist = 'list=' in url
             playlist_id_to_update = None
@@ -1541,7 +1842,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             with open(os.devnull, 'w') as devnull:
                 with redirect_stderr(devnull):
                     try:
-                        with self._get_ydl_instance(extra_opts=ydl_opts) as ydl:
+                        with self._get_ydl_instance(extra_opts=ydl_opts, operation='channel_videos') as ydl:
                             info = ydl.extract_info(url, download=False)
                     except (DownloadError, ExtractorError) as e:
                         if "does not have a" in str(e) or "The channel is not currently live" in str(e):
@@ -1619,23 +1920,21 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when the add-on fails to download the list of videos from YouTube.
             self._notify_error(_("Failed to fetch video list."), log_message=f"Failed to fetch video list for {url}: {e}")
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
     
+    @utils.cancellable
     def subscribe_to_channel_worker(self, url):
         """Worker to handle subscribing, now correctly handling playlist URLs and tagging content types."""
         # Translators: Status message shown when the add-on begins the process of subscribing to a YouTube channel.
         ui.message(_("Subscribing to channel..."))
         self._start_indicator()
-        self.is_long_task_running = True
         try:
-            db_path = self.get_profile_path("subscription.db")
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True,
                 'playlist_items': '1',
             }
-            with self._get_ydl_instance(extra_opts=ydl_opts) as ydl:
+            with self._get_ydl_instance(extra_opts=ydl_opts, operation='channel_info') as ydl:
                 info = ydl.extract_info(url, download=False)
             video_info = info['entries'][0] if info.get('_type') == 'playlist' and info.get('entries') else info
             if not video_info:
@@ -1643,13 +1942,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             channel_url = video_info.get('channel_url')
             if not channel_url:
                 raise ValueError("Channel URL could not be found from the provided link.")
-            con = sqlite3.connect(db_path)
-            cur = con.cursor()
-            cur.execute("SELECT channel_name FROM subscribed_channels WHERE channel_url = ?", (channel_url,))
-            existing = cur.fetchone()
+            with self.subscription_db.connection() as con:
+                existing = con.execute("SELECT channel_name FROM subscribed_channels WHERE channel_url = ?", (channel_url,)).fetchone()
             if existing:
-                con.close()
-                
                 def ask_unsubscribe():
                     if wx.MessageBox(
                     # Translators: A confirmation prompt shown when the user tries to subscribe to a channel they are already subscribed to. 
@@ -1664,7 +1959,20 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                 return
             default_content_types = config.conf["YoutubePlus"].get("contentTypesToFetch", ["videos", "shorts", "streams"])
             all_videos = []
-            for content_type in default_content_types:
+            tab_content_types = default_content_types
+            uploads_url = uploads_playlist_url(channel_url) if config.conf["YoutubePlus"].get("useUploadsPlaylist", False) else None
+            if uploads_url:
+                fetch_count = config.conf["YoutubePlus"].get("playlist_fetch_count", 20)
+                try:
+                    uploads = self.get_channel_videos(
+                        uploads_url, channel_name_override=video_info.get('uploader'),
+                        classify=True, fetch_limit=fetch_count * max(len(default_content_types), 1)
+                    )
+                    all_videos.extend(v for v in uploads if v['content_type'] in default_content_types)
+                    tab_content_types = []
+                except Exception as e:
+                    log.warning("Failed to get uploads playlist, falling back to channel tabs: %s", e)
+            for content_type in tab_content_types:
                 try:
                     full_url = f"{channel_url.rstrip('/')}/{content_type}"
                     tab_videos = self.get_channel_videos(full_url, channel_name_override=video_info.get('uploader'))
@@ -1679,15 +1987,15 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Fallback name used when the YouTube channel name cannot be identified.
             channel_name = video_info.get('uploader', _("Unknown Channel"))
             content_types_str = ",".join(default_content_types)
-            cur.execute("INSERT INTO subscribed_channels (channel_url, channel_name, content_types) VALUES (?, ?, ?)", (channel_url, channel_name, content_types_str))
-            if initial_videos:
-                videos_to_insert = [
-                    (v.get('id'), channel_url, channel_name, v.get('title'), v.get('duration_str'), v.get('upload_date'), v.get('content_type', 'videos'))
-                    for v in initial_videos
-                ]
-                cur.executemany("INSERT OR IGNORE INTO videos (video_id, channel_url, channel_name, title, duration_str, upload_date, content_type) VALUES (?, ?, ?, ?, ?, ?, ?)", videos_to_insert)
-            con.commit()
-            con.close()
+            with self.subscription_db.transaction() as con:
+                cur = con.cursor()
+                cur.execute("INSERT INTO subscribed_channels (channel_url, channel_name, content_types) VALUES (?, ?, ?)", (channel_url, channel_name, content_types_str))
+                if initial_videos:
+                    videos_to_insert = [
+                        (v.get('id'), channel_url, channel_name, v.get('title'), v.get('duration_str'), v.get('upload_date'), v.get('content_type', 'videos'))
+                        for v in initial_videos
+                    ]
+                    cur.executemany("INSERT OR IGNORE INTO videos (video_id, channel_url, channel_name, title, duration_str, upload_date, content_type) VALUES (?, ?, ?, ?, ?, ?, ?)", videos_to_insert)
             new_channel_data = (channel_url, channel_name)
             self._notify_callbacks("subscription_added", new_channel_data)
             # Translators: Success message shown after successfully subscribing to a YouTube channel. 
@@ -1697,21 +2005,24 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when the subscription process fails.
             self._notify_error(_("Failed to subscribe."), log_message=f"Failed to subscribe to URL {url}: {e}")
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
             
+    @utils.cancellable
     def unsubscribe_from_channel_worker(self, channel_url, channel_name):
         """Worker to handle unsubscribing from a channel."""
         try:
-            db_path = self.get_profile_path("subscription.db")
-            con = sqlite3.connect(db_path)
-            cur = con.cursor()
-            cur.execute("DELETE FROM subscribed_channels WHERE channel_url = ?", (channel_url,))
-            deleted_subs = cur.rowcount
+            with self.subscription_db.transaction() as con:
+                cur = con.cursor()
+                cur.execute("DELETE FROM subscribed_channels WHERE channel_url = ?", (channel_url,))
+                deleted_subs = cur.rowcount
+                if deleted_subs > 0:
+                    cur.execute("DELETE FROM seen_videos WHERE video_id IN (SELECT video_id FROM videos WHERE channel_url = ? AND seen = 1)", (channel_url,))
+                    cur.execute("DELETE FROM videos WHERE channel_url = ?", (channel_url,))
+                    cur.execute("DELETE FROM feed_validators WHERE channel_url = ?", (channel_url,))
+                    cur.execute("DELETE FROM channel_poll_state WHERE channel_url = ?", (channel_url,))
+                    cur.execute("DELETE FROM channel_category_links WHERE channel_url = ?", (channel_url,))
             if deleted_subs > 0:
-                cur.execute("DELETE FROM videos WHERE channel_url = ?", (channel_url,))
-                cur.execute("DELETE FROM seen_videos WHERE video_id NOT IN (SELECT DISTINCT video_id FROM videos WHERE video_id IS NOT NULL)")
-                con.commit()
+                self.category_index.invalidate()
                 self._notify_callbacks("subscription_removed", {"channel_url": channel_url})
                 # Translators: Success message shown after successfully unsubscribing from a YouTube channel.
                 # {channel} is the name of the channel.
@@ -1719,81 +2030,170 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             else:
                 # Translators: Error message shown when trying to unsubscribe from a channel that isn't in the database.
                 self._notify_error(_("Failed to unsubscribe - channel not found in database"))
-            con.close()
         except Exception as e:
             # Translators: Error message shown when an unexpected database or system error occurs during unsubscription.
             self._notify_error(_("Critical error during unsubscribe."), log_message=f"Critical error unsubscribing {channel_url}: {e}")
             
-    def _update_subscription_feed_worker(self, progress_topic=None, silent=False):
+    @utils.cancellable
+    def _update_subscription_feed_worker(self, progress_topic=None, silent=False, channel_urls=None):
         """
         Worker to check for new videos and report detailed progress back to the dialog,
         including the final summary message. Supports aborting mid-process.
+        channel_urls limits the update to those channels; all channels are checked by default.
         """
         self.backup_profile(auto=True)
-        self.is_long_task_running = True
-        self._update_aborted = False
+        self._update_token = update_token = utils.current_cancel_token() or utils.CancellationToken()
+        if progress_topic:
+            self._callback_bus.coalesce(progress_topic, FEED_PROGRESS_UPDATES_PER_SECOND)
         try:
-            db_path = self.get_profile_path("subscription.db")
             if not silent: self._start_indicator()
-            with sqlite3.connect(db_path) as con:
+            update_started = time.perf_counter()
+            with self.subscription_db.connection() as con, metrics.timer("db.query", label="feed_update.load"):
                 cur = con.cursor()
-                cur.execute("SELECT video_id FROM videos")
-                existing_video_ids = {row[0] for row in cur.fetchall()}
+                cur.execute("SELECT channel_url, video_id FROM videos ORDER BY id DESC")
+                existing_video_ids = set()
+                recent_ids_by_channel = {}
+                for video_channel_url, video_id in cur:
+                    existing_video_ids.add(video_id)
+                    recent_ids = recent_ids_by_channel.setdefault(video_channel_url, [])
+                    if len(recent_ids) < STOP_AT_IDS_PER_CHANNEL:
+                        recent_ids.append(video_id)
                 cur.execute("SELECT channel_url, channel_name, content_types FROM subscribed_channels")
                 subscribed_channels = cur.fetchall()
-                if not subscribed_channels:
+                if channel_urls is not None:
+                    wanted_urls = set(channel_urls)
+                    subscribed_channels = [c for c in subscribed_channels if c[0] in wanted_urls]
+                cur.execute("SELECT channel_url, etag, last_modified, content_hash FROM feed_validators")
+                feed_validators = {row[0]: row[1:] for row in cur.fetchall()}
+            if not subscribed_channels:
+                if progress_topic:
+                    # Translators: Progress message shown when no channels are available for update.
+                    self._notify_callbacks(progress_topic, {"current": 1, "total": 1, "message": _("No channels to update.")})
+                elif not silent:
+                    # Translators: Message shown when the user tries to update the feed but hasn't subscribed to any channels.
+                    wx.CallAfter(ui.message, _("No channels to update."))
+                self._notify_callbacks("subscriptions_updated")
+                return
+            total_tasks = sum(len(c[2].split(',')) for c in subscribed_channels if c[2])
+            current_task = 0
+            progress_lock = threading.Lock()
+
+            def report_task(channel_name, content_type):
+                nonlocal current_task
+                # Progress is posted under the lock so the dialog receives task numbers in order.
+                with progress_lock:
+                    current_task += 1
                     if progress_topic:
-                        # Translators: Progress message shown when no channels are available for update.
-                        wx.CallAfter(self._notify_callbacks, progress_topic, {"current": 1, "total": 1, "message": _("No channels to update.")})
-                    elif not silent:
-                        # Translators: Message shown when the user tries to update the feed but hasn't subscribed to any channels.
-                        wx.CallAfter(ui.message, _("No channels to update."))
-                    self._notify_callbacks("subscriptions_updated")
+                        # Translators: Progress message shown while checking a specific channel for new content. 
+                        # {channel} is the channel name, {type} is the type of content (videos, shorts, or streams).
+                        progress_message = _("Checking {channel} ({type})...").format(channel=channel_name, type=content_type)
+                        progress_data = {"current": current_task, "total": total_tasks, "message": progress_message}
+                        self._notify_callbacks(progress_topic, progress_data)
+
+            new_videos_to_cache = []
+            validators_to_save = []
+            poll_state_to_save = []
+            added_video_ids = set()
+            known_video_ids = frozenset(existing_video_ids)
+            use_feeds = config.conf["YoutubePlus"].get("useChannelFeeds", True)
+            use_uploads = config.conf["YoutubePlus"].get("useUploadsPlaylist", False)
+            max_workers = config.conf["YoutubePlus"].get("feedRefreshWorkers", 4)
+            # Each channel is refreshed by a background network task, within the executor's network
+            # limit; at most max_workers of this update's channels are queued or running at once.
+            finished = queue.Queue()
+            pending_channels = list(subscribed_channels)
+            in_flight = {}
+
+            def refresh_channel_task(channel_url, *args, cancel_token=None):
+                result, error = None, None
+                try:
+                    result = self._refresh_channel(channel_url, *args, cancel_token=cancel_token)
+                except Exception as e:
+                    error = e
+                finally:
+                    finished.put((channel_url, result, error))
+
+            def submit_next_channel():
+                channel_url, channel_name, content_types_str = pending_channels.pop(0)
+                content_types = content_types_str.split(',') if content_types_str else ["videos", "shorts", "streams"]
+                task = self.tasks.submit(
+                    refresh_channel_task,
+                    args=(
+                        channel_url, channel_name, content_types, known_video_ids,
+                        frozenset(recent_ids_by_channel.get(channel_url, ())),
+                        feed_validators.get(channel_url), use_feeds, use_uploads, report_task
+                    ),
+                    kwargs={'cancel_token': utils.CancellationToken(parent=update_token)},
+                    name="_refresh_channel", priority=PRIORITY_BACKGROUND, category=CATEGORY_NETWORK
+                )
+                if task is None:
+                    # Refused while offline or shutting down; the remaining channels would be refused too.
+                    log.warning("Could not update %s: the refresh task was not accepted.", channel_name)
+                    pending_channels.clear()
                     return
-                total_tasks = sum(len(c[2].split(',')) for c in subscribed_channels if c[2])
-                current_task = 0
-                new_videos_to_cache = []
-                for channel_url, channel_name, content_types_str in subscribed_channels:
-                    if self._update_aborted:
-                        break
-                    content_types = content_types_str.split(',') if content_types_str else ["videos", "shorts", "streams"]
-                    for content_type in content_types:
-                        if self._update_aborted:
-                            break
-                        current_task += 1
-                        if progress_topic:
-                            # Translators: Progress message shown while checking a specific channel for new content. 
-                            # {channel} is the channel name, {type} is the type of content (videos, shorts, or streams).
-                            progress_message = _("Checking {channel} ({type})...").format(channel=channel_name, type=content_type)
-                            progress_data = {"current": current_task, "total": total_tasks, "message": progress_message}
-                            wx.CallAfter(self._notify_callbacks, progress_topic, progress_data)
-                        try:
-                            latest_videos = self.get_channel_videos(f"{channel_url}/{content_type}")
-                            if latest_videos:
-                                for video in latest_videos:
-                                    video_id = video.get('id')
-                                    if video_id and video_id not in existing_video_ids:
-                                        new_videos_to_cache.append((
-                                            video_id, channel_url, channel_name,
-                                            video.get('title'), video.get('duration_str'),
-                                            video.get('upload_date'), content_type
-                                        ))
-                                        existing_video_ids.add(video_id)
-                        except Exception as e:
-                            log.warning("Could not update %s for %s: %s", content_type, channel_name, e)
-                    if self._update_aborted:
-                        break
-                if new_videos_to_cache:
-                    cur.executemany("""
-                        INSERT OR IGNORE INTO videos (video_id, channel_url, channel_name, title, duration_str, upload_date, content_type) 
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, new_videos_to_cache)
-                    con.commit()
-            con.close()  
-            if self._update_aborted:
+                in_flight[channel_url] = (task, channel_name)
+
+            try:
+                while (pending_channels or in_flight) and not update_token.is_cancelled:
+                    while pending_channels and len(in_flight) < max_workers:
+                        submit_next_channel()
+                    try:
+                        channel_url, result, error = finished.get(timeout=0.5)
+                    except queue.Empty:
+                        # A channel abandoned by the task watchdog never reports back.
+                        for channel_url in [url for url, (task, __) in in_flight.items() if task.abandoned]:
+                            log.warning("Gave up waiting for %s.", in_flight.pop(channel_url)[1])
+                        continue
+                    entry = in_flight.pop(channel_url, None)
+                    if entry is None:
+                        # Reported after it was given up on.
+                        continue
+                    if error is not None:
+                        log.warning("Could not update %s: %s", entry[1], error)
+                        continue
+                    if result is None:
+                        # The channel was cancelled mid-extraction.
+                        continue
+                    for video_row in result['videos']:
+                        if video_row[0] not in added_video_ids:
+                            added_video_ids.add(video_row[0])
+                            new_videos_to_cache.append(video_row)
+                    if result['complete']:
+                        poll_state_to_save.append((result['channel_url'], time.time()))
+                        # Feed entries the channel tabs did not list (e.g. beyond the fetch count or in an
+                        # untracked content type) must not force a full extraction on every refresh.
+                        self._feed_unmatched_ids.update(result['unmatched_ids'])
+                        if result['validators']:
+                            validators_to_save.append(result['validators'])
+            finally:
+                # After a cancellation, queued channels are dropped and running ones are told to stop;
+                # channels stuck on a stalled connection finish on their own.
+                for task, __ in in_flight.values():
+                    self.tasks.cancel(task.id)
+            if new_videos_to_cache or validators_to_save or poll_state_to_save:
+                with self.subscription_db.transaction() as con, metrics.timer("db.query", label="feed_update.save"):
+                    cur = con.cursor()
+                    if new_videos_to_cache:
+                        cur.executemany("""
+                            INSERT OR IGNORE INTO videos (video_id, channel_url, channel_name, title, duration_str, upload_date, content_type) 
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """, new_videos_to_cache)
+                    if validators_to_save:
+                        cur.executemany("""
+                            INSERT OR REPLACE INTO feed_validators (channel_url, etag, last_modified, content_hash, checked_at)
+                            VALUES (?, ?, ?, ?, ?)
+                        """, validators_to_save)
+                    if poll_state_to_save:
+                        cur.executemany(
+                            "INSERT OR REPLACE INTO channel_poll_state (channel_url, last_checked) VALUES (?, ?)",
+                            poll_state_to_save
+                        )
+            metrics.observe("feed.update", time.perf_counter() - update_started)
+            metrics.increment("feed.new_videos", len(new_videos_to_cache))
+            if update_token.is_cancelled:
                 if progress_topic:
                     # Translators: Message shown in the progress dialog when the update is cancelled by the user.
-                    wx.CallAfter(self._notify_callbacks, progress_topic, {"current": current_task, "total": total_tasks, "message": _("Update cancelled.")})
+                    self._notify_callbacks(progress_topic, {"current": current_task, "total": total_tasks, "message": _("Update cancelled.")})
                 elif not silent:
                     # Translators: Announcement when the update is aborted.
                     wx.CallAfter(ui.message, _("Update cancelled."))
@@ -1801,7 +2201,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                 if progress_topic:
                     final_message = _("Update complete. Found {count} new videos.").format(count=len(new_videos_to_cache))
                     final_data = {"current": total_tasks, "total": total_tasks, "message": final_message}
-                    wx.CallAfter(self._notify_callbacks, progress_topic, final_data)
+                    self._notify_callbacks(progress_topic, final_data)
                 elif not silent:
                     if len(new_videos_to_cache) > 0:
                         # Translators: Message spoken when the update process completes and new videos are found. 
@@ -1815,23 +2215,129 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             log.warning("Error updating subscription feed.", e)
             if progress_topic:
                 # Translators: Error message shown if the update process fails due to an unexpected error.
-                wx.CallAfter(self._notify_callbacks, progress_topic, {"message": _("Error updating feed."), "current": 1, "total": 1})
+                self._notify_callbacks(progress_topic, {"message": _("Error updating feed."), "current": 1, "total": 1})
         finally:
-            self.is_long_task_running = False
-            self._update_aborted = False
             if not silent: self._stop_indicator()
 
+    def _acquire_youtube_token(self):
+        """Waits for the youtube.com rate limiter, giving up if the feed update is aborted."""
+        while not self._update_token.is_cancelled:
+            if self._youtube_rate_limiter.acquire(timeout=0.5):
+                return True
+        return False
+
+    @utils.cancellable
+    def _refresh_channel(self, channel_url, channel_name, content_types, known_video_ids, recent_channel_ids, validators, use_feeds, use_uploads, report_task):
+        """
+        Checks one subscribed channel for new uploads in a background network task.
+        recent_channel_ids are the channel's latest stored video IDs, where its tab fetches stop.
+        Only collects results; the caller writes all channels to the database in one batch.
+        """
+        with metrics.timer("feed.refresh_channel", label=channel_name or channel_url):
+            result = {'channel_url': channel_url, 'videos': [], 'validators': None, 'unmatched_ids': (), 'complete': False}
+            tabs_to_fetch, feed_entries, feed_response = content_types, {}, None
+            if use_feeds:
+                if not self._acquire_youtube_token():
+                    return result
+                tabs_to_fetch, feed_entries, feed_response = self._check_channel_feed(
+                    channel_url, content_types, known_video_ids, validators)
+            # One uploads playlist fetch covers every content type; progress is still reported per type.
+            uploads_url = uploads_playlist_url(channel_url) if use_uploads else None
+            uploads_fetched = False
+            found_video_ids = set()
+            tab_failed = False
+            for content_type in content_types:
+                utils.check_cancelled()
+                report_task(channel_name, content_type)
+                if content_type not in tabs_to_fetch:
+                    continue
+                if uploads_url:
+                    if uploads_fetched:
+                        continue
+                    uploads_fetched = True
+                    fetch_url = uploads_url
+                else:
+                    fetch_url = f"{channel_url}/{content_type}"
+                if not self._acquire_youtube_token():
+                    return result
+                try:
+                    latest_videos = self.get_channel_videos(fetch_url, stop_at_ids=recent_channel_ids, classify=bool(uploads_url))
+                    for video in latest_videos or []:
+                        video_id = video.get('id')
+                        if video_id and video_id not in known_video_ids and video_id not in found_video_ids:
+                            feed_entry = feed_entries.get(video_id, {})
+                            video_type = video.get('content_type', content_type)
+                            if feed_entry.get('is_short'):
+                                video_type = 'shorts'
+                            if video_type not in content_types:
+                                continue
+                            result['videos'].append((
+                                video_id, channel_url, channel_name,
+                                video.get('title'), video.get('duration_str'),
+                                video.get('upload_date') or feed_entry.get('upload_date'), video_type
+                            ))
+                            found_video_ids.add(video_id)
+                except Exception as e:
+                    tab_failed = True
+                    log.warning("Could not update %s for %s: %s", content_type, channel_name, e)
+            if not tab_failed:
+                result['complete'] = True
+                result['unmatched_ids'] = [video_id for video_id in feed_entries if video_id not in found_video_ids]
+                # Validators are only stored once the channel is fully up to date, so a failed
+                # tab extraction is retried next time even if the feed has not changed.
+                if feed_response and not feed_response.not_modified:
+                    result['validators'] = (
+                        channel_url, feed_response.etag, feed_response.last_modified,
+                        feed_response.content_hash, datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    )
+            return result
+
+    def _check_channel_feed(self, channel_url, content_types, existing_video_ids, validators=None):
+        """
+        Checks the channel's Atom feed for uploads that are not in the database yet.
+        validators is the stored (etag, last_modified, content_hash) of the last complete check;
+        an unchanged feed is skipped without parsing.
+        Returns the content types that still need a full tab extraction, the unknown feed
+        entries keyed by video ID, and the FeedResponse. Falls back to every content type
+        when the feed cannot be read.
+        """
+        etag, last_modified, known_hash = validators or (None, None, None)
+        response = self._feed_poller.fetch(channel_url, etag=etag, last_modified=last_modified, known_hash=known_hash)
+        if response is None:
+            return content_types, {}, None
+        if response.not_modified:
+            metrics.increment("feed.unchanged")
+            log.debug("Feed for %s is unchanged since the last check.", channel_url)
+            return [], {}, response
+        unknown = {
+            entry['id']: entry for entry in response.entries
+            if entry['id'] not in existing_video_ids and entry['id'] not in self._feed_unmatched_ids
+        }
+        if not unknown:
+            log.debug("Feed for %s has no new uploads, skipping tab extraction.", channel_url)
+            return [], {}, response
+        # The feed marks shorts by their link, but cannot tell regular uploads from streams.
+        needed_types = set()
+        for entry in unknown.values():
+            if entry['is_short']:
+                needed_types.add('shorts')
+            else:
+                needed_types.update(('videos', 'streams'))
+        tabs_to_fetch = [content_type for content_type in content_types if content_type in needed_types]
+        log.debug("Feed for %s lists %d new uploads, extracting tabs: %s", channel_url, len(unknown), tabs_to_fetch)
+        return tabs_to_fetch, unknown, response
+
     def stop_subscription_update(self):
-        self._update_aborted = True
+        self._update_token.cancel()
         
+    @utils.cancellable
     def _download_choice_worker(self, url):
         clean_url = self._validate_video_url_and_notify(url)
         if not clean_url:
             return
         self._start_indicator()
         try:
-            self.is_long_task_running = True
-            info = self.get_video_info(url)
+            info = self.get_video_info(url, stable_only=True)
             # Translators: Fallback title used when the name of the video to be downloaded cannot be retrieved.
             title = info.get('title', _("Unknown Video"))
             duration = self._format_duration_verbose(info.get('duration', 0))
@@ -1841,30 +2347,26 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when the add-on cannot fetch video details (like title or formats) before downloading.
             self._notify_error(_("Failed to get video info for download. Details: {}").format(e))
             self._stop_indicator()
-        finally:
-            self.is_long_task_running = False
 
+    @utils.cancellable
     def _direct_download_worker(self, url, choice):
         # Translators: Status message shown when the add-on is fetching video details before starting a direct download.
         ui.message(_("Getting video info for download..."))
         self._start_indicator()
         try:
-            self.is_long_task_running = True
-            info = self.get_video_info(url)
+            info = self.get_video_info(url, stable_only=True)
             # Translators: Fallback title used when the name of the video cannot be retrieved during direct download.
             title = info.get('title', _("Unknown Video"))
             self._perform_download_worker(url, choice, title)
         except Exception as e:
             log.warning("Failed to initiate direct download for %s", e)
-            wx.CallAfter(
-                self._notify_callbacks,
+            self._notify_callbacks(
                 "download_progress",
                 {'status': 'error'}
             )
             # Translators: Error message shown when a direct download fails to start. {error} is the technical error message.
             self._notify_error(_("Failed to start download: {error}").format(error=e))
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
             
     def _show_download_dialog(self, url, title, duration):
@@ -1887,26 +2389,42 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         if choice:
             self._resume_indicator()
             wx.CallAfter(lambda: DownloadProgressDialog(gui.mainFrame, self).Show())
-            threading.Thread(target=self._perform_download_worker, args=(url, choice, title, ), daemon=True).start()
+            self.tasks.submit(self._perform_download_worker, args=(url, choice, title, ), category=CATEGORY_DOWNLOAD)
         else:
             self._stop_indicator()
 
+    def _download_postprocessor_hook(self, d):
+        """
+        Postprocessor hook for yt-dlp. Merging or converting with FFmpeg reports no progress,
+        so the download's stall deadline is suspended while a postprocessor runs and restarted after it.
+        """
+        cancel_token = utils.current_cancel_token()
+        if cancel_token is None:
+            return
+        if d.get('status') == 'finished':
+            cancel_token.extend()
+        else:
+            cancel_token.suspend()
+
     def _download_progress_hook(self, d):
         """
         Progress hook for yt-dlp. Called frequently during download.
         Fires 'download_progress' callbacks consumed by DownloadProgressDialog.
         Raises DownloadCancelled if user requested cancel.
         """
-        if self._download_cancelled:
+        cancel_token = utils.current_cancel_token()
+        if self._download_cancelled or (cancel_token and cancel_token.is_cancelled):
             raise yt_dlp.utils.DownloadCancelled()
+        if cancel_token is not None:
+            # The download deadline measures stalls, so progress restarts it.
+            cancel_token.extend()
         if d['status'] == 'downloading':
             downloaded = d.get('downloaded_bytes', 0)
             total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
             speed = d.get('speed') or 0
             eta = d.get('eta')
             percent = int(downloaded / total * 100) if total else -1
-            wx.CallAfter(
-                self._notify_callbacks,
+            self._notify_callbacks(
                 "download_progress",
                 {
                     'status': 'downloading',
@@ -1918,8 +2436,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                 }
             )
         elif d['status'] == 'finished':
-            wx.CallAfter(
-                self._notify_callbacks,
+            self._notify_callbacks(
                 "download_progress",
                 {'status': 'finished', 'percent': 100}
             )
@@ -1963,36 +2480,42 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             f.write('\n'.join(lines_out))
         return txt_path
 
+    @utils.cancellable
     def _perform_download_worker(self, url, choice, title):
         # Translators: Status message shown when a download process begins. {title} is the video title.
         wx.CallAfter(ui.message, _("Starting download of {title}...").format(title=title))
         self._download_cancelled = False
         try:
-            self.is_long_task_running = True
             save_path = config.conf["YoutubePlus"].get("exportPath", "") or os.path.join(os.path.expanduser("~"), "Desktop")
             output_template = os.path.join(save_path, '%(title)s.%(ext)s')
             if not os.path.exists(save_path):
                 os.makedirs(save_path)
-            opts = {'progress_hooks': [self._download_progress_hook]}
+            opts = {'progress_hooks': [self._download_progress_hook], 'postprocessor_hooks': [self._download_postprocessor_hook]}
             if choice == 'video':
                 opts['format'] = 'best[ext=mp4]/best[ext=webm]/best'
                 opts['outtmpl'] = output_template
             elif choice == 'audio':
                 opts['format'] = 'bestaudio[acodec=aac]/140/bestaudio[ext=m4a]/bestaudio'
                 opts['outtmpl'] = output_template
-            wx.CallAfter(self._notify_callbacks, "download_started", {'title': title})
+            self._notify_callbacks("download_started", {'title': title})
             try:
-                with self._get_ydl_instance(extra_opts=opts) as ydl:
+                with self._get_ydl_instance(extra_opts=opts, operation='download') as ydl:
                     ydl.download([url])
                 if not self._download_cancelled:
-                    wx.CallAfter(self._notify_callbacks, "download_progress", {'status': 'complete'})
+                    self._notify_callbacks("download_progress", {'status': 'complete'})
                     # Translators: Success message shown when a video or audio file has finished downloading. {title} is the file name.
                     self._notify_success(_("Download complete: {title}").format(title=title))
             except yt_dlp.utils.DownloadCancelled:
-                wx.CallAfter(self._notify_callbacks, "download_progress", {'status': 'cancelled'})
                 self._cleanup_part_files(save_path)
-                # Translators: Message shown when the user cancels a download in progress.
-                wx.CallAfter(ui.message, _("Download cancelled."))
+                cancel_token = utils.current_cancel_token()
+                if cancel_token is not None and cancel_token.timed_out:
+                    self._notify_callbacks("download_progress", {'status': 'error'})
+                    # Translators: Error message when a download made no progress for too long. {minutes} is a number of minutes.
+                    self._notify_error(_("Download stopped: no progress for {minutes} minutes.").format(minutes=cancel_token.timeout // 60), log_message=f"Download of {url} stalled and was stopped.")
+                else:
+                    self._notify_callbacks("download_progress", {'status': 'cancelled'})
+                    # Translators: Message shown when the user cancels a download in progress.
+                    wx.CallAfter(ui.message, _("Download cancelled."))
             except DownloadError as e:
                 if "Requested format is not available" in str(e) and choice == 'audio':
                     # Translators: Warning message shown when the requested audio-only format isn't available,
@@ -2001,24 +2524,23 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                     log.warning("Audio-only format not found. Falling back to video format 18.")
                     fallback_opts = opts.copy()
                     fallback_opts['format'] = '18'
-                    with self._get_ydl_instance(extra_opts=fallback_opts) as ydl:
+                    with self._get_ydl_instance(extra_opts=fallback_opts, operation='download') as ydl:
                         ydl.download([url])
-                    wx.CallAfter(self._notify_callbacks, "download_progress", {'status': 'complete'})
+                    self._notify_callbacks("download_progress", {'status': 'complete'})
                     # Translators: Success message shown when the download finished by using a video format as a fallback for audio.
                     self._notify_success(_("Download complete (as MP4 video file): {title}").format(title=title))
                 else:
                     raise e
         except DownloadError as e:
-            wx.CallAfter(self._notify_callbacks, "download_progress", {'status': 'error'})
+            self._notify_callbacks("download_progress", {'status': 'error'})
             # Translators: Error message shown when the download process fails.
             self._notify_error(_("Download failed."), log_message=f"Download failed for {title}: {e}")
         except Exception as e:
-            wx.CallAfter(self._notify_callbacks, "download_progress", {'status': 'error'})
+            self._notify_callbacks("download_progress", {'status': 'error'})
             # Translators: Error message shown when the download process fails.
             self._notify_error(_("Download failed."), log_message=f"Download failed for {title}: {e}")
         finally:
             self._download_cancelled = False
-            self.is_long_task_running = False
             self._stop_indicator()
 
     def _cleanup_part_files(self, directory):
@@ -2032,6 +2554,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         except Exception as e:
             log.warning(f"Could not clean up .part files in {directory}: {e}")
         
+    @utils.cancellable
     def _Youtube_worker(self, query, count, source_dialog):
         """
         A simplified worker that takes a raw query and the desired number of results.
@@ -2039,11 +2562,10 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         # Translators: Status message shown when the add-on starts searching YouTube. {query} is the search text.
         ui.message(_("Searching for '{query}'...").format(query=query))
         self._start_indicator()
-        self.is_long_task_running = True
         try:
             opts = {'quiet': True, 'no_warnings': True, 'extract_flat': 'in_playlist'}
             search_prefix = f"ytsearch{count}:{query}"
-            with self._get_ydl_instance(extra_opts=opts) as ydl:
+            with self._get_ydl_instance(extra_opts=opts, operation='search') as ydl:
                 info = ydl.extract_info(search_prefix, download=False)
             results_list = []
             if 'entries' in info:
@@ -2078,7 +2600,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when an error occurs during the YouTube search process.
             wx.CallAfter(ui.message, _("Failed to perform search."))
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
             
     def openMessagesDialog(self):
@@ -2154,16 +2675,12 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         """Directly shows the new tabbed subscription feed dialog."""
         #log.critical("!!! _show_subscription_feed_directly was called. This is the trigger for SubDialog to appear. !!!")
         try:
-            db_path = self.get_profile_path("subscription.db")
-            con = sqlite3.connect(db_path)
-            cur = con.cursor()
-            cur.execute("SELECT COUNT(*) FROM subscribed_channels")
-            if cur.fetchone()[0] == 0:
-                con.close()
+            with self.subscription_db.connection() as con:
+                channel_count = con.execute("SELECT COUNT(*) FROM subscribed_channels").fetchone()[0]
+            if channel_count == 0:
                 # Translators: Message shown when the user tries to open the subscription feed but has not added any channels yet.
                 ui.message(_("You haven't subscribed to any channels yet."))
                 return
-            con.close()
             gui.mainFrame.prePopup()
             dialog = SubDialog(gui.mainFrame, self)
             dialog.Show()
@@ -2195,6 +2712,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         gui.mainFrame.postPopup()
 
     
+    @utils.cancellable
     def prune_all_videos_worker(self):
             """Worker to delete ALL videos from the database after confirmation."""
             # Translators: A heavy warning message shown before deleting all videos from the local database. 
@@ -2208,19 +2726,15 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                     return
                 # Translators: Status message shown when the process of deleting all videos begins.
                 ui.message(_("Clearing all feed videos..."))
-                threading.Thread(target=self._execute_pruning_all, daemon=True).start()
+                self.tasks.submit(self._execute_pruning_all, category=CATEGORY_DB)
             wx.CallAfter(ask_confirmation)
 
     def _execute_pruning_all(self):
             """The actual database deletion part for clearing ALL videos."""
             try:
-                db_path = self.get_profile_path("subscription.db")
-                con = sqlite3.connect(db_path)
-                cur = con.cursor()
-                cur.execute("DELETE FROM videos")
-                rows_deleted = cur.rowcount
-                con.commit()
-                con.close()
+                with self.subscription_db.transaction() as con:
+                    rows_deleted = con.execute("DELETE FROM videos").rowcount
+                    con.execute("DELETE FROM feed_validators")
                 # Translators: Success message shown after finishing the process of clearing videos from the database. 
                 # {count} is the total number of video records that were removed.
                 self._notify_delete(_("Clearing complete. All {count} videos were deleted.").format(count=rows_deleted))
@@ -2247,7 +2761,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when the add-on cannot find a YouTube URL neither in the active browser window nor in the clipboard.
             return ui.message(_("YouTube URL not found in current window or clipboard."))
         url = self._clean_youtube_url(messy_url)
-        threading.Thread(target=self.get_data_for_url, args=(url,), daemon=True).start()
+        self.tasks.submit(self.get_data_for_url, args=(url,))
 
     @script(description="Show video info from current page or clipboard URL.")
     def script_getInfo(self, gesture):
@@ -2258,7 +2772,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         url = self._clean_youtube_url(messy_url)
         # Translators: Generic status message shown when the add-on is fetching data about a video from YouTube.
         ui.message(_("Getting video info..."))
-        threading.Thread(target=self._get_info_worker, args=(url, ), daemon=True).start()
+        self.tasks.submit(self._get_info_worker, args=(url, ))
 
     @script(description="Show video chapters/timestamps from current page or clipboard URL.")
     def script_showChapters(self, gesture):
@@ -2269,7 +2783,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         url = self._clean_youtube_url(messy_url)
         # Translators: Status message shown when the add-on is fetching the list of timestamps or chapters from a video's description.
         ui.message(_("Getting chapters..."))
-        threading.Thread(target=self._show_chapters_worker, args=(url, ), daemon=True).start()
+        self.tasks.submit(self._show_chapters_worker, args=(url, ))
 
     @script(
         # Translators: Presented in input help mode.
@@ -2281,7 +2795,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when the add-on cannot find a YouTube URL neither in the active browser window nor in the clipboard.
             return ui.message(_("YouTube URL not found in current window or clipboard."))
         url = self._clean_youtube_url(messy_url)
-        threading.Thread(target=self._subtitle_worker, args=(url,), daemon=True).start()
+        self.tasks.submit(self._subtitle_worker, args=(url,))
         
     @script(description="Download video or audio from current page or clipboard URL.")
     def script_downloadClip(self, gesture):
@@ -2292,7 +2806,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         url = self._clean_youtube_url(messy_url)
         # Translators: Status message shown when the add-on is fetching technical details (like available formats) specifically for starting a download.
         ui.message(_("Getting video info for download..."))
-        threading.Thread(target=self._download_choice_worker, args=(url, ), daemon=True).start()
+        self.tasks.submit(self._download_choice_worker, args=(url, ))
 
     @script(description="Show help dialog.")
     def script_displayHelp(self, gesture):
@@ -2301,6 +2815,20 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         dialog.Show()
         gui.mainFrame.postPopup()
 
+    @script(description=_("Show diagnostics dialog."))
+    def script_showDiagnostics(self, gesture):
+        wx.CallAfter(self._show_diagnostics_dialog)
+
+    def _show_diagnostics_dialog(self):
+        if DiagnosticsDialog._instance:
+            DiagnosticsDialog._instance.Raise()
+            DiagnosticsDialog._instance.refresh()
+            return
+        gui.mainFrame.prePopup()
+        dialog = DiagnosticsDialog(gui.mainFrame, self)
+        dialog.Show()
+        gui.mainFrame.postPopup()
+
     @script(description="Stop live chat monitoring.")
     def script_stopMonitor(self, gesture):
         self.stopChatMonitoring()
@@ -2391,23 +2919,23 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
     def _on_add_to_video_fav(self, url):
         """Starts the worker to add the URL to video favorites."""
-        threading.Thread(target=self.add_item_to_favorites_worker, args=(url,), daemon=True).start()
+        self.tasks.submit(self.add_item_to_favorites_worker, args=(url,))
         
     def _on_add_to_channel_fav(self, url):
         """Starts the worker to add the URL to channel favorites."""
-        threading.Thread(target=self.add_channel_to_favorites_worker, args=(url,), daemon=True).start()
+        self.tasks.submit(self.add_channel_to_favorites_worker, args=(url,))
         
     def _on_add_to_playlist_fav(self, url):
         """Starts the worker to add the URL to playlist favorites."""
-        threading.Thread(target=self.add_playlist_to_favorites_worker, args=(url,), daemon=True).start()
+        self.tasks.submit(self.add_playlist_to_favorites_worker, args=(url,))
 
     def _on_subscribe_to_channel(self, url):
         """Starts the worker for subscribing to a channel."""
-        threading.Thread(target=self.subscribe_to_channel_worker, args=(url,), daemon=True).start()
+        self.tasks.submit(self.subscribe_to_channel_worker, args=(url,))
         
     def _on_add_to_watchList(self, url):
         """Starts the worker to add the URL to watch list."""
-        threading.Thread(target=self.add_to_watchlist_worker, args=(url,), daemon=True).start()
+        self.tasks.submit(self.add_to_watchlist_worker, args=(url,))
 
     @script(description=_("Show subscription feed dialog."))
     def script_showSubDialog(self, gesture):
@@ -2460,9 +2988,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             ui.message(_("No text selected and clipboard is empty."))
             return
         count = config.conf["YoutubePlus"].get("searchResultCount", 20)
-        threading.Thread(target=self._Youtube_worker,
-                         args=(query, count, gui.mainFrame),
-                         daemon=True).start()
+        self.tasks.submit(self._Youtube_worker, args=(query, count, gui.mainFrame))
 
     @script(description=_("Show manage subscriptions dialog."))
     def script_showManageSubDialog(self, gesture):
@@ -2481,13 +3007,11 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         if not video_ids:
             return
         try:
-            db_path = self.get_profile_path("subscription.db")
-            with sqlite3.connect(db_path) as con:
+            with self.subscription_db.transaction() as con:
                 con.executemany(
                     "INSERT OR IGNORE INTO seen_videos (video_id) VALUES (?)",
                     [(vid,) for vid in video_ids]
                 )
-            con.close()  
             if notify:
                 self._notify_callbacks("subscriptions_updated")
             return True
@@ -2507,14 +3031,14 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         from .settings import YoutubePlusSettingsPanel
         wx.CallAfter(gui.mainFrame.popupSettingsDialog, gui.settingsDialogs.NVDASettingsDialog, YoutubePlusSettingsPanel)
 
+    @utils.cancellable
     def _subtitle_worker(self, url):
         clean_url = self._validate_video_url_and_notify(url)
         if not clean_url:
             return
         self._start_indicator()
         try:
-            self.is_long_task_running = True
-            info = self.get_video_info(url)
+            info = self.get_video_info(url, stable_only=True)
             # Translators: Fallback title used when the video title cannot be retrieved for subtitle download.
             title = info.get('title', _("Unknown Video"))
             subtitles = info.get('subtitles', {})
@@ -2561,8 +3085,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when the add-on cannot fetch subtitle information for a video.
             self._notify_error(_("Failed to get subtitle info. Details: {}").format(e))
             self._stop_indicator()
-        finally:
-            self.is_long_task_running = False
 
     def _show_subtitle_dialog(self, url, title, options):
         self._pause_indicator()
@@ -2586,17 +3108,16 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             return
         _label, lang_code, sub_type = options[selected_index]
         self._resume_indicator()
-        threading.Thread(
-            target=self._perform_subtitle_download,
+        self.tasks.submit(
+            self._perform_subtitle_download,
             args=(url, title, lang_code, sub_type),
-            daemon=True
-        ).start()
+        )
 
+    @utils.cancellable
     def _perform_subtitle_download(self, url, title, lang_code, sub_type):
         # Translators: Status message shown when subtitle download begins. {title} is the video title.
         wx.CallAfter(ui.message, _("Downloading subtitles for {title}...").format(title=title))
         try:
-            self.is_long_task_running = True
             save_path = config.conf["YoutubePlus"].get("exportPath", "") or os.path.join(os.path.expanduser("~"), "Desktop")
             if not os.path.exists(save_path):
                 os.makedirs(save_path)
@@ -2612,7 +3133,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
                 opts['writeautomaticsub'] = True
             else:
                 opts['writesubtitles'] = True
-            with self._get_ydl_instance(extra_opts=opts) as ydl:
+            with self._get_ydl_instance(extra_opts=opts, operation='subtitle') as ydl:
                 ydl.download([url])
             if sub_format == "txt":
                 import glob
@@ -2629,7 +3150,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
             # Translators: Error message shown when subtitle download fails.
             self._notify_error(_("Subtitle download failed. Details: {}").format(e), log_message=f"Subtitle download failed for {title}: {e}")
         finally:
-            self.is_long_task_running = False
             self._stop_indicator()
             
     def backup_profile(self, auto=False):
@@ -2646,7 +3166,18 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zf:
             for filename in os.listdir(profile_path):
                 file_path = os.path.join(profile_path, filename)
-                if os.path.isfile(file_path):
+                if filename.endswith(SIDE_FILE_SUFFIXES):
+                    continue
+                if filename == SUBSCRIPTION_DB_FILENAME:
+                    # The database file alone may lack changes still in its write-ahead log.
+                    snapshot_path = os.path.join(backup_dir, f"{profile}_{filename}.tmp")
+                    try:
+                        self.subscription_db.snapshot(snapshot_path)
+                        zf.write(snapshot_path, os.path.join(profile, filename))
+                    finally:
+                        if os.path.exists(snapshot_path):
+                            os.remove(snapshot_path)
+                elif os.path.isfile(file_path) and filename not in (METADATA_CACHE_FILENAME, DIAGNOSTICS_FILENAME):
                     #zf.write(file_path, filename)
                     zf.write(file_path, os.path.join(profile, filename))
         all_backups = sorted([
@@ -2672,14 +3203,19 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         backup_dir = os.path.join(globalVars.appArgs.configPath, "YoutubePlus", "_back_ups_db")
         backup_path = os.path.join(backup_dir, backup_filename)
         profile_path = self.get_profile_path()
+        # Open connections would keep writing to the replaced database from their stale logs.
+        self.subscription_db.close()
         with zipfile.ZipFile(backup_path, 'r') as zf:
             for member in zf.namelist():
                 filename = os.path.basename(member)
                 if not filename:  # ข้าม folder entry
                     continue
                 target_path = os.path.join(profile_path, filename)
+                if filename == SUBSCRIPTION_DB_FILENAME:
+                    Database.remove_side_files(target_path)
                 with zf.open(member) as src, open(target_path, 'wb') as dst:
                     dst.write(src.read())
+        self.category_index.invalidate()
                 
     __YoutubePlusGestures = {
         "kb:a": "showAddMenu",
@@ -2702,5 +3238,6 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         "kb:v": "showMessagesDialog",
         "kb:u": "showUserProfileManagerDialog",
         "kb:y": "openSettings",
+        "kb:shift+d": "showDiagnostics",
         "kb:h": "displayHelp"
     }
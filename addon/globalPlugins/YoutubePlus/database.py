@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# database.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from logHandler import log
+from .metrics import metrics
+
+# How long a statement waits for another connection's write lock before failing with "database is locked".
+BUSY_TIMEOUT_SECONDS = 10
+# Page cache per connection, in KiB.
+CACHE_SIZE_KIB = 8 * 1024
+# How much of the database file is memory-mapped for reads.
+MMAP_SIZE_BYTES = 64 * 1024 * 1024
+# Connections kept open between uses; more are opened when needed and closed afterwards.
+MAX_IDLE_CONNECTIONS = 4
+# Files SQLite keeps next to a database while it is open, which must never be copied on their own.
+SIDE_FILE_SUFFIXES = ("-wal", "-shm", "-journal")
+
+class Database:
+    """
+    Hands out pooled connections to one SQLite database of the active profile, from any thread.
+    Connections use write-ahead logging, so readers never block the writer or each other,
+    with synchronous=NORMAL, a larger page cache and memory-mapped reads.
+    The schema is brought up to date by the first connection opened to a database file.
+    """
+
+    def __init__(self, db_path_func, name, migrations=()):
+        """
+        db_path_func returns the database path of the active profile; name labels its metrics.
+        migrations is the schema history: functions taking a cursor, applied in order and once
+        each, with PRAGMA user_version counting how many a database has had.
+        """
+        self._db_path_func = db_path_func
+        self._name = name
+        self._migrations = tuple(migrations)
+        self._migrate_lock = threading.Lock()
+        self._migrated_paths = set()
+        self._lock = threading.Lock()
+        # (path, generation, connection) of the connections not in use.
+        self._idle = []
+        # Bumped by close(), so connections opened before are not reused.
+        self._generation = 0
+
+    @property
+    def path(self):
+        return self._db_path_func()
+
+    def _open(self, path):
+        con = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        try:
+            journal_mode = con.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if journal_mode.lower() != "wal":
+                log.warning(f"Could not enable write-ahead logging for {path} (journal mode is {journal_mode}).")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+            con.execute(f"PRAGMA mmap_size={MMAP_SIZE_BYTES}")
+            con.execute("PRAGMA temp_store=MEMORY")
+        except sqlite3.Error:
+            con.close()
+            raise
+        metrics.increment("db.connections", label=self._name)
+        return con
+
+    def _acquire(self):
+        path = self._db_path_func()
+        stale = []
+        try:
+            with self._lock:
+                generation = self._generation
+                while self._idle:
+                    entry = self._idle.pop()
+                    if entry[0] == path and entry[1] == generation:
+                        return entry
+                    stale.append(entry[2])
+        finally:
+            for con in stale:
+                con.close()
+        con = self._open(path)
+        try:
+            self._migrate(path, con)
+        except BaseException:
+            con.close()
+            raise
+        return path, generation, con
+
+    def _migrate(self, path, con):
+        with self._migrate_lock:
+            if path in self._migrated_paths:
+                return
+            version = con.execute("PRAGMA user_version").fetchone()[0]
+            latest = len(self._migrations)
+            if version > latest:
+                log.warning(f"{path} has schema version {version}, but this version of the add-on only knows {latest}.")
+            for number in range(version + 1, latest + 1):
+                started = time.perf_counter()
+                con.execute("BEGIN IMMEDIATE")
+                try:
+                    self._migrations[number - 1](con.cursor())
+                    # user_version is part of the database header, so it commits together with the migration.
+                    con.execute(f"PRAGMA user_version = {number}")
+                    con.commit()
+                except BaseException:
+                    con.rollback()
+                    log.error(f"Migrating {path} to schema version {number} failed.")
+                    raise
+                metrics.observe("db.migration", time.perf_counter() - started, label=f"{self._name} {number}")
+                log.info(f"Migrated {path} to schema version {number}.")
+            self._migrated_paths.add(path)
+
+    def migrate(self):
+        """Brings the schema up to date now rather than on first use."""
+        with self.connection():
+            pass
+
+    def _release(self, path, generation, con):
+        try:
+            if con.in_transaction:
+                con.rollback()
+        except sqlite3.Error:
+            con.close()
+            return
+        with self._lock:
+            if generation == self._generation and len(self._idle) < MAX_IDLE_CONNECTIONS:
+                self._idle.append((path, generation, con))
+                return
+        con.close()
+
+    @contextmanager
+    def connection(self):
+        """
+        Yields a connection for the duration of a with block. Like sqlite3's own context
+        manager, it commits when the block succeeds and rolls back when it raises.
+        """
+        path, generation, con = self._acquire()
+        try:
+            with con:
+                yield con
+        finally:
+            self._release(path, generation, con)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Yields a connection inside a write transaction, committed when the block succeeds.
+        The write lock is taken up front (BEGIN IMMEDIATE), so a transaction that reads
+        before it writes cannot fail halfway when another connection is writing.
+        """
+        with self.connection() as con:
+            con.execute("BEGIN IMMEDIATE")
+            yield con
+
+    def snapshot(self, target_path):
+        """Writes a consistent copy of the database, including changes still in its log, to target_path."""
+        with self.connection() as con:
+            target = sqlite3.connect(target_path)
+            try:
+                con.backup(target)
+            finally:
+                target.close()
+
+    def close(self):
+        """
+        Closes the idle connections; connections in use are closed when they are returned.
+        Call it before the database file is replaced or removed. Later uses open new connections,
+        and migrate the replacement if it is older.
+        """
+        with self._lock:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+        with self._migrate_lock:
+            self._migrated_paths.clear()
+        for __, __, con in idle:
+            con.close()
+
+    @staticmethod
+    def remove_side_files(path):
+        """Removes the log files left next to a database, e.g. before the database is replaced by a backup."""
+        for suffix in SIDE_FILE_SUFFIXES:
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
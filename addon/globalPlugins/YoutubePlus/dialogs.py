@@ -19,13 +19,18 @@ import addonHandler
 import api
 from functools import wraps
 import json
-import threading 
 import controlTypes 
 import sqlite3
 from logHandler import log
 import shutil
 import globalVars
 import globalCommands
+from .utils import CancellationToken, youtube_circuit_breaker
+from .connectivity import connectivity
+from .metrics import metrics, ALL_LABELS, DIAGNOSTICS_FILENAME
+from .responsiveness import ui_probe, NO_ACTIVITY_LABEL
+from .feed_list import FeedPager, VirtualFeedListCtrl
+from .tasks import CATEGORY_DB, CATEGORY_DISK, CATEGORY_DOWNLOAD, CATEGORY_FEED, FEED_UPDATE_TASK
 
 # Initialize translations for this file
 addonHandler.initTranslation()
@@ -41,11 +46,22 @@ confspec = {
     "playlist_fetch_count": "integer(default=20, min=5, max=100)",
     "contentTypesToFetch": "string_list(default=list('videos', 'shorts', 'streams'))",
     "autoUpdateIntervalMinutes": "integer(default=0)",
+    "useChannelFeeds": "boolean(default=True)",
+    "feedRefreshWorkers": "integer(default=4, min=1, max=16)",
+    "adaptivePolling": "boolean(default=True)",
+    "useUploadsPlaylist": "boolean(default=False)",
     "autoSpeak": "boolean(default=True)",
     "refreshInteval": "integer(default=5, min=1, max=60)",
     "messageLimit": "integer(default=5000, min=100, max=20000)",
     #"cookieFilePath": "string(default='')",
     "cookieMode": "string(default='none')",
+    "cookieCacheMinutes": "integer(default=30, min=1, max=1440)",
+    "extractionWorker": "boolean(default=False)",
+    "extractionPython": "string(default='')",
+    "socketTimeoutSeconds": "integer(default=20, min=5, max=300)",
+    "operationTimeoutMinutes": "integer(default=10, min=1, max=120)",
+    "downloadStallMinutes": "integer(default=5, min=1, max=60)",
+    "offlineDetection": "boolean(default=True)",
     "exportPath": "string()",
     "subDialogViewMode": "string(default='unseen')",
     "searchResultCount": "integer(default=20, min=5, max=100)",
@@ -61,9 +77,30 @@ def sanitize_filename(filename):
     sanitized = re.sub(r'\s+', ' ', sanitized).strip()
     return sanitized
 
+def _owner_cancel_token(window):
+    """Returns the cancellation token of the dialog that contains window, if it has one."""
+    return getattr(wx.GetTopLevelParent(window), 'cancel_token', None)
+
 class BaseDialogMixin:
     """A mixin to provide common dialog functionality."""
     _escape_protection = False
+    _cancel_token = None
+
+    @property
+    def cancel_token(self):
+        """
+        A token for the workers started from this dialog. It is cancelled when the
+        dialog is destroyed, so closing it with Escape or Close stops their work.
+        """
+        if self._cancel_token is None:
+            self._cancel_token = CancellationToken()
+            self.Bind(wx.EVT_WINDOW_DESTROY, self._on_destroy_cancel_workers)
+        return self._cancel_token
+
+    def _on_destroy_cancel_workers(self, event):
+        if event.GetEventObject() is self:
+            self._cancel_token.cancel()
+        event.Skip()
 
     def on_char_hook(self, event):
         key = event.GetKeyCode()
@@ -179,6 +216,7 @@ class HelpDialog(BaseInfoDialog):
 
 --- Help ---
 - H: Show this help dialog
+- Shift+D: Show diagnostics (where the add-on spends its time)
 """)
 
 class InfoDialog(BaseInfoDialog):
@@ -188,6 +226,226 @@ class InfoDialog(BaseInfoDialog):
     def __init__(self, parent, title, info_text):
         super(InfoDialog, self).__init__(parent, title, info_text)
 
+class DiagnosticsDialog(BaseDialogMixin, wx.Dialog):
+    """Shows where the add-on spends its time: the metrics registry and the task executor."""
+    _instance = None
+    # How many of the slowest channels and callback handlers are listed.
+    TOP_COUNT = 10
+
+    def __init__(self, parent, core_instance):
+        # Translators: Title of the diagnostics dialog.
+        super().__init__(parent, title=_("YouTubePlus Diagnostics"))
+        self.__class__._instance = self
+        self.core = core_instance
+        panel = wx.Panel(self)
+        mainSizer = wx.BoxSizer(wx.VERTICAL)
+        self.textCtrl = wx.TextCtrl(panel, style=wx.TE_MULTILINE | wx.TE_READONLY)
+        mainSizer.Add(self.textCtrl, 1, wx.EXPAND | wx.ALL, 10)
+        btnSizer = wx.BoxSizer(wx.HORIZONTAL)
+        # Translators: Button in the diagnostics dialog to reload the figures.
+        refreshBtn = wx.Button(panel, label=_("&Refresh"))
+        refreshBtn.Bind(wx.EVT_BUTTON, lambda e: self.refresh())
+        # Translators: Button in the diagnostics dialog to write the figures to a JSON file in the profile folder.
+        saveBtn = wx.Button(panel, label=_("&Save to profile folder"))
+        saveBtn.Bind(wx.EVT_BUTTON, self.on_save)
+        # Translators: Button in the diagnostics dialog to clear all collected figures.
+        resetBtn = wx.Button(panel, label=_("R&eset"))
+        resetBtn.Bind(wx.EVT_BUTTON, self.on_reset)
+        # Translators: The label of the button to close the diagnostics dialog.
+        closeBtn = wx.Button(panel, label=_("C&lose"))
+        closeBtn.Bind(wx.EVT_BUTTON, lambda e: self.Close())
+        for btn in (refreshBtn, saveBtn, resetBtn, closeBtn):
+            btnSizer.Add(btn, 0, wx.ALL, 5)
+        mainSizer.Add(btnSizer, 0, wx.ALIGN_CENTER | wx.BOTTOM, 5)
+        panel.SetSizer(mainSizer)
+        self.SetSize((700, 500))
+        self.CentreOnScreen()
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.Bind(wx.EVT_CHAR_HOOK, self.on_char_hook)
+        self.refresh()
+        self.textCtrl.SetFocus()
+
+    def on_close(self, event):
+        self.__class__._instance = None
+        self.Destroy()
+
+    def refresh(self):
+        self.textCtrl.SetValue(self._build_report(metrics.snapshot(), self.core.tasks.list_tasks()))
+        self.textCtrl.SetInsertionPoint(0)
+
+    def on_save(self, event):
+        path = self.core.get_profile_path(DIAGNOSTICS_FILENAME)
+        try:
+            metrics.dump_json(path, extra={
+                'tasks': self.core.tasks.list_tasks(),
+                'circuit_breaker': youtube_circuit_breaker.state,
+                'callback_subscribers': self.core.callback_subscriber_counts(),
+            })
+        except OSError as e:
+            log.error(f"Could not save diagnostics to {path}: {e}")
+            # Translators: Error message when the diagnostics file cannot be written.
+            ui.message(_("Could not save diagnostics."))
+            return
+        # Translators: Message after the diagnostics were written. {path} is the file path.
+        ui.message(_("Diagnostics saved to {path}").format(path=path))
+
+    def on_reset(self, event):
+        metrics.reset()
+        self.refresh()
+        # Translators: Message after the diagnostics figures were cleared.
+        ui.message(_("Diagnostics reset."))
+
+    @staticmethod
+    def _format_seconds(seconds):
+        if seconds is None:
+            return "-"
+        if seconds < 1:
+            # Translators: A duration in milliseconds in the diagnostics dialog.
+            return _("{ms:.0f} ms").format(ms=seconds * 1000)
+        # Translators: A duration in seconds in the diagnostics dialog.
+        return _("{s:.1f} s").format(s=seconds)
+
+    def _format_timing(self, label, stats):
+        # Translators: One timing line in the diagnostics dialog.
+        return _("{label}: {count} times, average {mean}, 95% within {p95}, slowest {max}").format(
+            label=label, count=stats['count'], mean=self._format_seconds(stats['mean']),
+            p95=self._format_seconds(stats['p95']), max=self._format_seconds(stats['max'])
+        )
+
+    def _timing_lines(self, histograms, name, slowest_first=False, limit=None):
+        series = histograms.get(name, {})
+        labels = [label for label in series if label != ALL_LABELS]
+        if slowest_first:
+            labels.sort(key=lambda label: series[label]['mean'] or 0, reverse=True)
+        else:
+            labels.sort()
+        lines = [self._format_timing(label, series[label]) for label in labels[:limit]]
+        if not lines and ALL_LABELS in series:
+            # Translators: Label of a timing line summarising all observations.
+            lines.append(self._format_timing(_("All"), series[ALL_LABELS]))
+        # Translators: Shown in the diagnostics dialog when nothing was measured yet.
+        return lines or [_("No data yet.")]
+
+    def _build_report(self, snapshot, task_list):
+        counters = snapshot['counters']
+        histograms = snapshot['histograms']
+        lines = [
+            # Translators: First line of the diagnostics report. {started} is a date and time.
+            _("Collected since {started}").format(started=snapshot['started_at']),
+            "",
+            # Translators: Heading in the diagnostics report.
+            _("--- Tasks ---"),
+        ]
+        for task in task_list:
+            # Translators: A task line in the diagnostics report.
+            lines.append(_("{name} ({category}, {state}, {seconds})").format(
+                name=task['name'], category=task['category'], state=task['state'],
+                seconds=self._format_seconds(task['running_seconds'] or task['queued_seconds'])
+            ))
+        if not task_list:
+            # Translators: Shown in the diagnostics report when no task is running.
+            lines.append(_("No tasks running."))
+        # Translators: Task deadline counters in the diagnostics report.
+        lines.append(_("Stopped at their deadline: {timed_out}, abandoned as hung: {abandoned}").format(
+            timed_out=counters.get("tasks.timed_out", {}).get(ALL_LABELS, 0),
+            abandoned=counters.get("tasks.abandoned", {}).get(ALL_LABELS, 0),
+        ))
+        # Translators: Heading in the diagnostics report.
+        lines += ["", _("--- yt-dlp extraction by operation ---")]
+        lines += self._timing_lines(histograms, "ytdlp.extract")
+        # Translators: Extraction worker figures in the diagnostics report.
+        lines.append(_("Extraction worker processes: {running}, started: {starts}, crashed: {crashes}, extractions run in NVDA instead: {fallbacks}").format(
+            running=self.core._extraction_service.worker_count(),
+            starts=counters.get("extraction.worker_starts", {}).get(ALL_LABELS, 0),
+            crashes=counters.get("extraction.worker_crashes", {}).get(ALL_LABELS, 0),
+            fallbacks=counters.get("extraction.fallbacks", {}).get(ALL_LABELS, 0),
+        ))
+        # Translators: Heading in the diagnostics report.
+        lines += ["", _("--- Network ---")]
+        # Translators: Network counters in the diagnostics report.
+        lines.append(_("Retries: {retries}, failures after retrying: {failures}, circuit breaker trips: {trips}").format(
+            retries=counters.get("network.retries", {}).get(ALL_LABELS, 0),
+            failures=counters.get("network.failures", {}).get(ALL_LABELS, 0),
+            trips=counters.get("network.circuit_breaker_trips", {}).get(ALL_LABELS, 0),
+        ))
+        # Translators: The circuit breaker state in the diagnostics report (closed, open or half-open).
+        lines.append(_("YouTube circuit breaker: {state}").format(state=youtube_circuit_breaker.state))
+        # Translators: Connectivity figures in the diagnostics report. {mode} is online or offline.
+        lines.append(_("Connection: {mode}, switches to offline mode: {switches}, commands refused while offline: {refused}").format(
+            # Translators: Connection modes in the diagnostics report.
+            mode=_("offline") if connectivity.is_offline else _("online"),
+            switches=counters.get("connectivity.switches", {}).get("offline", 0),
+            refused=counters.get("connectivity.refused_tasks", {}).get(ALL_LABELS, 0),
+        ))
+        # Translators: Heading in the diagnostics report.
+        lines += ["", _("--- Cache hit rates ---")]
+        hits = counters.get("cache.hit", {})
+        misses = counters.get("cache.miss", {})
+        cache_names = sorted((set(hits) | set(misses)) - {ALL_LABELS})
+        for cache_name in cache_names:
+            total = hits.get(cache_name, 0) + misses.get(cache_name, 0)
+            # Translators: A cache line in the diagnostics report.
+            lines.append(_("{cache}: {percent:.0f}% of {total} lookups").format(
+                cache=cache_name, percent=100 * hits.get(cache_name, 0) / total if total else 0, total=total
+            ))
+        if not cache_names:
+            lines.append(_("No data yet."))
+        # Translators: Single-flight counter in the diagnostics report.
+        lines.append(_("Requests that joined an identical one in flight: {count}").format(
+            count=counters.get("single_flight.joined", {}).get(ALL_LABELS, 0)))
+        # Translators: Heading in the diagnostics report.
+        lines += ["", _("--- Database queries ---")]
+        lines += self._timing_lines(histograms, "db.query")
+        # Translators: Database connection counter in the diagnostics report.
+        lines.append(_("Connections opened: {count}").format(
+            count=counters.get("db.connections", {}).get(ALL_LABELS, 0)))
+        # Translators: Heading in the diagnostics report.
+        lines += ["", _("--- Subscription feed ---")]
+        feed_update = histograms.get("feed.update", {}).get(ALL_LABELS)
+        if feed_update:
+            # Translators: Label of the whole feed update timing in the diagnostics report.
+            lines.append(self._format_timing(_("Feed updates"), feed_update))
+        # Translators: Feed counters in the diagnostics report.
+        lines.append(_("New videos found: {new}, unchanged channel feeds skipped: {unchanged}").format(
+            new=counters.get("feed.new_videos", {}).get(ALL_LABELS, 0),
+            unchanged=counters.get("feed.unchanged", {}).get(ALL_LABELS, 0),
+        ))
+        # Translators: Sub-heading in the diagnostics report. {count} is a number of channels.
+        lines.append(_("Slowest {count} channels:").format(count=self.TOP_COUNT))
+        lines += self._timing_lines(histograms, "feed.refresh_channel", slowest_first=True, limit=self.TOP_COUNT)
+        # Translators: Heading in the diagnostics report.
+        lines += ["", _("--- User interface ---")]
+        queue_delay = histograms.get("callbacks.queue_delay", {}).get(ALL_LABELS)
+        if queue_delay:
+            # Translators: Label of the callback queue delay timing in the diagnostics report.
+            lines.append(self._format_timing(_("Wait before callbacks ran"), queue_delay))
+        lines += self._timing_lines(histograms, "dialog.build")
+        # Translators: Sub-heading in the diagnostics report. {count} is a number of callback handlers.
+        lines.append(_("Slowest {count} callback handlers:").format(count=self.TOP_COUNT))
+        lines += self._timing_lines(histograms, "callbacks.handler", slowest_first=True, limit=self.TOP_COUNT)
+        # Translators: Sub-heading in the diagnostics report, followed by one line per event topic.
+        lines.append(_("Registered callbacks per topic:"))
+        for topic, count in sorted(self.core.callback_subscriber_counts().items()):
+            lines.append(f"{topic}: {count}")
+        # Translators: Counter in the diagnostics report.
+        lines.append(_("Callbacks of closed windows removed: {count}").format(
+            count=counters.get("callbacks.pruned", {}).get(ALL_LABELS, 0)))
+        # Translators: Heading in the diagnostics report.
+        lines += ["", _("--- GUI thread responsiveness ---")]
+        latency = histograms.get("ui.latency", {}).get(ALL_LABELS)
+        if latency:
+            # Translators: Label of the GUI thread latency timing in the diagnostics report.
+            lines.append(self._format_timing(_("Delay before a queued call ran"), latency))
+        # Translators: Counter in the diagnostics report.
+        lines.append(_("Stalls: {count}").format(count=counters.get("ui.stalls", {}).get(ALL_LABELS, 0)))
+        # Translators: Sub-heading in the diagnostics report, followed by the GUI code that was running during stalls.
+        lines.append(_("Running on the GUI thread during the longest stalls ({none} means NVDA or another add-on):").format(none=NO_ACTIVITY_LABEL))
+        lines += self._timing_lines(histograms, "ui.stall", slowest_first=True, limit=self.TOP_COUNT)
+        # Translators: Sub-heading in the diagnostics report, followed by the background tasks that ran during stalls.
+        lines.append(_("Add-on tasks running during stalls:"))
+        lines += self._timing_lines(histograms, "ui.stall_task", slowest_first=True, limit=self.TOP_COUNT)
+        return "\n".join(lines)
+
 class MessagesListCtrl(wx.ListCtrl, listmix.ListCtrlAutoWidthMixin):
     def __init__(self, parent):
         wx.ListCtrl.__init__(self, parent, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.BORDER_SUNKEN)
@@ -473,6 +731,7 @@ class MessagesDialog(wx.Dialog):
             self.messages = self.messages[-message_limit:]
         self.refreshMessages()
 
+    @ui_probe.tracked()
     def updateList(self):
         selected_index = self.messagesListBox.GetFirstSelected()
         if selected_index != -1 and selected_index < len(self.filteredMessages):
@@ -960,7 +1219,7 @@ class VideoActionMixin:
         url = f"https://youtube.com/watch?v={video_id}"
         # Translators: Status message shown when the add-on starts fetching subtitle information.
         ui.message(_("Getting subtitle info..."))
-        threading.Thread(target=self.core._subtitle_worker, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core._subtitle_worker, args=(url,), kwargs={'cancel_token': _owner_cancel_token(self)})
 
     def on_show_chapters(self, event):
         """Handles showing the chapters/timestamps dialog for the selected video."""
@@ -973,7 +1232,7 @@ class VideoActionMixin:
         url = f"https://youtube.com/watch?v={video_id}"
         # Translators: Status message when fetching chapters.
         ui.message(_("Getting chapters..."))
-        threading.Thread(target=self.core._show_chapters_worker, args=(url, ), daemon=True).start()
+        self.core.tasks.submit(self.core._show_chapters_worker, args=(url, ), kwargs={'cancel_token': _owner_cancel_token(self)})
         
     def on_add_to_fav_video(self, event):
         video = self.get_selected_video_info()
@@ -983,7 +1242,7 @@ class VideoActionMixin:
             ui.message(_("Could not get video ID to add to favorites."))
             return
         url = f"https://www.youtube.com/watch?v={video_id}"
-        threading.Thread(target=self.core.add_item_to_favorites_worker, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core.add_item_to_favorites_worker, args=(url,))
 
     def on_add_to_fav_channel(self, event):
         video = self.get_selected_video_info()
@@ -993,7 +1252,7 @@ class VideoActionMixin:
             ui.message(_("Could not get video ID to find the channel."))
             return
         url = f"https://www.youtube.com/watch?v={video_id}"
-        threading.Thread(target=self.core.add_channel_to_favorites_worker, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core.add_channel_to_favorites_worker, args=(url,))
 
     def on_add_to_watchlist(self, event):
         class_name = self.__class__.__name__
@@ -1014,12 +1273,11 @@ class VideoActionMixin:
         video_id = video_to_mark.get('video_id') or video_to_mark.get('id')
         if not video_id: return
         url = f"https://www.youtube.com/watch?v={video_id}"
-        threading.Thread(
-            target=self.core.add_to_watchlist_worker, 
-            args=(url,), 
-            kwargs={'mark_seen': is_actually_sub_dialog}, 
-            daemon=True
-        ).start()
+        self.core.tasks.submit(
+            self.core.add_to_watchlist_worker,
+            args=(url,),
+            kwargs={'mark_seen': is_actually_sub_dialog},
+        )
         
     def on_view_info(self, event):
         video = self.get_selected_video_info()
@@ -1029,7 +1287,7 @@ class VideoActionMixin:
             # Translators: Error message.
             return ui.message(_("Video ID not found."))
         url = f"https://youtube.com/watch?v={video_id}"
-        threading.Thread(target=self.core._get_info_worker, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core._get_info_worker, args=(url,), kwargs={'cancel_token': _owner_cancel_token(self)})
 
     def on_view_comments(self, event):
         video = self.get_selected_video_info()
@@ -1041,7 +1299,7 @@ class VideoActionMixin:
         url = f"https://youtube.com/watch?v={video_id}"
         # Translators: Message shown while fetching comments for a specific video title.
         #ui.message(_("Getting data for '{title}'...").format(title=video.get('title')))
-        threading.Thread(target=self.core.get_data_for_url, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core.get_data_for_url, args=(url,), kwargs={'cancel_token': _owner_cancel_token(self)})
 
     def on_download_video(self, event):
         video = self.get_selected_video_info()
@@ -1053,7 +1311,7 @@ class VideoActionMixin:
         url = f"https://youtube.com/watch?v={video_id}"
         dlg = DownloadProgressDialog(gui.mainFrame, self.core)
         dlg.Show()
-        threading.Thread(target=self.core._direct_download_worker, args=(url, 'video'), daemon=True).start()
+        self.core.tasks.submit(self.core._direct_download_worker, args=(url, 'video'), category=CATEGORY_DOWNLOAD)
 
     def on_download_audio(self, event):
         video = self.get_selected_video_info()
@@ -1065,7 +1323,7 @@ class VideoActionMixin:
         url = f"https://youtube.com/watch?v={video_id}"
         dlg = DownloadProgressDialog(gui.mainFrame, self.core)
         dlg.Show()
-        threading.Thread(target=self.core._direct_download_worker, args=(url, 'audio'), daemon=True).start()
+        self.core.tasks.submit(self.core._direct_download_worker, args=(url, 'audio'), category=CATEGORY_DOWNLOAD)
 
     def on_open_channel(self, event):
         video = self.get_selected_video_info()
@@ -1148,8 +1406,9 @@ class VideoActionMixin:
             'base_channel_url': channel_url,
             'base_channel_name': channel_name,
             'is_collection': is_collection,
+            'cancel_token': _owner_cancel_token(self),
         }
-        threading.Thread(target=self.core._view_channel_worker, kwargs=thread_kwargs, daemon=True).start()
+        self.core.tasks.submit(self.core._view_channel_worker, kwargs=thread_kwargs)
         
     def handle_video_list_keys(self, event):
         """
@@ -1831,7 +2090,7 @@ class BaseVideoListPanel(wx.Panel, VideoActionMixin):
         except Exception:
             ui.message(_("Could not read from clipboard."))
             return
-        threading.Thread(target=self._add_worker(), args=(url,), daemon=True).start()
+        self.core.tasks.submit(self._add_worker(), args=(url,))
 
     def on_remove(self, event):
         selected_items = self._get_selected_items()
@@ -2349,7 +2608,7 @@ class FavChannelPanel(wx.Panel):
             # Translators: Error message when the clipboard cannot be read.
             ui.message(_("Could not read from clipboard."))
             return
-        threading.Thread(target=self.core.add_channel_to_favorites_worker, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core.add_channel_to_favorites_worker, args=(url,))
 
     def _load_channel(self):
         with self.core._fav_file_lock:
@@ -2491,8 +2750,9 @@ class FavChannelPanel(wx.Panel):
                 'base_channel_url': channel_url,
                 'base_channel_name': channel_name,
                 'is_collection': is_collection,
+                'cancel_token': _owner_cancel_token(self),
             }
-            threading.Thread(target=self.core._view_channel_worker, kwargs=thread_kwargs, daemon=True).start()
+            self.core.tasks.submit(self.core._view_channel_worker, kwargs=thread_kwargs)
         menu.Bind(wx.EVT_MENU, on_menu_select)
         self.PopupMenu(menu)
         menu.Destroy()
@@ -2910,7 +3170,7 @@ class FavPlaylistPanel(wx.Panel):
             # Translators: Error message when the clipboard is inaccessible.
             ui.message(_("Could not read from clipboard."))
             return
-        threading.Thread(target=self.core.add_playlist_to_favorites_worker, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core.add_playlist_to_favorites_worker, args=(url,))
 
     def on_search(self, search_text):
         search_text = search_text.lower()
@@ -2962,7 +3222,7 @@ class FavPlaylistPanel(wx.Panel):
         playlist = self.filtered_playlists[selected_index]
         # Translators: Message shown while fetching videos from a playlist. {playlist} is the playlist title.
         dialog_title_template = _("Fetching videos from '{playlist}'...").format(playlist=playlist['playlist_title'])
-        threading.Thread(target=self.core._view_channel_worker, args=(playlist['playlist_url'], dialog_title_template), daemon=True).start()
+        self.core.tasks.submit(self.core._view_channel_worker, args=(playlist['playlist_url'], dialog_title_template), kwargs={'cancel_token': _owner_cancel_token(self)})
         
     def on_open_web(self, event):
         selected_index = self.listCtrl.GetFirstSelected()
@@ -3544,11 +3804,10 @@ class SearchHistoryPanel(wx.Panel):
         count   = item.get('result_count', config.conf["YoutubePlus"].get("searchResultCount", 20))
         if not keyword:
             return
-        threading.Thread(
-            target=self.core._Youtube_worker,
+        self.core.tasks.submit(
+            self.core._Youtube_worker,
             args=(keyword, count, gui.mainFrame),
-            daemon=True
-        ).start()
+        )
 
     def on_search(self, search_text):
         """Filter history list by keyword."""
@@ -3677,9 +3936,7 @@ class SearchDialog(BaseDialogMixin, wx.Dialog):
             ui.message(_("Please enter a search term."))
             return
         config.conf["YoutubePlus"]["searchResultCount"] = count
-        threading.Thread(target=self.core._Youtube_worker,
-                         args=(query, count, self),
-                         daemon=True).start()
+        self.core.tasks.submit(self.core._Youtube_worker, args=(query, count, self), kwargs={'cancel_token': self.cancel_token})
 
 class ChannelVideoDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
     """A dialog to display a list of videos, now with a full action menu."""
@@ -3772,11 +4029,11 @@ class ChannelVideoDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
     
     def on_close(self, event):
         if self.playlist_id_to_update and self.new_count_to_update is not None:
-            threading.Thread(
-                target=self.core._update_playlist_count_worker,
+            self.core.tasks.submit(
+                self.core._update_playlist_count_worker,
                 args=(self.playlist_id_to_update, self.new_count_to_update),
-                daemon=True
-            ).start()
+                category=CATEGORY_DISK,
+            )
         self.Destroy()
         
     def _populate_list(self):
@@ -3802,7 +4059,7 @@ class ChannelVideoDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
             'load_all': True,
         }
         self.Destroy()
-        threading.Thread(target=self.core._view_channel_worker, kwargs=thread_kwargs, daemon=True).start()     
+        self.core.tasks.submit(self.core._view_channel_worker, kwargs=thread_kwargs)     
      
 class ChannelCollectionDialog(BaseDialogMixin, wx.Dialog):
     """
@@ -3908,11 +4165,10 @@ class ChannelCollectionDialog(BaseDialogMixin, wx.Dialog):
             return
         # Translators: Status shown while fetching videos from a playlist. {title} is the playlist name.
         title_template = _("Fetching videos from '{title}'...").format(title=item.get('title', ''))
-        threading.Thread(
-            target=self.core._view_channel_worker,
+        self.core.tasks.submit(
+            self.core._view_channel_worker,
             args=(playlist_url, title_template),
-            daemon=True
-        ).start()
+        )
 
     def on_open_web(self, event):
         item = self._get_selected()
@@ -3965,7 +4221,7 @@ class ChannelCollectionDialog(BaseDialogMixin, wx.Dialog):
             'is_collection': True,
         }
         self.Destroy()
-        threading.Thread(target=self.core._view_channel_worker, kwargs=thread_kwargs, daemon=True).start()
+        self.core.tasks.submit(self.core._view_channel_worker, kwargs=thread_kwargs)
 
     def on_add_to_favorites(self, event):
         item = self._get_selected()
@@ -3975,11 +4231,10 @@ class ChannelCollectionDialog(BaseDialogMixin, wx.Dialog):
         if not url:
             ui.message(_("Playlist URL not found."))
             return
-        threading.Thread(
-            target=self.core.add_playlist_to_favorites_worker,
+        self.core.tasks.submit(
+            self.core.add_playlist_to_favorites_worker,
             args=(url,),
-            daemon=True
-        ).start()
+        )
 
 class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
     """
@@ -4002,7 +4257,7 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
         self.__class__._instance = self
 
         self.core = core_instance
-        self.db_path = self.core.get_profile_path("subscription.db")
+        self.db = self.core.subscription_db
         self.all_channels = []
         self.categories = []
         self._current_channel_url = None   # track ช่องที่ถูก load ใน right panel
@@ -4104,7 +4359,7 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
             return True
         channel_url = self._current_channel_url
         try:
-            with sqlite3.connect(self.db_path) as con:
+            with self.db.transaction() as con:
                 cur = con.cursor()
                 cur.execute("DELETE FROM channel_category_links WHERE channel_url = ?", (channel_url,))
                 for index in self.categoryCheckList.CheckedItems:
@@ -4119,7 +4374,7 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
                     "UPDATE subscribed_channels SET content_types = ? WHERE channel_url = ?",
                     (",".join(types_to_save), channel_url)
                 )
-                con.commit()
+            self.core.category_index.invalidate()
             self._dirty = False
             # Translators: Brief announcement after auto-saving channel settings.
             ui.message(_("Changes saved."))
@@ -4141,7 +4396,7 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
     def _load_all_data(self):
         """Loads all channels and categories from the database."""
         try:
-            with sqlite3.connect(self.db_path) as con:
+            with self.db.connection() as con:
                 cur = con.cursor()
                 cur.execute("SELECT channel_url, channel_name FROM subscribed_channels ORDER BY channel_name COLLATE NOCASE")
                 self.all_channels = cur.fetchall()
@@ -4170,14 +4425,9 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
         else:
             cat_id = self.categoryFilterCombo.GetClientData(filter_selection)
             try:
-                with sqlite3.connect(self.db_path) as con:
-                    cur = con.cursor()
-                    cur.execute("""
-                        SELECT sc.channel_url, sc.channel_name FROM subscribed_channels sc
-                        JOIN channel_category_links ccl ON sc.channel_url = ccl.channel_url
-                        WHERE ccl.category_id = ? ORDER BY sc.channel_name COLLATE NOCASE
-                    """, (cat_id,))
-                    channels_to_show = cur.fetchall()
+                channel_urls = self.core.category_index.channels_in(cat_id)
+                # all_channels is already sorted by name.
+                channels_to_show = [channel for channel in self.all_channels if channel[0] in channel_urls]
             except Exception as e:
                 log.error("Failed to filter channels by category: %s", e)
         new_selection_index = -1
@@ -4230,12 +4480,9 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
         self._current_channel_url = channel_url
         self._dirty = False   # reset หลังโหลดข้อมูลใหม่
         try:
-            with sqlite3.connect(self.db_path) as con:
-                cur = con.cursor()
-                cur.execute("SELECT category_id FROM channel_category_links WHERE channel_url = ?", (channel_url,))
-                assigned_cat_ids = {row[0] for row in cur.fetchall()}
-                cur.execute("SELECT content_types FROM subscribed_channels WHERE channel_url = ?", (channel_url,))
-                content_types_str = cur.fetchone()[0]
+            assigned_cat_ids = self.core.category_index.categories_of(channel_url)
+            with self.db.connection() as con:
+                content_types_str = con.execute("SELECT content_types FROM subscribed_channels WHERE channel_url = ?", (channel_url,)).fetchone()[0]
             self.categoryCheckList.Set([cat[1] for cat in self.categories])
             self.categoryCheckList.CheckedItems = [
                 i for i, (cat_id, _) in enumerate(self.categories) if cat_id in assigned_cat_ids
@@ -4299,8 +4546,9 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
                 'base_channel_url': channel_url,
                 'base_channel_name': channel_name,
                 'is_collection': is_collection,
+                'cancel_token': _owner_cancel_token(self),
             }
-            threading.Thread(target=self.core._view_channel_worker, kwargs=thread_kwargs, daemon=True).start()
+            self.core.tasks.submit(self.core._view_channel_worker, kwargs=thread_kwargs)
         menu.Bind(wx.EVT_MENU, on_menu_select)
         self.PopupMenu(menu)
         menu.Destroy()
@@ -4315,7 +4563,7 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
             # Translators: Error message when clipboard access fails.
             ui.message(_("Could not read from clipboard."))
             return
-        threading.Thread(target=self.core.subscribe_to_channel_worker, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core.subscribe_to_channel_worker, args=(url,))
 
     def on_unsubscribe(self, event):
         selected_index = self.channelListCtrl.GetFirstSelected()
@@ -4329,7 +4577,7 @@ class ManageSubscriptionsDialog(BaseDialogMixin, wx.Dialog):
         confirm_title = _("Confirm Unsubscribe")
         if wx.MessageBox(msg_template.format(name=channel_name), confirm_title, wx.YES_NO | wx.ICON_QUESTION) != wx.YES:
             return
-        threading.Thread(target=self.core.unsubscribe_from_channel_worker, args=(channel_url, channel_name), daemon=True).start()
+        self.core.tasks.submit(self.core.unsubscribe_from_channel_worker, args=(channel_url, channel_name), category=CATEGORY_DB)
 
 
 class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
@@ -4351,8 +4599,7 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         super().__init__(parent, title=_("Subscription Feed"))
         self.__class__._instance = self # Register the new instance
         self.core = core_instance
-        self.db_path = self.core.get_profile_path("subscription.db")
-        self.all_videos = []
+        self.db = self.core.subscription_db
         self.user_categories = []
         self.tab_order = []
         self.view_mode = "unseen" # unseen or all
@@ -4414,6 +4661,9 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         for i in range(self.notebook.GetPageCount()):
             page = self.notebook.GetPage(i)
             if hasattr(page, 'listCtrl') and hasattr(page, 'tab_id'):
+                if not page.populated:
+                    positions[str(page.tab_id)] = page.pending_position
+                    continue
                 idx = page.listCtrl.GetFirstSelected()
                 positions[str(page.tab_id)] = idx if idx != -1 else 0
         return positions
@@ -4433,25 +4683,15 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
             deleted_video_id=deleted_id
         )
         
+    @metrics.timed("dialog.build")
+    @ui_probe.tracked()
     def _build_all_tabs(self, select_tab_id=None, saved_positions=None, deleted_video_id=None):
         try:
-            con = sqlite3.connect(self.db_path)
-            cur = con.cursor()
-            sort_order = config.conf["YoutubePlus"].get("sortOrder", "newest")
-            order_by_clause = "ORDER BY v.id DESC" if sort_order == 'newest' else "ORDER BY v.id ASC"
-            sql_query = ""
-            if self.view_mode == "unseen":
-                sql_query = f"SELECT v.video_id, v.channel_name, v.title, v.duration_str, v.channel_url, v.upload_date, v.content_type FROM videos v WHERE v.video_id NOT IN (SELECT video_id FROM seen_videos) {order_by_clause}"
-            else:
-                sql_query = f"SELECT v.video_id, v.channel_name, v.title, v.duration_str, v.channel_url, v.upload_date, v.content_type FROM videos v {order_by_clause}"
-            cur.execute(sql_query)
-            self.all_videos = [{'id': r[0], 'channel_name': r[1], 'title': r[2], 'duration_str': r[3], 'channel_url': r[4], 'upload_date': r[5], 'content_type': r[6]} for r in cur.fetchall()]
-            cur.execute("SELECT id, name FROM categories ORDER BY position ASC")
-            self.user_categories = cur.fetchall()
-            con.close()
+            with self.db.connection() as con:
+                self.user_categories = con.execute("SELECT id, name FROM categories ORDER BY position ASC").fetchall()
         except Exception as e:
             log.error("Failed to load data for SubDialog: %s", e)
-            self.all_videos, self.user_categories = [], []
+            self.user_categories = []
         # Translators: Default tab names for different types of content.
         fixed_tabs = [
             {'id': 'all', 'name': _("All")},
@@ -4485,6 +4725,7 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
                 break
         self.notebook.SetSelection(initial_selection)
         if self.notebook.GetPageCount() > 0:
+            self._ensure_populated(self.notebook.GetCurrentPage())
             self._update_dialog_title()
             self.notebook.GetCurrentPage().SetFocus()
         self.pending_focus_info = None  
@@ -4503,15 +4744,13 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         try:
             new_order_ids = [str(tab['id']) for tab in self.tab_order]
             config.conf["YoutubePlus"]["subTabOrder"] = ",".join(new_order_ids)
-            with sqlite3.connect(self.db_path) as con:
+            with self.db.transaction() as con:
                 cur = con.cursor()
-                cur.execute("BEGIN TRANSACTION")
                 user_cat_pos = 0
                 for tab_info in self.tab_order:
                     if isinstance(tab_info['id'], int):
                         cur.execute("UPDATE categories SET position = ? WHERE id = ?", (user_cat_pos, tab_info['id']))
                         user_cat_pos += 1
-                con.commit()
             wx.CallAfter(self._build_all_tabs, select_tab_id=current_tab_info['id'])
         except Exception as e:
             log.error("Failed to reorder tabs: %s", e)
@@ -4525,6 +4764,7 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         """
         new_tab_index = event.GetSelection()
         new_tab_title = self.notebook.GetPageText(new_tab_index)
+        self._ensure_populated(self.notebook.GetPage(new_tab_index))
         self._update_dialog_title()
         ui.message(new_tab_title)
         currentPage = self.notebook.GetCurrentPage()
@@ -4547,7 +4787,7 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
     def _create_tab_panel(self, tab_id, saved_position=0, deleted_video_id=None):
         panel = wx.Panel(self.notebook)
         sizer = wx.BoxSizer(wx.VERTICAL)
-        listCtrl = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        listCtrl = VirtualFeedListCtrl(panel, self._video_column_text)
         # Translators: Column headers for the video list.
         listCtrl.InsertColumn(0, _("Video Title"), width=350)
         # Translators: Header for the content type column (Video, Short, or Live).
@@ -4579,65 +4819,77 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         listCtrl.Bind(wx.EVT_CONTEXT_MENU, self._on_list_right_click)
         listCtrl.Bind(wx.EVT_LIST_ITEM_SELECTED, lambda e, p=panel: self._update_tab_button_states(p))
         listCtrl.Bind(wx.EVT_LIST_ITEM_DESELECTED, lambda e, p=panel: self._update_tab_button_states(p))
-        self._populate_list_for_panel(panel, saved_position=saved_position, deleted_video_id=deleted_video_id)
+        # The list is filled when the tab is first shown; see _ensure_populated.
+        panel.populated = False
+        panel.pending_position, panel.pending_deleted_video_id = saved_position, deleted_video_id
+        self._update_tab_button_states(panel)
         return panel
 
+    def _ensure_populated(self, panel):
+        """Fills a tab's list the first time the tab is shown."""
+        if panel is None or panel.populated:
+            return
+        panel.populated = True
+        self._populate_list_for_panel(panel, saved_position=panel.pending_position, deleted_video_id=panel.pending_deleted_video_id)
+
+    def _tab_filter(self, tab_id):
+        """
+        Returns the SQL conditions and parameters selecting a tab's videos in the current view mode.
+        Each combination is served by one of the videos indexes, partial ones for unseen videos.
+        """
+        conditions, params = [], []
+        if tab_id in ("videos", "shorts", "streams"):
+            conditions.append("v.content_type = ?")
+            params.append(tab_id)
+        elif tab_id != "all":
+            # A subquery served by the links' category index, rather than one parameter per channel.
+            conditions.append("v.channel_url IN (SELECT channel_url FROM channel_category_links WHERE category_id = ?)")
+            params.append(tab_id)
+        if self.view_mode == "unseen":
+            conditions.append("v.seen = 0")
+        return conditions, params
+
+    @staticmethod
+    def _newest_first():
+        return config.conf["YoutubePlus"].get("sortOrder", "newest") == 'newest'
+
+    def _video_column_text(self, video, column):
+        """Returns the text of a cell of a feed list."""
+        if column == 0:
+            # Translators: Default text for missing video information.
+            return video.get('title') or _("N/A")
+        if column == 1:
+            # Translators: Map for content type display names.
+            type_map = {
+                "videos": _("Video"),
+                "shorts": _("Shorts"),
+                "streams": _("Live")
+            }
+            return type_map.get(video.get('content_type') or 'videos', _("Video"))
+        if column == 2:
+            return video.get('channel_name') or 'N/A'
+        return video.get('duration_str') or 'N/A'
+
     def _populate_list_for_panel(self, panel, saved_position=0, deleted_video_id=None):
         tab_id = panel.tab_id
-        videos_to_show = []
-        if tab_id == "all":
-            videos_to_show = self.all_videos
-        elif tab_id in ["videos", "shorts", "streams"]:
-            videos_to_show = [v for v in self.all_videos if v.get('content_type') == tab_id]
-        else:
-            try:
-                con = sqlite3.connect(self.db_path)
-                cur = con.cursor()
-                cur.execute("SELECT channel_url FROM channel_category_links WHERE category_id = ?", (tab_id,))
-                channel_urls = {row[0] for row in cur.fetchall()}
-                con.close()
-                videos_to_show = [v for v in self.all_videos if v.get('channel_url') in channel_urls]
-            except Exception as e:
-                log.error("Failed to filter videos for category %s: %s", tab_id, e)
-        
-        panel.listCtrl.DeleteAllItems()
-        panel.videos = videos_to_show
-        # Translators: Map for content type display names.
-        type_map = {
-            "videos": _("Video"),
-            "shorts": _("Shorts"),
-            "streams": _("Live")
-        }
-        for index, video in enumerate(videos_to_show):
-            # Translators: Default text for missing video information.
-            na_text = _("N/A")
-            panel.listCtrl.InsertItem(index, video.get('title', na_text))
-            content_type = video.get('content_type', 'videos')
-            display_type = type_map.get(content_type, _("Video"))
-            panel.listCtrl.SetItem(index, 1, display_type)
-            panel.listCtrl.SetItem(index, 2, video.get('channel_name', 'N/A'))
-            panel.listCtrl.SetItem(index, 3, video.get('duration_str', 'N/A'))
+        conditions, params = self._tab_filter(tab_id)
+        pager = FeedPager(self.db, conditions, params, self._newest_first())
+        try:
+            panel.listCtrl.set_pager(pager)
+        except Exception as e:
+            log.error("Failed to load videos for tab %s: %s", tab_id, e)
+            panel.listCtrl.SetItemCount(0)
         item_count = panel.listCtrl.GetItemCount()
         if item_count > 0:
-            focus_index = 0
+            focus_index = None
             if deleted_video_id:
-                remaining_ids = [v.get('id') for v in videos_to_show]
-                all_ids = [v.get('id') for v in self.all_videos]
                 try:
-                    deleted_pos = all_ids.index(deleted_video_id)
-                    for next_id in all_ids[deleted_pos + 1:]:
-                        if next_id in remaining_ids:
-                            focus_index = remaining_ids.index(next_id)
-                            break
-                    else:
-                        for prev_id in reversed(all_ids[:deleted_pos]):
-                            if prev_id in remaining_ids:
-                                focus_index = remaining_ids.index(prev_id)
-                                break
-                except ValueError:
-                    focus_index = min(saved_position, item_count - 1)
-            else:
-                focus_index = min(saved_position, item_count - 1)
+                    focus_index = pager.position_after(deleted_video_id)
+                except Exception as e:
+                    log.error("Failed to locate the video after %s: %s", deleted_video_id, e)
+            if focus_index is None:
+                focus_index = saved_position
+            focus_index = min(focus_index, item_count - 1)
 
             panel.listCtrl.SetItemState(
                 focus_index,
@@ -4659,7 +4911,7 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         listCtrl = currentPage.listCtrl
         selected_index = listCtrl.GetFirstSelected()
         if selected_index == -1: return None
-        return currentPage.videos[selected_index]
+        return listCtrl.get_video(selected_index)
 
     def _on_list_right_click(self, event):
         video = self.get_selected_video_info()
@@ -4711,7 +4963,7 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
             # Translators: Error message when system clipboard cannot be accessed.
             ui.message(_("Could not read from clipboard."))
             return
-        threading.Thread(target=self.core.subscribe_to_channel_worker, args=(url,), daemon=True).start()
+        self.core.tasks.submit(self.core.subscribe_to_channel_worker, args=(url,))
 
     def on_more_menu(self, event):
             """Shows the 'More...' menu with added category management and pruning options."""
@@ -4771,38 +5023,33 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         wx.CallAfter(self.notebook.GetCurrentPage().SetFocus)
         
     def on_update_feed(self, event):
-        if self.core.is_long_task_running:
+        if self.core.is_feed_update_running:
             # Translators: Message shown when an update is already happening.
             ui.message(_("An update is already in progress."))
             return
-        threading.Thread(target=self._show_progress_and_update_worker, daemon=True).start()
-    
-    def _show_progress_and_update_worker(self):
         try:
-            con = sqlite3.connect(self.db_path)
-            cur = con.cursor()
-            cur.execute("SELECT content_types FROM subscribed_channels")
-            subscribed_channels_types = cur.fetchall()
+            with self.db.connection() as con:
+                subscribed_channels_types = con.execute("SELECT content_types FROM subscribed_channels").fetchall()
             channel_count = len(subscribed_channels_types)
             total_tasks = sum(len(c[0].split(',')) for c in subscribed_channels_types if c[0])
-            con.close()
         except Exception:
             total_tasks, channel_count = 1, 0
-
-        def create_and_run():
-            # Translators: Title of the progress dialog during update. {count} is number of channels.
-            title = _("Updating Feed ({count} channels)").format(count=channel_count)
-            # Translators: Initial status message in the progress dialog.
-            status = _("Starting...")
-            self.progress_dialog = wx.ProgressDialog(
-                title, status,
-                maximum=total_tasks if total_tasks > 0 else 1,
-                parent=self,
-                style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE | wx.PD_ELAPSED_TIME | wx.PD_REMAINING_TIME | wx.PD_CAN_ABORT
-            )
-            self.progress_dialog.Show()
-            threading.Thread(target=self.core._update_subscription_feed_worker, args=("sub_feed_progress",), daemon=True).start()
-        wx.CallAfter(create_and_run)
+        # Translators: Title of the progress dialog during update. {count} is number of channels.
+        title = _("Updating Feed ({count} channels)").format(count=channel_count)
+        # Translators: Initial status message in the progress dialog.
+        status = _("Starting...")
+        self.progress_dialog = wx.ProgressDialog(
+            title, status,
+            maximum=total_tasks if total_tasks > 0 else 1,
+            parent=self,
+            style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE | wx.PD_ELAPSED_TIME | wx.PD_REMAINING_TIME | wx.PD_CAN_ABORT
+        )
+        self.progress_dialog.Show()
+        # Submitted from the GUI thread right after the check above, so an auto-update tick cannot start in between.
+        task = self.core.tasks.submit(self.core._update_subscription_feed_worker, args=("sub_feed_progress",), category=CATEGORY_FEED, key=FEED_UPDATE_TASK)
+        if task is None:
+            self.progress_dialog.Destroy()
+            self.progress_dialog = None
 
     def _on_progress_update(self, data):
         if not self.progress_dialog:
@@ -4848,19 +5095,23 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
             
     def on_mark_all_seen(self, event=None):
         currentPage = self.notebook.GetCurrentPage()
-        if not currentPage or not hasattr(currentPage, 'videos'): return
-        videos_in_current_tab = currentPage.videos
-        if not videos_in_current_tab:
+        if not currentPage or not hasattr(currentPage, 'listCtrl'): return
+        video_count = currentPage.listCtrl.GetItemCount()
+        if not video_count:
             # Translators: Message shown when the user tries to mark all as seen in an empty tab.
             ui.message(_("There are no videos in this tab to mark as seen."))
             return
         # Translators: Confirmation prompt. {count} is the number of videos.
-        msg = _("Are you sure you want to mark all {count} videos in this tab as seen?").format(count=len(currentPage.videos))
+        msg = _("Are you sure you want to mark all {count} videos in this tab as seen?").format(count=video_count)
         # Translators: Title of confirmation dialog.
         title = _("Confirm")
         if wx.MessageBox(msg, title, wx.YES_NO | wx.ICON_QUESTION) != wx.YES:
             return
-        video_ids = [v.get('id') for v in videos_in_current_tab if v.get('id')]
+        try:
+            video_ids = currentPage.listCtrl.pager.video_ids()
+        except Exception as e:
+            log.error("Failed to read the videos of the current tab: %s", e)
+            return
         if self.core.mark_videos_as_seen(video_ids):
             # Translators: Success message after marking all videos in a tab as seen.
             self.core._notify_delete(_("All videos in the current tab have been marked as seen."))
@@ -4915,7 +5166,7 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         title = _("Confirm Unsubscribe")
         if wx.MessageBox(msg, title, wx.YES_NO | wx.ICON_QUESTION) != wx.YES:
             return
-        threading.Thread(target=self.core.unsubscribe_from_channel_worker, args=(video['channel_url'], video['channel_name']), daemon=True).start()
+        self.core.tasks.submit(self.core.unsubscribe_from_channel_worker, args=(video['channel_url'], video['channel_name']), category=CATEGORY_DB)
         
     def on_add_category(self):
         """Handles adding a new user-defined category."""
@@ -4928,14 +5179,12 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
                 new_name = dlg.GetValue().strip()
                 if new_name:
                     try:
-                        con = sqlite3.connect(self.db_path)
-                        cur = con.cursor()
-                        cur.execute("SELECT MAX(position) FROM categories")
-                        max_pos = cur.fetchone()[0]
-                        new_pos = (max_pos if max_pos is not None else -1) + 1
-                        cur.execute("INSERT INTO categories (name, position) VALUES (?, ?)", (new_name, new_pos))
-                        con.commit()
-                        con.close()
+                        with self.db.transaction() as con:
+                            cur = con.cursor()
+                            cur.execute("SELECT MAX(position) FROM categories")
+                            max_pos = cur.fetchone()[0]
+                            new_pos = (max_pos if max_pos is not None else -1) + 1
+                            cur.execute("INSERT INTO categories (name, position) VALUES (?, ?)", (new_name, new_pos))
                         self.core._notify_callbacks("subscriptions_updated")
                     except sqlite3.IntegrityError:
                         # Translators: Message when a user tries to create a category that already exists.
@@ -4964,11 +5213,8 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
                 new_name = dlg.GetValue().strip()
                 if new_name and new_name != old_name:
                     try:
-                        con = sqlite3.connect(self.db_path)
-                        cur = con.cursor()
-                        cur.execute("UPDATE categories SET name = ? WHERE id = ?", (new_name, cat_id))
-                        con.commit()
-                        con.close()
+                        with self.db.transaction() as con:
+                            con.execute("UPDATE categories SET name = ? WHERE id = ?", (new_name, cat_id))
                         self.core._notify_callbacks("subscriptions_updated")
                     except sqlite3.IntegrityError:
                         # Translators: Error message shown when the user tries to create a category with a name that is already in the database.
@@ -4995,11 +5241,10 @@ class SubDialog(BaseDialogMixin, VideoActionMixin, wx.Dialog):
         if wx.MessageBox(msg, title, wx.YES_NO | wx.ICON_QUESTION) != wx.YES:
             return
         try:
-            con = sqlite3.connect(self.db_path)
-            cur = con.cursor()
-            cur.execute("DELETE FROM categories WHERE id = ?", (cat_id,))
-            con.commit()
-            con.close()
+            with self.db.transaction() as con:
+                con.execute("DELETE FROM categories WHERE id = ?", (cat_id,))
+                con.execute("DELETE FROM channel_category_links WHERE category_id = ?", (cat_id,))
+            self.core.category_index.invalidate()
             self.core._notify_callbacks("subscriptions_updated")
             # Translators: Success notification. {name} is the deleted category.
             self.core._notify_delete(_("Category '{name}' removed.").format(name=name))
@@ -15,4 +15,21 @@ class HandledError(Exception):
 
 class NetworkRetryError(HandledError):
     """Exception raised when a network operation fails after all retries."""
-    pass
\ No newline at end of file
+    pass
+
+class CircuitOpenError(NetworkRetryError):
+    """Exception raised without contacting the host because its circuit breaker is open."""
+    pass
+
+class OfflineError(NetworkRetryError):
+    """Exception raised without contacting the host because the add-on is in offline mode."""
+    pass
+
+class OperationCancelled(BaseException):
+    """
+    Raised inside a worker once its cancellation token has been cancelled.
+    Like KeyboardInterrupt it derives from BaseException, so the broad
+    `except Exception` handlers in the workers and in yt-dlp let it unwind
+    the worker instead of reporting it as a failure.
+    """
+    pass
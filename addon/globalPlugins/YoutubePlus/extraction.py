@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+# extraction.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+import weakref
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from logHandler import log
+from yt_dlp.utils import DownloadError
+from . import utils
+from .metrics import metrics
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "extraction_worker.py")
+WORKER_LIB_DIR = os.path.join(os.path.dirname(__file__), "lib")
+
+DEFAULT_POOL_SIZE = 2
+STARTUP_TIMEOUT_SECONDS = 30
+# A request taking longer than this once its worker started it is assumed to hang; the worker is killed.
+REQUEST_TIMEOUT_SECONDS = 300
+# After this many workers in a row fail to start, extraction stays in-process until the settings change.
+MAX_START_FAILURES = 3
+
+# Candidates tried in order when no interpreter is configured; NVDA itself has no usable python.exe.
+_INTERPRETER_CANDIDATES = (("pythonw",), ("python",), ("py", "-3"))
+# Only the cookies of these domains are passed to the worker.
+_COOKIE_DOMAINS = ("youtube.com", "google.com", "youtu.be")
+
+class _WorkerUnavailable(Exception):
+    """The request could not be run in a worker process and should run in-process instead."""
+
+class _RemoteHTTPError(Exception):
+    """Stands in for the HTTP error behind a failed extraction in the worker, for the retry logic."""
+
+    def __init__(self, message, status, retry_after):
+        super().__init__(message)
+        self.status = status
+        self.headers = {'Retry-After': retry_after} if retry_after else {}
+
+class _WorkerProcess:
+    """One extraction worker process and the requests waiting for its answers."""
+
+    def __init__(self, command, number):
+        self.number = number
+        self.pending = {}
+        # When the worker started each pending request; requests sent to a busy worker wait their turn.
+        self.started_at = {}
+        # Key of the cookie jar last sent to this worker, the only one it keeps.
+        self.cookie_key = None
+        self.ready = Future()
+        self.stopping = False
+        self._write_lock = threading.Lock()
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding='utf-8',
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0),
+        )
+        threading.Thread(target=self._read_loop, name=f"YoutubePlusExtractionReader-{number}", daemon=True).start()
+
+    @property
+    def alive(self):
+        return self.process.poll() is None and not self.stopping
+
+    def _read_loop(self):
+        try:
+            for line in self.process.stdout:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    log.debug("Ignoring unexpected output of extraction worker %d: %r", self.number, line[:200])
+                    continue
+                if message.get('ready'):
+                    self.ready.set_result(message)
+                    continue
+                if message.get('started'):
+                    self.started_at[message.get('id')] = time.monotonic()
+                    continue
+                self.started_at.pop(message.get('id'), None)
+                future = self.pending.pop(message.get('id'), None)
+                if future is not None:
+                    future.set_result(message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.process.wait()
+            if not self.ready.done():
+                self.ready.set_exception(_WorkerUnavailable(f"exited with code {self.process.returncode} during startup"))
+            with self._write_lock:
+                pending, self.pending = self.pending, {}
+                self.started_at.clear()
+            for future in pending.values():
+                future.set_exception(_WorkerUnavailable(f"exited with code {self.process.returncode}"))
+            if not self.stopping and self.ready.exception() is None:
+                metrics.increment("extraction.worker_crashes")
+                log.warning("Extraction worker %d exited unexpectedly with code %s; it will be restarted on the next request.", self.number, self.process.returncode)
+
+    def _cookie_payload(self, key, cookiejar):
+        """
+        Returns a jar's YouTube cookies if they were not the last sent, otherwise only its key.
+        Called with the write lock held, so the worker receives jars in the order they are referred to.
+        """
+        if cookiejar is None:
+            return None
+        if key == self.cookie_key:
+            return {'key': key}
+        items = [
+            {
+                'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path,
+                'secure': cookie.secure, 'expires': cookie.expires, 'discard': cookie.discard,
+            }
+            for cookie in cookiejar
+            if cookie.domain.lstrip('.').endswith(_COOKIE_DOMAINS)
+        ]
+        self.cookie_key = key
+        return {'key': key, 'items': items}
+
+    def send(self, request_id, request, cookie_key=None, cookiejar=None):
+        future = Future()
+        with self._write_lock:
+            if self.process.poll() is not None:
+                raise _WorkerUnavailable(f"exited with code {self.process.returncode}")
+            request = dict(request, cookies=self._cookie_payload(cookie_key, cookiejar))
+            self.pending[request_id] = future
+            try:
+                self.process.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+                self.process.stdin.flush()
+            except (OSError, ValueError) as e:
+                self.pending.pop(request_id, None)
+                raise _WorkerUnavailable(f"could not send the request: {e}")
+        return future
+
+    def stop(self):
+        self.stopping = True
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=2)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self):
+        self.stopping = True
+        try:
+            self.process.kill()
+        except OSError:
+            pass
+
+class ExtractionService:
+    """
+    Runs yt-dlp extractions in a small pool of separate Python processes, so parsing
+    multi-megabyte pages does not hold NVDA's interpreter lock and make speech stutter.
+    Results come back already trimmed to the fields the add-on uses.
+    Workers are started on demand and restarted after a crash. extract returns None
+    whenever no worker can serve a request, and the caller then extracts in-process.
+    """
+
+    def __init__(self, interpreter_func, pool_size=DEFAULT_POOL_SIZE):
+        """interpreter_func returns the configured Python interpreter, or an empty string to detect one."""
+        self._interpreter_func = interpreter_func
+        self._pool_size = pool_size
+        self._lock = threading.Lock()
+        self._workers = []
+        self._worker_numbers = itertools.count(1)
+        self._request_ids = itertools.count(1)
+        self._start_failures = 0
+        # Cookie jars get an increasing generation as their key, as a replaced jar's id() may be reused.
+        self._cookie_generations = weakref.WeakKeyDictionary()
+        self._next_cookie_generation = itertools.count(1)
+
+    def _resolve_command(self):
+        configured = (self._interpreter_func() or "").strip()
+        if configured:
+            if not os.path.isfile(configured):
+                raise _WorkerUnavailable(f"the configured interpreter {configured} does not exist")
+            return [configured, WORKER_SCRIPT, WORKER_LIB_DIR]
+        for candidate in _INTERPRETER_CANDIDATES:
+            path = shutil.which(candidate[0])
+            if path:
+                return [path, *candidate[1:], WORKER_SCRIPT, WORKER_LIB_DIR]
+        raise _WorkerUnavailable("no Python interpreter was found")
+
+    def _start_worker(self):
+        """Starts a worker and waits for it to load yt-dlp. Called with the lock held."""
+        command = self._resolve_command()
+        worker = _WorkerProcess(command, next(self._worker_numbers))
+        try:
+            hello = worker.ready.result(timeout=STARTUP_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            worker.kill()
+            raise _WorkerUnavailable("did not start in time")
+        log.info("Started extraction worker %d (pid %s, yt-dlp %s).", worker.number, hello.get('pid'), hello.get('version'))
+        metrics.increment("extraction.worker_starts")
+        return worker
+
+    def _acquire_worker(self):
+        """Returns the least busy live worker, starting one while the pool has room."""
+        with self._lock:
+            if self._start_failures >= MAX_START_FAILURES:
+                raise _WorkerUnavailable("workers failed to start repeatedly")
+            self._workers = [worker for worker in self._workers if worker.alive]
+            idle = [worker for worker in self._workers if not worker.pending]
+            if idle:
+                return idle[0]
+            if len(self._workers) < self._pool_size:
+                try:
+                    worker = self._start_worker()
+                except (_WorkerUnavailable, OSError) as e:
+                    self._start_failures += 1
+                    if self._start_failures >= MAX_START_FAILURES:
+                        log.warning(f"Extraction worker could not be started ({e}); extracting in-process from now on.")
+                    raise _WorkerUnavailable(str(e))
+                self._start_failures = 0
+                self._workers.append(worker)
+                return worker
+            return min(self._workers, key=lambda worker: len(worker.pending))
+
+    def _cookie_generation(self, cookiejar):
+        if cookiejar is None:
+            return None
+        with self._lock:
+            generation = self._cookie_generations.get(cookiejar)
+            if generation is None:
+                generation = self._cookie_generations[cookiejar] = next(self._next_cookie_generation)
+            return generation
+
+    def extract(self, operation, url, opts, cookiejar=None, **params):
+        """
+        Runs operation ('video_info' or 'channel_videos') for url in a worker and returns
+        its trimmed result, or None if the caller should extract in-process instead.
+        Failed extractions raise DownloadError as they would in-process.
+        """
+        opts = {key: value for key, value in opts.items() if key != 'logger'}
+        try:
+            json.dumps(opts)
+        except (TypeError, ValueError):
+            # Options with hooks or other callables can only be used in-process.
+            return None
+        started = time.perf_counter()
+        try:
+            worker = self._acquire_worker()
+            request_id = next(self._request_ids)
+            request = {'id': request_id, 'op': operation, 'url': url, 'opts': opts, **params}
+            future = worker.send(request_id, request, self._cookie_generation(cookiejar), cookiejar)
+            response = self._wait(worker, request_id, future)
+        except _WorkerUnavailable as e:
+            metrics.increment("extraction.fallbacks", label=operation)
+            log.debug(f"Extracting {url} in-process: extraction worker unavailable ({e}).")
+            return None
+        metrics.observe("ytdlp.extract", time.perf_counter() - started, label=f"{operation} (worker)")
+        if response.get('ok'):
+            return response['result']
+        message = response.get('message') or ""
+        if response.get('error') != 'DownloadError':
+            metrics.increment("extraction.fallbacks", label=operation)
+            log.warning(f"Extraction worker failed on {url} ({response.get('error')}: {message}); retrying in-process.")
+            return None
+        if response.get('status'):
+            cause = _RemoteHTTPError(message, response['status'], response.get('retry_after'))
+            raise DownloadError(message, exc_info=(type(cause), cause, None))
+        raise DownloadError(message)
+
+    def _wait(self, worker, request_id, future):
+        """
+        Waits for a response, giving up when the caller is cancelled or the worker hangs.
+        The timeout counts from when the worker starts the request, not from when it was
+        queued behind other requests on the same worker.
+        """
+        while True:
+            # A cancelled request's response is simply ignored when it arrives.
+            utils.check_cancelled()
+            try:
+                return future.result(timeout=0.25)
+            except FutureTimeoutError:
+                started_at = worker.started_at.get(request_id)
+                if started_at is not None and time.monotonic() - started_at > REQUEST_TIMEOUT_SECONDS:
+                    log.warning("Extraction worker %d did not answer in %ds; killing it.", worker.number, REQUEST_TIMEOUT_SECONDS)
+                    worker.kill()
+                    raise _WorkerUnavailable("request timed out")
+
+    def worker_count(self):
+        """Returns the number of running worker processes."""
+        with self._lock:
+            return sum(1 for worker in self._workers if worker.alive)
+
+    def shutdown(self):
+        """Stops every worker. Workers start again on the next request, e.g. with new settings."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._start_failures = 0
+        for worker in workers:
+            worker.stop()
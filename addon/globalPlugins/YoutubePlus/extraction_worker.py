@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# extraction_worker.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+# Runs yt-dlp extractions for the add-on in a separate Python process, so their CPU work
+# does not compete with NVDA for its interpreter lock. This script is started by
+# extraction.ExtractionService with an external Python interpreter and must not import
+# NVDA or add-on modules. It reads one JSON request per line from stdin and writes one
+# JSON response per line to stdout, trimmed to the fields the add-on uses, preceded by
+# a notice when it starts on a request.
+
+import http.cookiejar
+import json
+import os
+import sys
+from collections import OrderedDict
+
+# Entry fields needed to build the add-on's channel video lists.
+ENTRY_FIELDS = (
+    'id', 'title', 'duration', 'url', 'webpage_url', 'upload_date', 'live_status', 'was_live',
+    'uploader', 'channel', 'uploader_id',
+)
+# Playlist-level fields used to name the channel of a list.
+PLAYLIST_FIELDS = ('_type', 'id', 'title', 'uploader', 'channel', 'uploader_url', 'channel_url', 'playlist_count')
+# Large fields of a video info dict that the add-on never reads.
+DROPPED_FIELDS = (
+    'formats', 'requested_formats', 'thumbnails', 'heatmap', 'http_headers', 'fragments',
+    'requested_subtitles', 'requested_downloads', '_format_sort_fields', 'storyboards',
+)
+# Entries the streams tab lists above past broadcasts; a known one is skipped rather than stopped at.
+PENDING_LIVE_STATUSES = ('is_upcoming', 'is_live')
+# Only the track languages are needed from these.
+TRACK_FIELDS = ('subtitles', 'automatic_captions')
+# YoutubeDL instances kept for reuse; the least recently used is closed beyond this.
+MAX_INSTANCES = 8
+
+class _QuietLogger:
+    def debug(self, msg): pass
+    def info(self, msg): pass
+    def warning(self, msg): pass
+    def error(self, msg): pass
+
+_instances = OrderedDict()
+# (key, jar) of the cookie jar sent last; the add-on only refers to that one by key.
+_cookie_jar = (None, None)
+
+def _build_cookie_jar(items):
+    from yt_dlp.cookies import YoutubeDLCookieJar
+    jar = YoutubeDLCookieJar()
+    for item in items:
+        domain = item['domain']
+        jar.set_cookie(http.cookiejar.Cookie(
+            0, item['name'], item['value'], None, False, domain, bool(domain), domain.startswith('.'),
+            item.get('path') or '/', True, item.get('secure', False), item.get('expires'),
+            item.get('discard', False), None, None, {}
+        ))
+    return jar
+
+def _get_instance(opts, cookies):
+    """Returns a cached YoutubeDL for the options and cookie jar of a request."""
+    global _cookie_jar
+    import yt_dlp
+    cookie_key = None
+    if cookies:
+        cookie_key = cookies['key']
+        if cookies.get('items') is not None:
+            _cookie_jar = (cookie_key, _build_cookie_jar(cookies['items']))
+    key = (json.dumps(opts, sort_keys=True), cookie_key)
+    ydl = _instances.pop(key, None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(dict(opts, logger=_QuietLogger()))
+        if cookie_key is not None and cookie_key == _cookie_jar[0]:
+            ydl.cookiejar = _cookie_jar[1]
+    _instances[key] = ydl
+    while len(_instances) > MAX_INSTANCES:
+        __, evicted = _instances.popitem(last=False)
+        close = getattr(evicted, 'close', None)
+        if close is not None:
+            close()
+    return ydl
+
+def _trim_video_info(info):
+    if not isinstance(info, dict):
+        return info
+    trimmed = {key: value for key, value in info.items() if key not in DROPPED_FIELDS}
+    for key in TRACK_FIELDS:
+        if key in trimmed:
+            trimmed[key] = {lang: [] for lang in (trimmed[key] or {})}
+    if isinstance(trimmed.get('entries'), list):
+        trimmed['entries'] = [_trim_video_info(entry) for entry in trimmed['entries']]
+    elif 'entries' in trimmed:
+        trimmed['entries'] = []
+    return trimmed
+
+def _trim_playlist(info, entries):
+    trimmed = {key: info.get(key) for key in PLAYLIST_FIELDS if info.get(key) is not None}
+    trimmed['entries'] = [
+        {key: entry.get(key) for key in ENTRY_FIELDS if entry.get(key) is not None}
+        for entry in entries if entry
+    ]
+    return trimmed
+
+def _channel_videos(ydl, request):
+    url = request['url']
+    stop_at_ids = request.get('stop_at_ids')
+    limit = request.get('limit') or 20
+    if stop_at_ids is not None:
+        # Page the tab lazily and stop at the first known past video, like the in-process fetch.
+        stop_at_ids = set(stop_at_ids)
+        info = ydl.extract_info(url, download=False, process=False)
+        if info and info.get('_type') not in ('url', 'url_transparent') and 'entries' in info:
+            entries = []
+            for entry in info['entries']:
+                if len(entries) >= limit:
+                    break
+                if not entry:
+                    continue
+                if entry.get('id') in stop_at_ids:
+                    if entry.get('live_status') in PENDING_LIVE_STATUSES:
+                        continue
+                    break
+                entries.append(entry)
+            return _trim_playlist(info, entries)
+    info = ydl.extract_info(url, download=False) or {}
+    return _trim_playlist(info, info.get('entries') or [])
+
+def _http_error_details(error):
+    """Returns the status and Retry-After of an HTTP error wrapped in a yt-dlp error."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        status = getattr(error, 'status', None) or getattr(error, 'code', None)
+        if isinstance(status, int):
+            response = getattr(error, 'response', None)
+            headers = getattr(response, 'headers', None) or getattr(error, 'headers', None)
+            retry_after = headers.get('Retry-After') if headers is not None else None
+            return status, retry_after
+        exc_info = getattr(error, 'exc_info', None)
+        wrapped = exc_info[1] if isinstance(exc_info, tuple) and len(exc_info) > 1 else None
+        error = wrapped or getattr(error, 'cause', None) or error.__cause__ or error.__context__
+    return None, None
+
+def _handle(request):
+    import yt_dlp
+    ydl = _get_instance(request.get('opts') or {}, request.get('cookies'))
+    try:
+        if request['op'] == 'channel_videos':
+            result = _channel_videos(ydl, request)
+        else:
+            result = _trim_video_info(ydl.sanitize_info(ydl.extract_info(request['url'], download=False)))
+        return {'id': request['id'], 'ok': True, 'result': result}
+    except yt_dlp.utils.YoutubeDLError as e:
+        status, retry_after = _http_error_details(e)
+        return {
+            'id': request['id'], 'ok': False, 'error': 'DownloadError', 'message': str(e),
+            'status': status, 'retry_after': retry_after,
+        }
+
+def _send(message):
+    sys.stdout.write(json.dumps(message, ensure_ascii=False, default=str) + "\n")
+    sys.stdout.flush()
+
+def main():
+    lib_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib")
+    # Use the yt-dlp bundled with the add-on, so both processes run the same version.
+    sys.path.insert(0, lib_dir)
+    sys.stdin.reconfigure(encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    import yt_dlp
+    _send({'ready': True, 'version': yt_dlp.version.__version__, 'pid': os.getpid()})
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        # Lets the add-on time the request from now rather than from when it was queued.
+        _send({'id': request.get('id'), 'started': True})
+        try:
+            response = _handle(request)
+        except Exception as e:
+            response = {'id': request.get('id'), 'ok': False, 'error': type(e).__name__, 'message': str(e)}
+        _send(response)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# feed_list.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+from collections import OrderedDict
+import wx
+from logHandler import log
+from .metrics import metrics
+
+# Rows read from the database at a time; a list shows a few dozen at once.
+PAGE_SIZE = 100
+# Pages kept in memory per tab; older ones are read again when scrolled back to.
+MAX_CACHED_PAGES = 8
+
+VIDEO_COLUMNS = "v.video_id, v.channel_name, v.title, v.duration_str, v.channel_url, v.upload_date, v.content_type, v.id"
+
+class FeedPager:
+    """
+    Reads the videos of one subscription feed tab from the database a page at a time,
+    so memory use and opening time do not grow with the number of videos.
+    A page that follows a cached one is read by key (the row id of its last video),
+    any other page by offset. Create a new pager when the videos may have changed.
+    """
+
+    def __init__(self, db, conditions, params, newest_first):
+        """conditions and params select the tab's videos from videos v, e.g. ["v.seen = 0"], []."""
+        self._db = db
+        self._conditions = list(conditions)
+        self._params = list(params)
+        self._newest_first = newest_first
+        self._count = None
+        self._pages = OrderedDict()
+
+    def _where(self, extra_condition=None):
+        conditions = self._conditions + ([extra_condition] if extra_condition else [])
+        return ("WHERE " + " AND ".join(conditions)) if conditions else ""
+
+    def count(self):
+        if self._count is None:
+            with self._db.connection() as con, metrics.timer("db.query", label="subscription_feed.count"):
+                self._count = con.execute(f"SELECT COUNT(*) FROM videos v {self._where()}", self._params).fetchone()[0]
+        return self._count
+
+    def _load_page(self, page_number):
+        order = "DESC" if self._newest_first else "ASC"
+        previous = self._pages.get(page_number - 1)
+        if previous and len(previous) == PAGE_SIZE:
+            comparison = "v.id < ?" if self._newest_first else "v.id > ?"
+            sql = f"SELECT {VIDEO_COLUMNS} FROM videos v {self._where(comparison)} ORDER BY v.id {order} LIMIT ?"
+            params = self._params + [previous[-1]['row_id'], PAGE_SIZE]
+        else:
+            sql = f"SELECT {VIDEO_COLUMNS} FROM videos v {self._where()} ORDER BY v.id {order} LIMIT ? OFFSET ?"
+            params = self._params + [PAGE_SIZE, page_number * PAGE_SIZE]
+        with self._db.connection() as con, metrics.timer("db.query", label="subscription_feed.page"):
+            rows = con.execute(sql, params).fetchall()
+        return [
+            {'id': r[0], 'channel_name': r[1], 'title': r[2], 'duration_str': r[3], 'channel_url': r[4], 'upload_date': r[5], 'content_type': r[6], 'row_id': r[7]}
+            for r in rows
+        ]
+
+    def get(self, index):
+        """Returns the video at index of the tab, or None if there is none."""
+        page_number, offset = divmod(index, PAGE_SIZE)
+        page = self._pages.get(page_number)
+        if page is None:
+            page = self._load_page(page_number)
+            self._pages[page_number] = page
+            while len(self._pages) > MAX_CACHED_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_number)
+        return page[offset] if offset < len(page) else None
+
+    def video_ids(self):
+        """Returns the ids of all the tab's videos."""
+        with self._db.connection() as con:
+            return [row[0] for row in con.execute(f"SELECT v.video_id FROM videos v {self._where()}", self._params)]
+
+    def position_after(self, video_id):
+        """
+        Returns how many of the tab's videos come before video_id or are video_id itself, which is
+        the index of the video that follows it; None if video_id is not in the database.
+        """
+        with self._db.connection() as con:
+            row = con.execute("SELECT id FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+            if row is None:
+                return None
+            comparison = "v.id >= ?" if self._newest_first else "v.id <= ?"
+            return con.execute(f"SELECT COUNT(*) FROM videos v {self._where(comparison)}", self._params + [row[0]]).fetchone()[0]
+
+class VirtualFeedListCtrl(wx.ListCtrl):
+    """A report list whose rows are read from a FeedPager only when they are shown."""
+
+    def __init__(self, parent, item_text_func):
+        """item_text_func(video, column) returns the text of a cell."""
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.LC_VIRTUAL)
+        self._item_text_func = item_text_func
+        self.pager = None
+
+    def set_pager(self, pager):
+        self.pager = pager
+        self.SetItemCount(pager.count())
+        self.Refresh()
+
+    def get_video(self, index):
+        if self.pager is None or index < 0:
+            return None
+        return self.pager.get(index)
+
+    def OnGetItemText(self, item, column):
+        try:
+            video = self.get_video(item)
+        except Exception as e:
+            log.error("Failed to read feed row %d: %s", item, e)
+            return ""
+        return self._item_text_func(video, column) if video else ""
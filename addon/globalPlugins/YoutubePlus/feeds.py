@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# feeds.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import hashlib
+import re
+import socket
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
+from logHandler import log
+
+FEED_BASE_URL = "https://www.youtube.com/feeds/videos.xml"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
+
+_NS = {
+    'atom': "http://www.w3.org/2005/Atom",
+    'yt': "http://www.youtube.com/xml/schemas/2015",
+}
+_CHANNEL_ID_RE = re.compile(r"/channel/(UC[0-9A-Za-z_-]{22})")
+# View counts, ratings and update stamps change constantly without any new upload.
+_VOLATILE_PARTS_RE = re.compile(rb"<media:community>.*?</media:community>|<updated>[^<]*</updated>", re.DOTALL)
+
+def channel_id_from_url(channel_url):
+    """Returns the UC... channel ID contained in a channel URL, or None for handle or custom URLs."""
+    if not channel_url:
+        return None
+    match = _CHANNEL_ID_RE.search(channel_url)
+    return match.group(1) if match else None
+
+def uploads_playlist_url(channel_url):
+    """Returns the URL of the channel's combined uploads playlist (UU...), or None without a UC... channel ID."""
+    channel_id = channel_id_from_url(channel_url)
+    if not channel_id:
+        return None
+    return f"https://www.youtube.com/playlist?list=UU{channel_id[2:]}"
+
+def content_hash(data):
+    """Hashes a feed body, ignoring the parts that change without a new upload."""
+    return hashlib.sha1(_VOLATILE_PARTS_RE.sub(b"", data)).hexdigest()
+
+def parse_feed(data):
+    """
+    Parses a YouTube channel Atom feed into a list of entry dicts, newest first.
+    Each entry has id, title, url, channel_name, upload_date (YYYYMMDD), published and is_short.
+    """
+    root = ET.fromstring(data)
+    feed_title = root.findtext('atom:title', default='', namespaces=_NS)
+    entries = []
+    for entry in root.findall('atom:entry', _NS):
+        video_id = entry.findtext('yt:videoId', namespaces=_NS)
+        if not video_id:
+            continue
+        link = entry.find("atom:link[@rel='alternate']", _NS)
+        url = link.get('href', '') if link is not None else ''
+        published = entry.findtext('atom:published', default='', namespaces=_NS)
+        entries.append({
+            'id': video_id,
+            'title': entry.findtext('atom:title', default='', namespaces=_NS),
+            'url': url or f"https://www.youtube.com/watch?v={video_id}",
+            'channel_name': entry.findtext('atom:author/atom:name', default=feed_title, namespaces=_NS),
+            'upload_date': published[:10].replace('-', '') if len(published) >= 10 else None,
+            'published': published,
+            'is_short': '/shorts/' in url,
+        })
+    return entries
+
+class FeedResponse:
+    """The outcome of a feed request, together with the validators to send next time."""
+
+    def __init__(self, entries=None, not_modified=False, etag=None, last_modified=None, content_hash=None):
+        self.entries = entries
+        self.not_modified = not_modified
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+
+class ChannelFeedPoller:
+    """
+    Reads the lightweight per-channel Atom feed YouTube publishes for the latest uploads.
+    base_url can point to a local HTTP server serving the same format.
+    """
+
+    def __init__(self, base_url=FEED_BASE_URL, timeout=15):
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def feed_url(self, channel_id):
+        return f"{self.base_url}?channel_id={channel_id}"
+
+    def fetch(self, channel_url, etag=None, last_modified=None, known_hash=None):
+        """
+        Requests the feed for channel_url, sending any stored validators.
+        Returns a FeedResponse, with not_modified set when the server answered 304
+        or the body hashes to known_hash, in which case the feed is not parsed.
+        Returns None when the channel has no derivable channel ID or the feed
+        could not be read or parsed.
+        """
+        channel_id = channel_id_from_url(channel_url)
+        if not channel_id:
+            return None
+        headers = {'User-Agent': USER_AGENT}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        request = urllib.request.Request(self.feed_url(channel_id), headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = response.read()
+                new_etag = response.headers.get('ETag')
+                new_last_modified = response.headers.get('Last-Modified')
+            new_hash = content_hash(data)
+            if known_hash and new_hash == known_hash:
+                return FeedResponse(not_modified=True, etag=new_etag, last_modified=new_last_modified, content_hash=new_hash)
+            return FeedResponse(parse_feed(data), etag=new_etag, last_modified=new_last_modified, content_hash=new_hash)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return FeedResponse(not_modified=True, etag=etag, last_modified=last_modified, content_hash=known_hash)
+            log.debug(f"Channel feed unavailable for {channel_url}: {e}")
+        except (urllib.error.URLError, socket.timeout, ConnectionError) as e:
+            log.debug(f"Channel feed unavailable for {channel_url}: {e}")
+        except ET.ParseError as e:
+            log.debug(f"Channel feed for {channel_url} could not be parsed: {e}")
+        return None
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# metadata_cache.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from logHandler import log
+from .database import Database
+from .metrics import metrics
+
+METADATA_CACHE_FILENAME = "metadata_cache.db"
+
+# Fields that practically never change once a video is published.
+STABLE_FIELDS = (
+    'id', 'title', 'uploader', 'channel', 'channel_id', 'channel_url', 'duration',
+    'upload_date', 'description', 'chapters', 'language', '_type', 'webpage_url',
+)
+# Fields that change while the video is being watched or streamed.
+VOLATILE_FIELDS = (
+    'view_count', 'like_count', 'comment_count', 'is_live', 'live_status', 'was_live',
+)
+# Only the track languages are needed from these; the format lists are large.
+TRACK_FIELDS = ('subtitles', 'automatic_captions')
+
+def _create_metadata_table(cur):
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS video_metadata (
+            video_id TEXT PRIMARY KEY,
+            stable_json TEXT NOT NULL,
+            stable_at REAL NOT NULL,
+            volatile_json TEXT NOT NULL,
+            volatile_at REAL NOT NULL
+        )
+    ''')
+
+# Schema history of the cache database; see schema.py.
+METADATA_CACHE_MIGRATIONS = (
+    _create_metadata_table,
+)
+
+class VideoMetadataCache:
+    """
+    A profile-local cache of video info dicts, keyed by video id.
+    Stable and volatile fields are stored and expire separately, so a video's
+    title, chapters and subtitle tracks can be reused long after its view count
+    has gone stale.
+    """
+
+    STABLE_TTL_SECONDS = 7 * 24 * 3600
+    VOLATILE_TTL_SECONDS = 10 * 60
+
+    def __init__(self, db_path_func):
+        """db_path_func returns the database path of the active profile."""
+        self._db = Database(db_path_func, name="metadata_cache", migrations=METADATA_CACHE_MIGRATIONS)
+        self._lock = threading.Lock()
+        self._initialized_paths = set()
+
+    @contextmanager
+    def _connection(self):
+        with self._db.connection() as con:
+            db_path = self._db.path
+            with self._lock:
+                initialized = db_path in self._initialized_paths
+            if not initialized:
+                con.execute("DELETE FROM video_metadata WHERE stable_at < ?", (time.time() - self.STABLE_TTL_SECONDS,))
+                con.commit()
+                with self._lock:
+                    self._initialized_paths.add(db_path)
+            yield con
+
+    def close(self):
+        self._db.close()
+
+    @staticmethod
+    def is_cacheable(info):
+        """Live and upcoming streams change too quickly to be worth caching."""
+        if not info or info.get('_type', 'video') != 'video' or not info.get('id'):
+            return False
+        if info.get('is_live') or info.get('live_status') in ('is_live', 'is_upcoming', 'post_live'):
+            return False
+        return True
+
+    def get(self, video_id, stable_only=False):
+        """
+        Returns the cached info dict for video_id, or None if it is missing or expired.
+        With stable_only, an entry whose volatile fields have expired is still returned,
+        without those fields.
+        """
+        now = time.time()
+        try:
+            with self._connection() as con, metrics.timer("db.query", label="metadata_cache.get"):
+                row = con.execute(
+                    "SELECT stable_json, stable_at, volatile_json, volatile_at FROM video_metadata WHERE video_id = ?",
+                    (video_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            log.warning(f"Could not read video metadata cache: {e}")
+            return None
+        if not row:
+            metrics.increment("cache.miss", label="video_metadata")
+            return None
+        stable_json, stable_at, volatile_json, volatile_at = row
+        if now - stable_at >= self.STABLE_TTL_SECONDS:
+            metrics.increment("cache.miss", label="video_metadata")
+            return None
+        volatile_fresh = now - volatile_at < self.VOLATILE_TTL_SECONDS
+        if not volatile_fresh and not stable_only:
+            metrics.increment("cache.miss", label="video_metadata")
+            return None
+        metrics.increment("cache.hit", label="video_metadata")
+        info = json.loads(stable_json)
+        if volatile_fresh:
+            info.update(json.loads(volatile_json))
+        log.debug("Video metadata cache hit for %s (volatile fields %s).", video_id, "fresh" if volatile_fresh else "expired")
+        return info
+
+    def put(self, info):
+        """Stores the stable and volatile fields of a freshly extracted info dict."""
+        if not self.is_cacheable(info):
+            return
+        stable = {key: info[key] for key in STABLE_FIELDS if info.get(key) is not None}
+        for key in TRACK_FIELDS:
+            stable[key] = {lang: [] for lang in (info.get(key) or {})}
+        volatile = {key: info[key] for key in VOLATILE_FIELDS if info.get(key) is not None}
+        now = time.time()
+        try:
+            with self._connection() as con, metrics.timer("db.query", label="metadata_cache.put"):
+                con.execute(
+                    "INSERT OR REPLACE INTO video_metadata (video_id, stable_json, stable_at, volatile_json, volatile_at) VALUES (?, ?, ?, ?, ?)",
+                    (info['id'], json.dumps(stable, ensure_ascii=False), now, json.dumps(volatile), now)
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            log.warning(f"Could not write video metadata cache for {info.get('id')}: {e}")
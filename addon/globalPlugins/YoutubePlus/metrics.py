@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# metrics.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+DIAGNOSTICS_FILENAME = "diagnostics.json"
+
+# The label under which every observation of a metric is also aggregated.
+ALL_LABELS = "*"
+# Observations for further labels are folded into this one, so per-channel metrics stay bounded.
+OTHER_LABEL = "(other)"
+MAX_LABELS_PER_METRIC = 500
+
+# Upper bounds of the histogram buckets, in seconds.
+BUCKET_BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+class Histogram:
+    """Count, sum, extremes and bucketed distribution of timed observations."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        for index, bound in enumerate(BUCKET_BOUNDS):
+            if value <= bound:
+                self.buckets[index] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, fraction):
+        """Returns the upper bound of the bucket holding the given fraction of observations."""
+        if not self.count:
+            return None
+        wanted = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= wanted:
+                return BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+        }
+
+class MetricsRegistry:
+    """
+    A thread-safe, in-memory store of counters and timing histograms.
+    Each metric can be split by a label (an operation, channel or dialog handler);
+    every observation is also added to the ALL_LABELS aggregate of its metric.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+            self._started_at = time.time()
+
+    @staticmethod
+    def _bounded_label(series, label):
+        if label in series or len(series) < MAX_LABELS_PER_METRIC:
+            return label
+        return OTHER_LABEL
+
+    def increment(self, name, value=1, label=None):
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[ALL_LABELS] = series.get(ALL_LABELS, 0) + value
+            if label is not None:
+                label = self._bounded_label(series, str(label))
+                series[label] = series.get(label, 0) + value
+
+    def observe(self, name, seconds, label=None):
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            series.setdefault(ALL_LABELS, Histogram()).observe(seconds)
+            if label is not None:
+                label = self._bounded_label(series, str(label))
+                series.setdefault(label, Histogram()).observe(seconds)
+
+    @contextmanager
+    def timer(self, name, label=None):
+        """Times the body of a with block, including when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, label)
+
+    def timed(self, name, label=None):
+        """A decorator timing every call of a function; the label defaults to its qualified name."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, label or func.__qualname__):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def counter(self, name, label=ALL_LABELS):
+        with self._lock:
+            return self._counters.get(name, {}).get(label, 0)
+
+    def snapshot(self):
+        """Returns every metric as plain, JSON serializable data."""
+        with self._lock:
+            return {
+                'started_at': datetime.fromtimestamp(self._started_at).strftime("%Y-%m-%d %H:%M:%S"),
+                'uptime_seconds': time.time() - self._started_at,
+                'counters': {name: dict(series) for name, series in self._counters.items()},
+                'histograms': {
+                    name: {label: histogram.as_dict() for label, histogram in series.items()}
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def dump_json(self, path, extra=None):
+        """Writes the snapshot, plus any extra top-level sections, to path."""
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+# Shared by the whole add-on.
+metrics = MetricsRegistry()
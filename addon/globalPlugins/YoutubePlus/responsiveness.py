@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# responsiveness.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+import wx
+from logHandler import log
+from .metrics import metrics
+
+# How often the GUI thread is probed while the add-on is busy.
+PROBE_INTERVAL_SECONDS = 0.25
+# A probe answered later than this counts as a stall; speech lags noticeably beyond it.
+STALL_THRESHOLD_SECONDS = 0.15
+# Probing continues this long after the add-on's work ends, to catch the dialogs it opens.
+LINGER_SECONDS = 10
+# The stall label when no tracked add-on code was running on the GUI thread.
+NO_ACTIVITY_LABEL = "(no add-on code on the GUI thread)"
+
+class UIResponsivenessProbe:
+    """
+    Measures how long NVDA's GUI thread takes to run a queued call while the add-on is busy.
+    A watchdog thread posts a timestamped wx.CallAfter and records the delay as ui.latency.
+    Delays beyond the stall threshold are recorded as ui.stall, labelled with the tracked
+    GUI-thread activity (a callback or dialog method) that was running when the stall was
+    noticed, and as ui.stall_task for each add-on task running at that moment.
+    """
+
+    def __init__(self):
+        self._activities = []
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._busy_func = None
+        self._running_tasks_func = None
+
+    def start(self, busy_func, running_tasks_func):
+        """
+        busy_func returns True while the add-on has work in progress; running_tasks_func
+        returns the names of the add-on tasks currently running.
+        """
+        if self._thread is not None:
+            return
+        self._busy_func = busy_func
+        self._running_tasks_func = running_tasks_func
+        # A fresh event per run, so a thread still finishing an earlier run stops for good.
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,), name="YoutubePlusUIProbe", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._thread = None
+
+    @contextmanager
+    def activity(self, label):
+        """Marks the body of a with block as add-on code running on the GUI thread."""
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        self._activities.append(label)
+        try:
+            yield
+        finally:
+            self._activities.pop()
+
+    def tracked(self, label=None):
+        """A decorator marking every call of a GUI method as an activity; the label defaults to its qualified name."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.activity(label or func.__qualname__):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _current_activity(self):
+        activities = list(self._activities)
+        return activities[-1] if activities else None
+
+    def _run(self, stop_event):
+        last_busy = None
+        while not stop_event.wait(PROBE_INTERVAL_SECONDS):
+            now = time.monotonic()
+            try:
+                busy = bool(self._activities) or self._busy_func()
+            except Exception:
+                log.debug("UI probe could not check for add-on work.", exc_info=True)
+                busy = False
+            if busy:
+                last_busy = now
+            elif last_busy is None or now - last_busy > LINGER_SECONDS:
+                continue
+            self._probe(stop_event)
+
+    def _probe(self, stop_event):
+        answered = threading.Event()
+        posted_at = time.perf_counter()
+        wx.CallAfter(answered.set)
+        if answered.wait(STALL_THRESHOLD_SECONDS):
+            metrics.observe("ui.latency", time.perf_counter() - posted_at)
+            return
+        # The GUI thread is stalled: note what it is running and which tasks compete with it.
+        culprit = self._current_activity()
+        try:
+            running_tasks = list(self._running_tasks_func())
+        except Exception:
+            running_tasks = []
+        while not answered.wait(0.05):
+            if stop_event.is_set():
+                return
+            if culprit is None:
+                culprit = self._current_activity()
+        delay = time.perf_counter() - posted_at
+        culprit = culprit or NO_ACTIVITY_LABEL
+        metrics.observe("ui.latency", delay)
+        metrics.increment("ui.stalls")
+        metrics.observe("ui.stall", delay, label=culprit)
+        for task_name in running_tasks:
+            metrics.observe("ui.stall_task", delay, label=task_name)
+        log.debug("GUI thread stalled for %.0f ms in %s (tasks running: %s).", delay * 1000, culprit, ", ".join(running_tasks) or "none")
+
+# Shared by the whole add-on.
+ui_probe = UIResponsivenessProbe()
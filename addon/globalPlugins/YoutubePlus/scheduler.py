@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# scheduler.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import time
+from datetime import datetime
+
+DAY_SECONDS = 24 * 3600
+
+class PollScheduler:
+    """
+    Decides which subscribed channels are due for a background check, based on
+    each channel's upload history in the videos table and when it was last checked.
+    A video's upload date is used when it is known, otherwise the time it was first stored.
+    A channel's cadence is an exponentially weighted average of the gaps between
+    its uploads, stretched while the channel stays quiet, and it is polled a fixed
+    fraction of that cadence, bounded by min_seconds and max_seconds.
+    """
+
+    EWMA_ALPHA = 0.3
+    # Check a channel this many times per expected upload gap.
+    CHECKS_PER_UPLOAD = 8
+    HISTORY_LENGTH = 20
+    # Allowance for timer drift, so a channel due just after a tick is not skipped for a whole interval.
+    DUE_SLACK_SECONDS = 60
+
+    def __init__(self, min_seconds, max_seconds=DAY_SECONDS):
+        self.min_seconds = min_seconds
+        self.max_seconds = max(max_seconds, min_seconds)
+
+    @staticmethod
+    def _parse_upload_date(upload_date):
+        try:
+            return datetime.strptime(upload_date, '%Y%m%d').timestamp()
+        except (TypeError, ValueError):
+            return None
+
+    def poll_interval(self, upload_times, now=None):
+        """Returns the polling interval in seconds for a channel with the given upload times (Unix time)."""
+        now = now or time.time()
+        timestamps = sorted({ts for ts in upload_times if ts})[-self.HISTORY_LENGTH:]
+        if len(timestamps) < 2:
+            return self.min_seconds
+        cadence = None
+        for previous, current in zip(timestamps, timestamps[1:]):
+            gap = current - previous
+            cadence = gap if cadence is None else self.EWMA_ALPHA * gap + (1 - self.EWMA_ALPHA) * cadence
+        # A channel that has been silent for longer than usual is probably slowing down or dormant.
+        cadence = max(cadence, (now - timestamps[-1]) / 2)
+        return min(self.max_seconds, max(self.min_seconds, cadence / self.CHECKS_PER_UPLOAD))
+
+    def due_channels(self, con, now=None):
+        """Returns the URLs of the subscribed channels that should be checked now."""
+        now = now or time.time()
+        cur = con.cursor()
+        cur.execute("SELECT channel_url FROM subscribed_channels")
+        channel_urls = [row[0] for row in cur.fetchall()]
+        cur.execute("SELECT channel_url, last_checked FROM channel_poll_state")
+        last_checked = dict(cur.fetchall())
+        # Only each channel's latest HISTORY_LENGTH videos feed its cadence, so only those are read.
+        cur.execute("""
+            SELECT channel_url, upload_date, discovered_at FROM (
+                SELECT channel_url, upload_date, discovered_at,
+                    ROW_NUMBER() OVER (PARTITION BY channel_url ORDER BY id DESC) AS recency
+                FROM videos
+                WHERE (upload_date IS NOT NULL AND upload_date != '') OR discovered_at IS NOT NULL
+            )
+            WHERE recency <= ?
+        """, (self.HISTORY_LENGTH,))
+        upload_times = {}
+        for channel_url, upload_date, discovered_at in cur.fetchall():
+            upload_time = self._parse_upload_date(upload_date) or discovered_at
+            upload_times.setdefault(channel_url, []).append(upload_time)
+        due = []
+        for channel_url in channel_urls:
+            checked_at = last_checked.get(channel_url)
+            if checked_at is None:
+                due.append(channel_url)
+                continue
+            interval = self.poll_interval(upload_times.get(channel_url, []), now)
+            if now - checked_at + self.DUE_SLACK_SECONDS >= interval:
+                due.append(channel_url)
+        return due
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# schema.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+# Schema history of subscription.db. Each migration runs once, in its own transaction, and
+# PRAGMA user_version records how many have been applied. Append new migrations to the end
+# of SUBSCRIPTION_MIGRATIONS; never change or reorder the ones that have been released.
+
+from logHandler import log
+
+def _create_tables(cur):
+    """The schema from before versioning. Databases of that era already have some of it."""
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS subscribed_channels (
+            channel_url TEXT PRIMARY KEY,
+            channel_name TEXT NOT NULL,
+            content_types TEXT NOT NULL DEFAULT 'videos,shorts,streams'
+        )
+    ''')
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS videos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, video_id TEXT UNIQUE NOT NULL,
+            channel_url TEXT NOT NULL, channel_name TEXT NOT NULL,
+            title TEXT, duration_str TEXT, upload_date TEXT
+        )
+    ''')
+    cur.execute("PRAGMA table_info(videos)")
+    columns = [col[1] for col in cur.fetchall()]
+    if 'content_type' not in columns:
+        cur.execute("ALTER TABLE videos ADD COLUMN content_type TEXT NOT NULL DEFAULT 'videos'")
+
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS seen_videos (video_id TEXT PRIMARY KEY)
+    ''')
+
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS feed_validators (
+            channel_url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_hash TEXT,
+            checked_at TEXT
+        )
+    ''')
+
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS channel_poll_state (
+            channel_url TEXT PRIMARY KEY,
+            last_checked REAL NOT NULL
+        )
+    ''')
+
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL,
+            position INTEGER NOT NULL
+        )
+    ''')
+    cur.execute('''
+        CREATE TABLE IF NOT EXISTS channel_category_links (
+            channel_url TEXT NOT NULL,
+            category_id INTEGER NOT NULL,
+            PRIMARY KEY (channel_url, category_id),
+            FOREIGN KEY (channel_url) REFERENCES subscribed_channels (channel_url) ON DELETE CASCADE,
+            FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE CASCADE
+        )
+    ''')
+
+    cur.execute("SELECT COUNT(*) FROM categories")
+    if cur.fetchone()[0] == 0:
+        log.debug("No categories found. Creating initial 'General' category.")
+        cur.execute("INSERT INTO categories (name, position) VALUES (?, ?)", ('General', 0))
+
+def _add_feed_indexes(cur):
+    """Indexes for the feed's access paths, then fresh statistics for the query planner."""
+    # Per-channel deletes and the poll scheduler's upload dates read this index only.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_videos_channel_upload_date ON videos (channel_url, upload_date)")
+    # The Videos, Shorts and Live tabs; entries carry the row id, so each tab comes out in feed order.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_videos_content_type ON videos (content_type)")
+    # The primary key starts with the channel, but category tabs look links up by category.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_channel_category_links_category ON channel_category_links (category_id, channel_url)")
+    cur.execute("ANALYZE")
+
+def _add_seen_flag(cur):
+    """
+    Keeps the seen state on the videos themselves, so unseen videos come ordered from a
+    partial index instead of an anti-join against seen_videos. seen_videos remains the
+    record of what was seen, also for videos fetched again later; triggers keep the flag
+    in sync with it.
+    """
+    cur.execute("ALTER TABLE videos ADD COLUMN seen INTEGER NOT NULL DEFAULT 0")
+    cur.execute("UPDATE videos SET seen = 1 WHERE video_id IN (SELECT video_id FROM seen_videos)")
+    cur.execute('''
+        CREATE TRIGGER IF NOT EXISTS videos_seen_on_insert AFTER INSERT ON videos
+        WHEN EXISTS (SELECT 1 FROM seen_videos WHERE video_id = NEW.video_id)
+        BEGIN
+            UPDATE videos SET seen = 1 WHERE id = NEW.id;
+        END
+    ''')
+    cur.execute('''
+        CREATE TRIGGER IF NOT EXISTS seen_videos_on_insert AFTER INSERT ON seen_videos
+        BEGIN
+            UPDATE videos SET seen = 1 WHERE video_id = NEW.video_id;
+        END
+    ''')
+    cur.execute('''
+        CREATE TRIGGER IF NOT EXISTS seen_videos_on_delete AFTER DELETE ON seen_videos
+        BEGIN
+            UPDATE videos SET seen = 0 WHERE video_id = OLD.video_id;
+        END
+    ''')
+    # One partial index per kind of feed tab; each returns a tab's unseen videos in feed order.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_videos_unseen ON videos (id) WHERE seen = 0")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_videos_unseen_content_type ON videos (content_type, id) WHERE seen = 0")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_videos_unseen_channel ON videos (channel_url, id) WHERE seen = 0")
+    cur.execute("ANALYZE")
+
+def _add_discovered_at(cur):
+    """
+    Records when each video was first stored, as Unix time. Flat channel fetches carry no
+    upload date, so this is the poll scheduler's upload history for their videos. Videos
+    stored before this migration have no discovery time.
+    """
+    cur.execute("ALTER TABLE videos ADD COLUMN discovered_at REAL")
+    cur.execute('''
+        CREATE TRIGGER IF NOT EXISTS videos_discovered_on_insert AFTER INSERT ON videos
+        WHEN NEW.discovered_at IS NULL
+        BEGIN
+            UPDATE videos SET discovered_at = (julianday('now') - 2440587.5) * 86400.0 WHERE id = NEW.id;
+        END
+    ''')
+
+SUBSCRIPTION_MIGRATIONS = (
+    _create_tables,
+    _add_feed_indexes,
+    _add_seen_flag,
+    _add_discovered_at,
+)
@@ -153,6 +153,22 @@ class YoutubePlusSettingsPanel(gui.settingsDialogs.SettingsPanel):
         except ValueError:
             self.intervalCombo.SetSelection(0)
 
+        # Translators: Label for a checkbox that makes background updates check frequently uploading channels more often than quiet ones.
+        self.adaptivePolling = sHelper.addItem(wx.CheckBox(self, label=_("Adapti&ve background updates (check active channels more often)")))
+        self.adaptivePolling.SetValue(config.conf["YoutubePlus"].get("adaptivePolling", True))
+
+        # Translators: Label for a checkbox to check each channel's lightweight feed for new uploads before scanning its tabs.
+        self.useChannelFeeds = sHelper.addItem(wx.CheckBox(self, label=_("Check channel fee&ds first for faster updates")))
+        self.useChannelFeeds.SetValue(config.conf["YoutubePlus"].get("useChannelFeeds", True))
+
+        # Translators: Label for a checkbox to fetch each channel's combined uploads list once instead of its videos, shorts and live tabs separately.
+        self.useUploadsPlaylist = sHelper.addItem(wx.CheckBox(self, label=_("Use sin&gle uploads list per channel (experimental)")))
+        self.useUploadsPlaylist.SetValue(config.conf["YoutubePlus"].get("useUploadsPlaylist", False))
+
+        # Translators: Label for a setting to choose how many channels are checked at the same time during a feed update.
+        sHelper.addItem(wx.StaticText(self, label=_("Number of parallel update &workers:")))
+        self.feedRefreshWorkersSpin = sHelper.addItem(wx.SpinCtrl(self, min=1, max=16, initial=config.conf["YoutubePlus"].get("feedRefreshWorkers", 4)))
+
         sHelper.addItem(wx.StaticLine(self, style=wx.LI_HORIZONTAL), flag=wx.EXPAND | wx.TOP | wx.BOTTOM, border=5)
 
         # Translators: Label for a checkbox to toggle automatic reading of new live chat messages.
@@ -215,6 +231,37 @@ class YoutubePlusSettingsPanel(gui.settingsDialogs.SettingsPanel):
         current_cookie_mode = config.conf["YoutubePlus"].get("cookieMode", "none")
         self.cookieModeCombo.SetSelection(cookie_map.get(current_cookie_mode, 0))
         #"""
+
+        # Translators: Label for a setting to choose how long browser cookies are kept in memory before they are read again.
+        sHelper.addItem(wx.StaticText(self, label=_("Keep browser co&okies in memory for (minutes):")))
+        self.cookieCacheSpin = sHelper.addItem(wx.SpinCtrl(self, min=1, max=1440, initial=config.conf["YoutubePlus"].get("cookieCacheMinutes", 30)))
+
+        sHelper.addItem(wx.StaticLine(self, style=wx.LI_HORIZONTAL), flag=wx.EXPAND | wx.TOP | wx.BOTTOM, border=5)
+
+        # Translators: Label for a checkbox to run yt-dlp in a separate Python process, so that NVDA stays responsive while videos and channels are loaded.
+        self.extractionWorker = sHelper.addItem(wx.CheckBox(self, label=_("Load video and channel information in a separate Python process (e&xperimental)")))
+        self.extractionWorker.SetValue(config.conf["YoutubePlus"].get("extractionWorker", False))
+
+        # Translators: Label for the path of the Python interpreter used by the separate extraction process.
+        sHelper.addItem(wx.StaticText(self, label=_("P&ython interpreter for the separate process (leave empty to detect):")))
+        self.extractionPythonTextCtrl = sHelper.addItem(wx.TextCtrl(self, value=config.conf["YoutubePlus"].get("extractionPython", "")))
+
+        # Translators: Label for a checkbox to detect a lost internet connection and make commands fail at once while it lasts.
+        self.offlineDetection = sHelper.addItem(wx.CheckBox(self, label=_("Detect when YouTube cannot be reached and pause updates until it can")))
+        self.offlineDetection.SetValue(config.conf["YoutubePlus"].get("offlineDetection", True))
+
+        # Translators: Label for a setting to choose how long to wait for a stalled network connection before giving up.
+        sHelper.addItem(wx.StaticText(self, label=_("Network connection timeout (seconds):")))
+        self.socketTimeoutSpin = sHelper.addItem(wx.SpinCtrl(self, min=5, max=300, initial=config.conf["YoutubePlus"].get("socketTimeoutSeconds", 20)))
+
+        # Translators: Label for a setting to choose the longest time an operation such as loading a channel may take,
+        # or loading comments may go without progress.
+        sHelper.addItem(wx.StaticText(self, label=_("Give up on an operation after (minutes):")))
+        self.operationTimeoutSpin = sHelper.addItem(wx.SpinCtrl(self, min=1, max=120, initial=config.conf["YoutubePlus"].get("operationTimeoutMinutes", 10)))
+
+        # Translators: Label for a setting to choose how long a download may go without progress before it is stopped.
+        sHelper.addItem(wx.StaticText(self, label=_("Stop a download without progress after (minutes):")))
+        self.downloadStallSpin = sHelper.addItem(wx.SpinCtrl(self, min=1, max=60, initial=config.conf["YoutubePlus"].get("downloadStallMinutes", 5)))
         
         sHelper.addItem(wx.StaticLine(self, style=wx.LI_HORIZONTAL), flag=wx.EXPAND | wx.TOP | wx.BOTTOM, border=5)
 
@@ -302,6 +349,10 @@ class YoutubePlusSettingsPanel(gui.settingsDialogs.SettingsPanel):
         selected_index = self.intervalCombo.GetSelection()
         if selected_index != wx.NOT_FOUND:
             config.conf["YoutubePlus"]["autoUpdateIntervalMinutes"] = self.interval_values[selected_index]
+        config.conf["YoutubePlus"]["adaptivePolling"] = self.adaptivePolling.GetValue()
+        config.conf["YoutubePlus"]["useChannelFeeds"] = self.useChannelFeeds.GetValue()
+        config.conf["YoutubePlus"]["useUploadsPlaylist"] = self.useUploadsPlaylist.GetValue()
+        config.conf["YoutubePlus"]["feedRefreshWorkers"] = self.feedRefreshWorkersSpin.GetValue()
         content_types = []
         internalValues = ["videos", "shorts", "streams"]
         for index in self.contentTypesList.CheckedItems:
@@ -328,6 +379,13 @@ class YoutubePlusSettingsPanel(gui.settingsDialogs.SettingsPanel):
         }
         config.conf["YoutubePlus"]["cookieMode"] = selection_map_cookie.get(self.cookieModeCombo.GetSelection(), 'none')
         #"""
+        config.conf["YoutubePlus"]["cookieCacheMinutes"] = self.cookieCacheSpin.GetValue()
+        config.conf["YoutubePlus"]["extractionWorker"] = self.extractionWorker.GetValue()
+        config.conf["YoutubePlus"]["extractionPython"] = self.extractionPythonTextCtrl.GetValue().strip()
+        config.conf["YoutubePlus"]["offlineDetection"] = self.offlineDetection.GetValue()
+        config.conf["YoutubePlus"]["socketTimeoutSeconds"] = self.socketTimeoutSpin.GetValue()
+        config.conf["YoutubePlus"]["operationTimeoutMinutes"] = self.operationTimeoutSpin.GetValue()
+        config.conf["YoutubePlus"]["downloadStallMinutes"] = self.downloadStallSpin.GetValue()
         config.conf["YoutubePlus"]["subtitleFormat"] = self.subtitle_format_values[self.subtitleFormatCombo.GetSelection()]
         config.conf["YoutubePlus"]["exportPath"] = self.exportPathTextCtrl.GetValue()
         
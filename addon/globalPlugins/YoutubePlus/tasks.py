@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+# tasks.py for Youtube Plus NVDA Addon
+# Copyright (C) 2025
+# This file is covered by the GNU General Public License.
+# You can read the licence by clicking Help->Licence in the NVDA menu
+# or by visiting http://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# Shortcut: Windows+y
+
+import itertools
+import threading
+import time
+from logHandler import log
+from .errors import OperationCancelled
+from .metrics import metrics
+from .utils import CancellationToken, cancellation_scope
+
+# Lower numbers run first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 10
+PRIORITY_BACKGROUND = 20
+
+CATEGORY_NETWORK = "network"
+CATEGORY_DOWNLOAD = "download"
+CATEGORY_DISK = "disk"
+CATEGORY_DB = "db"
+# Tasks that mostly wait for the user, e.g. for a choice dialog.
+CATEGORY_UI = "ui"
+# Feed updates, which wait for the per-channel network tasks they submit.
+CATEGORY_FEED = "feed"
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_CATEGORY_LIMITS = {
+    CATEGORY_NETWORK: 4,
+    CATEGORY_DOWNLOAD: 2,
+    CATEGORY_DISK: 2,
+    CATEGORY_DB: 2,
+    CATEGORY_FEED: 1,
+}
+
+# A task still running this long after its deadline cancelled it is considered hung and abandoned.
+ABANDON_GRACE_SECONDS = 30
+WATCHDOG_INTERVAL_SECONDS = 1
+
+# Task keys shared by the plugin and its dialogs.
+FEED_UPDATE_TASK = "subscription_feed_update"
+
+STATE_QUEUED = "queued"
+STATE_RUNNING = "running"
+
+class Task:
+    """A unit of work submitted to the TaskExecutor."""
+
+    def __init__(self, task_id, target, args, kwargs, name, priority, category, key):
+        self.id = task_id
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+        self.name = name
+        self.priority = priority
+        self.category = category
+        self.key = key
+        # Seconds the task may run once started; None leaves it to the executor's deadline_func.
+        self.deadline = None
+        self.state = STATE_QUEUED
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        # Set when the task starts: the token it runs under, limited by its deadline.
+        self.run_token = None
+        self.thread = None
+        self.abandoned = False
+
+    @property
+    def cancel_token(self):
+        return self.kwargs.get('cancel_token')
+
+    @property
+    def subject(self):
+        """The URL (or first text argument) the task works on, for log messages."""
+        candidates = [self.kwargs.get('url'), *self.args, *self.kwargs.values()]
+        texts = [value for value in candidates if isinstance(value, str)]
+        for text in texts:
+            if text.startswith(('http://', 'https://')):
+                return text
+        return texts[0] if texts else None
+
+    def describe(self):
+        """Returns a plain dict describing the task, for the task list."""
+        now = time.monotonic()
+        return {
+            'id': self.id,
+            'name': self.name,
+            'key': self.key,
+            'category': self.category,
+            'priority': self.priority,
+            'state': self.state,
+            'queued_seconds': (self.started_at or now) - self.submitted_at,
+            'running_seconds': now - self.started_at if self.started_at else 0.0,
+            'deadline_seconds': self.run_token.timeout if self.run_token else None,
+        }
+
+class TaskExecutor:
+    """
+    Runs the add-on's workers on a bounded pool of threads.
+    Queued tasks start in priority order, so interactive commands overtake background
+    feed refreshes, and each category has its own concurrency limit so that, for
+    example, long downloads cannot occupy every thread needed for network lookups.
+    Each task runs under a cancellation token limited by its deadline, given to submit
+    or returned by deadline_func(task). A task still running ABANDON_GRACE_SECONDS
+    after its deadline passed is abandoned: it no longer counts as running, its thread
+    is replaced and on_abandoned(task) is called to release what it held.
+    If admission_func(task) returns False, submit drops the task, e.g. network work while offline.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, category_limits=None, deadline_func=None, on_abandoned=None, admission_func=None):
+        self.max_workers = max_workers
+        self.category_limits = dict(DEFAULT_CATEGORY_LIMITS if category_limits is None else category_limits)
+        self.deadline_func = deadline_func
+        self.on_abandoned = on_abandoned
+        self.admission_func = admission_func
+        self._condition = threading.Condition()
+        self._queue = []
+        self._running = {}
+        self._threads = []
+        self._idle_threads = 0
+        self._ids = itertools.count(1)
+        self._shutdown = False
+        self._watchdog = None
+
+    def submit(self, target, args=(), kwargs=None, name=None, priority=PRIORITY_INTERACTIVE, category=CATEGORY_NETWORK, key=None, deadline=None):
+        """
+        Queues target(*args, **kwargs), with the same arguments as threading.Thread.
+        key identifies tasks of the same kind, see is_active. deadline is the wall-clock
+        budget in seconds once the task starts, overriding deadline_func.
+        Returns the Task, or None after shutdown or when admission_func refused it.
+        """
+        task = Task(
+            next(self._ids), target, tuple(args), dict(kwargs or {}),
+            name or getattr(target, '__name__', repr(target)), priority, category, key
+        )
+        task.deadline = deadline
+        if self.admission_func is not None and not self.admission_func(task):
+            log.debug("Task %s was not admitted.", task.name)
+            return None
+        with self._condition:
+            if self._shutdown:
+                return None
+            self._queue.append(task)
+            if self._idle_threads == 0 and len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._worker_loop, name=f"YoutubePlusTask-{len(self._threads) + 1}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._condition.notify()
+        log.debug("Queued task %s (%s, priority %d).", task.name, category, priority)
+        return task
+
+    def _category_has_capacity(self, category):
+        limit = self.category_limits.get(category)
+        if limit is None:
+            return True
+        return sum(1 for task in self._running.values() if task.category == category) < limit
+
+    def _next_task(self):
+        """Returns the highest priority queued task that may start now. Called with the condition held."""
+        runnable = [task for task in self._queue if self._category_has_capacity(task.category)]
+        if not runnable:
+            return None
+        task = min(runnable, key=lambda t: (t.priority, t.id))
+        self._queue.remove(task)
+        return task
+
+    def _deadline_for(self, task):
+        if task.deadline is not None:
+            return task.deadline or None
+        if self.deadline_func is None:
+            return None
+        try:
+            return self.deadline_func(task) or None
+        except Exception:
+            log.debug("Could not determine the deadline of task %s.", task.name, exc_info=True)
+            return None
+
+    def _worker_loop(self):
+        try:
+            self._run_tasks()
+        finally:
+            with self._condition:
+                # An exiting thread no longer counts, so submit can start a replacement.
+                if threading.current_thread() in self._threads:
+                    self._threads.remove(threading.current_thread())
+
+    def _run_tasks(self):
+        while True:
+            with self._condition:
+                self._idle_threads += 1
+                task = self._next_task()
+                while task is None and not self._shutdown:
+                    self._condition.wait()
+                    task = self._next_task()
+                self._idle_threads -= 1
+                if task is None:
+                    return
+                token = task.cancel_token
+                if token is not None and token.is_cancelled:
+                    log.debug("Skipping cancelled task %s.", task.name)
+                    continue
+                task.run_token = CancellationToken(parent=token, timeout=self._deadline_for(task))
+                # Follow-up tasks are submitted with this, so they don't inherit this task's deadline.
+                task.run_token.submitted_token = token
+                if token is not None:
+                    task.kwargs['cancel_token'] = task.run_token
+                task.state = STATE_RUNNING
+                task.started_at = time.monotonic()
+                task.thread = threading.current_thread()
+                self._running[task.id] = task
+                if task.run_token.deadline is not None:
+                    self._ensure_watchdog()
+            try:
+                with cancellation_scope(task.run_token):
+                    task.target(*task.args, **task.kwargs)
+            except OperationCancelled:
+                # Workers without the utils.cancellable wrapper end here when cancelled.
+                log.debug("%s was cancelled.", task.name)
+            except Exception:
+                log.error(f"Unhandled error in task {task.name}.", exc_info=True)
+            finally:
+                with self._condition:
+                    if task.abandoned:
+                        log.info("Abandoned task %s finished after %.0fs.", task.name, time.monotonic() - task.started_at)
+                        # A replacement thread has taken this one's place.
+                        return
+                    self._running.pop(task.id, None)
+                    # A finished task may free its category for a waiting task.
+                    self._condition.notify_all()
+                if task.run_token.timed_out:
+                    metrics.increment("tasks.timed_out", label=task.name)
+                    log.warning("Task %s for %s was stopped after exceeding its %ds deadline.", task.name, task.subject, task.run_token.timeout)
+
+    def _ensure_watchdog(self):
+        """Starts the deadline watchdog if it is not running. Called with the condition held."""
+        if self._watchdog is None or not self._watchdog.is_alive():
+            self._watchdog = threading.Thread(target=self._watchdog_loop, name="YoutubePlusTaskWatchdog", daemon=True)
+            self._watchdog.start()
+
+    def _watchdog_loop(self):
+        """Wakes the tasks whose deadline passed and abandons those that do not stop."""
+        while True:
+            abandoned = []
+            with self._condition:
+                if self._shutdown:
+                    return
+                now = time.monotonic()
+                # Includes tasks whose deadline is suspended for now, so the watchdog keeps running for them.
+                timed = [task for task in self._running.values() if task.run_token.timeout]
+                if not timed:
+                    self._watchdog = None
+                    return
+                for task in timed:
+                    deadline = task.run_token.deadline
+                    if deadline is None:
+                        continue
+                    if now >= deadline + ABANDON_GRACE_SECONDS:
+                        self._abandon(task)
+                        abandoned.append(task)
+                    elif now >= deadline and not task.run_token.timed_out:
+                        log.warning("Task %s for %s exceeded its %ds deadline; cancelling it.", task.name, task.subject, task.run_token.timeout)
+                        # Checking the token marks it timed out and cancels it, waking any waits.
+                        task.run_token.is_cancelled
+                self._condition.wait(WATCHDOG_INTERVAL_SECONDS)
+            for task in abandoned:
+                if self.on_abandoned is not None:
+                    try:
+                        self.on_abandoned(task)
+                    except Exception:
+                        log.error(f"Error releasing the resources of abandoned task {task.name}.", exc_info=True)
+
+    def _abandon(self, task):
+        """Stops tracking a hung task and lets another thread take its place. Called with the condition held."""
+        task.abandoned = True
+        self._running.pop(task.id, None)
+        if task.thread in self._threads:
+            self._threads.remove(task.thread)
+        metrics.increment("tasks.abandoned", label=task.name)
+        log.error(
+            "Task %s for %s did not stop within %ds after its %ds deadline and was abandoned; its thread is left to finish on its own.",
+            task.name, task.subject, ABANDON_GRACE_SECONDS, task.run_token.timeout
+        )
+        if self._queue and self._idle_threads == 0 and len(self._threads) < self.max_workers:
+            thread = threading.Thread(target=self._worker_loop, name=f"YoutubePlusTask-{len(self._threads) + 1}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+        self._condition.notify_all()
+
+    def is_active(self, key):
+        """Returns True if a task with the given key is queued or running."""
+        with self._condition:
+            return any(task.key == key for task in itertools.chain(self._running.values(), self._queue))
+
+    def has_running_tasks(self, include_queued=False):
+        with self._condition:
+            return bool(self._running) or (include_queued and bool(self._queue))
+
+    def list_tasks(self):
+        """Returns descriptions of the running tasks followed by the queued ones in start order."""
+        with self._condition:
+            running = sorted(self._running.values(), key=lambda t: t.started_at)
+            queued = sorted(self._queue, key=lambda t: (t.priority, t.id))
+            return [task.describe() for task in running + queued]
+
+    def cancel(self, task_id):
+        """
+        Removes a queued task, or cancels a running one through its cancellation token.
+        Returns False if the task is unknown.
+        """
+        with self._condition:
+            for task in self._queue:
+                if task.id == task_id:
+                    self._queue.remove(task)
+                    return True
+            task = self._running.get(task_id)
+        if task is not None:
+            task.run_token.cancel()
+            return True
+        return False
+
+    def shutdown(self):
+        """Drops the queued tasks and cancels the running ones."""
+        with self._condition:
+            self._shutdown = True
+            self._queue.clear()
+            running = list(self._running.values())
+            self._condition.notify_all()
+        for task in running:
+            task.run_token.cancel()
@@ -5,7 +5,12 @@
 # Licensed under the GNU General Public License.
 
 import time
+import math
 import functools
+import random
+import email.utils
+import threading
+import concurrent.futures
 import logging
 import types
 import itertools
@@ -17,40 +22,404 @@ import NVDAObjects.IAccessible
 import core
 import yt_dlp.utils
 from socket import timeout as TimeoutError
+from contextlib import contextmanager
+from .errors import CircuitOpenError, OfflineError, OperationCancelled
+from .connectivity import connectivity
+from .metrics import metrics
 
-def retry_on_network_error(retries=3, delay=5):
+class CancellationToken:
     """
-    A decorator to retry a function on specific, transient network-related errors.
+    Lets the UI ask a worker to stop. Workers check it between pages, entries and
+    retries; waiting on it instead of sleeping ends the wait as soon as it is cancelled.
+    A token with a parent is also cancelled with its parent. A token with a timeout is
+    cancelled once that many seconds have passed, counted from its creation or from the
+    last call to extend, so it can bound either the whole operation or a stall.
+    """
+    # How often a wait re-checks a parent or deadline, which cannot wake it up themselves.
+    _POLL_SECONDS = 0.25
+
+    def __init__(self, parent=None, timeout=None):
+        self._event = threading.Event()
+        self._parent = parent
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.timed_out = False
+
+    def cancel(self):
+        self._event.set()
+
+    def extend(self):
+        """Restarts the timeout, e.g. whenever a download makes progress."""
+        if self.timeout:
+            self.deadline = time.monotonic() + self.timeout
+
+    def suspend(self):
+        """Stops the timeout until the next extend, e.g. while a step that reports no progress runs."""
+        if self.timeout:
+            self.deadline = None
+
+    @property
+    def is_cancelled(self):
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.timed_out = True
+            self._event.set()
+            return True
+        if self._parent is not None and self._parent.is_cancelled:
+            self._event.set()
+            return True
+        return False
+
+    def raise_if_cancelled(self):
+        if self.is_cancelled:
+            raise OperationCancelled()
+
+    def wait(self, timeout):
+        """Waits up to timeout seconds; returns True if the token was cancelled meanwhile."""
+        if self._parent is None and self.deadline is None:
+            return self._event.wait(timeout)
+        end = time.monotonic() + timeout
+        while not self.is_cancelled:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self.deadline is not None:
+                remaining = min(remaining, max(0.0, self.deadline - time.monotonic()))
+            self._event.wait(min(remaining, self._POLL_SECONDS))
+        return True
+
+_cancel_scope = threading.local()
+
+def current_cancel_token():
+    """Returns the cancellation token of the worker running on this thread, or None."""
+    return getattr(_cancel_scope, 'token', None)
+
+def extend_current_deadline():
+    """Restarts the deadline of the current thread's worker, for work that reports progress."""
+    token = current_cancel_token()
+    if token is not None:
+        token.extend()
+
+def submitted_cancel_token():
+    """
+    Returns the token the running task was submitted with, without the deadline the task
+    executor added to it. Pass this to follow-up tasks, which get deadlines of their own.
+    """
+    token = current_cancel_token()
+    return getattr(token, 'submitted_token', token)
+
+@contextmanager
+def cancellation_scope(token):
+    """Makes token the current thread's token, so deeper calls (yt-dlp logging, retries) can check it."""
+    previous = current_cancel_token()
+    _cancel_scope.token = token
+    try:
+        yield token
+    finally:
+        _cancel_scope.token = previous
+
+def check_cancelled():
+    """Raises OperationCancelled if the current thread's worker has been cancelled."""
+    token = current_cancel_token()
+    if token is not None:
+        token.raise_if_cancelled()
+
+def sleep_cancellable(seconds):
+    """Sleeps like time.sleep, but wakes up and raises OperationCancelled on cancellation."""
+    token = current_cancel_token()
+    if token is None:
+        time.sleep(seconds)
+    elif token.wait(seconds):
+        raise OperationCancelled()
+
+def cancellable(func):
+    """
+    A decorator for workers: adds a cancel_token keyword argument and makes it the thread's
+    current token while the worker runs. Without one, the caller's current token is kept.
+    A cancelled worker returns None quietly; its finally blocks still run.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, cancel_token=None, **kwargs):
+        with cancellation_scope(cancel_token or current_cancel_token()):
+            try:
+                return func(*args, **kwargs)
+            except OperationCancelled:
+                logging.debug("%s was cancelled.", func.__name__)
+                return None
+    return wrapper
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing host after failure_threshold consecutive network failures.
+    While open, calls fail fast with CircuitOpenError. After reset_timeout one probe call
+    is let through; its success closes the breaker, its failure opens it again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=60):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._open_until = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state
+
+    def before_call(self):
+        """Raises CircuitOpenError if the call must not be made now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            now = time.monotonic()
+            if self._state == self.OPEN and now >= self._open_until:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                logging.debug("Circuit breaker for %s lets a probe call through.", self.name)
+                return
+            if self._state == self.HALF_OPEN:
+                # Another caller's probe is deciding whether the host is back.
+                message = f"{self.name} is not responding. Checking whether it is back."
+            else:
+                message = f"{self.name} is not responding. Retrying in about {math.ceil(self._open_until - now)} seconds."
+        raise CircuitOpenError(message)
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                logging.info("Circuit breaker for %s closed.", self.name)
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """Lets another probe through when a probe call ended without an answer, e.g. it was cancelled."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open(self.reset_timeout)
+
+    def trip(self, seconds):
+        """Opens the breaker for at least the given number of seconds, e.g. for a Retry-After."""
+        with self._lock:
+            self._open(max(seconds, self.reset_timeout))
+
+    def _open(self, seconds):
+        if self._state != self.OPEN:
+            logging.warning("Circuit breaker for %s opened for %ds after %d failures.", self.name, seconds, self._failures)
+            metrics.increment("network.circuit_breaker_trips", label=self.name)
+        self._state = self.OPEN
+        self._open_until = max(self._open_until, time.monotonic() + seconds)
+        self._probe_in_flight = False
+
+# Shared by every yt-dlp call that goes to YouTube, so an outage is detected once for all callers.
+youtube_circuit_breaker = CircuitBreaker("youtube.com")
+
+_RETRYABLE_MESSAGES = (
+    "timed out", "network is unreachable", "tls handshake", "http error 50",
+    "http error 429", "too many requests", "connection reset", "temporary failure in name resolution",
+)
+
+def _iter_causes(error):
+    """Yields error and the exceptions it wraps (yt-dlp keeps them in exc_info and cause)."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        exc_info = getattr(error, 'exc_info', None)
+        wrapped = exc_info[1] if isinstance(exc_info, tuple) and len(exc_info) > 1 else None
+        error = wrapped or getattr(error, 'cause', None) or error.__cause__ or error.__context__
+
+def _is_retryable(error):
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    error_str = str(error).lower()
+    return any(message in error_str for message in _RETRYABLE_MESSAGES)
+
+def _retry_after_seconds(error):
+    """Returns the Retry-After of a 429/503 response wrapped in error, in seconds, or None."""
+    for cause in _iter_causes(error):
+        status = getattr(cause, 'status', None) or getattr(cause, 'code', None)
+        if status not in (429, 503):
+            continue
+        response = getattr(cause, 'response', None)
+        headers = getattr(response, 'headers', None) or getattr(cause, 'headers', None)
+        value = headers.get('Retry-After') if headers is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    return None
+
+OFFLINE_MESSAGE = "YouTube cannot be reached. Check your internet connection."
+
+def raise_if_offline():
+    """Fails fast with OfflineError while the add-on is in offline mode."""
+    if connectivity.is_offline:
+        raise OfflineError(OFFLINE_MESSAGE)
+
+def report_network_failure(error):
+    """
+    Lets the connectivity monitor check the connection after a failure that looks like a
+    network problem. Returns True if the add-on is now offline.
+    """
+    return _is_retryable(error) and connectivity.report_failure(error)
+
+def retry_with_backoff(retries=3, base_delay=2, max_delay=30, breaker=None):
+    """
+    A decorator to retry a function on transient network-related errors, waiting
+    exponentially longer with random jitter between attempts. A Retry-After from a
+    429/503 response is honoured, and opens the breaker so other callers back off too.
+    Errors that are not network failures (private or removed videos etc.) are not
+    retried and count as a response from the host; other exceptions do not count either way.
+    In offline mode, or once a failure turns out to be a lost connection, it fails at once
+    with OfflineError.
     """
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            for i in range(retries):
+            for attempt in range(retries):
+                check_cancelled()
+                raise_if_offline()
+                if breaker:
+                    breaker.before_call()
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except (yt_dlp.utils.DownloadError, ConnectionError, TimeoutError) as e:
-                    error_str = str(e).lower()
-                    is_retryable = (
-                        isinstance(e, (ConnectionError, TimeoutError)) or
-                        "timed out" in error_str or
-                        "network is unreachable" in error_str or
-                        "tls handshake" in error_str or
-                        "http error 50" in error_str 
-                    )
-
-                    if is_retryable:
-                        if i < retries - 1:
-                            logging.warning(f"Network error encountered: '{e}'. Retrying in {delay}s... ({i+1}/{retries})")
-                            time.sleep(delay)
-                        else:
-                            logging.error(f"Network error persisted after {retries} retries. Failing.", exc_info=True)
-                            raise e
-                    else:
+                    if not _is_retryable(e):
+                        if breaker:
+                            breaker.record_success()
                         logging.debug("A non-retryable DownloadError occurred: %s", e)
-                        raise e
+                        raise
+                    if report_network_failure(e):
+                        # Retrying can't help while the connection itself is down.
+                        if breaker:
+                            breaker.release_probe()
+                        metrics.increment("network.failures", label=func.__name__)
+                        raise OfflineError(OFFLINE_MESSAGE) from e
+                    retry_after = _retry_after_seconds(e)
+                    if breaker:
+                        breaker.record_failure()
+                        if retry_after:
+                            breaker.trip(retry_after)
+                    if attempt >= retries - 1 or (retry_after and retry_after > max_delay):
+                        metrics.increment("network.failures", label=func.__name__)
+                        logging.error(f"Network error persisted after {attempt + 1} attempts. Failing.", exc_info=True)
+                        raise
+                    if retry_after is not None:
+                        delay = retry_after
+                    else:
+                        ceiling = min(max_delay, base_delay * 2 ** attempt)
+                        delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+                    metrics.increment("network.retries", label=func.__name__)
+                    logging.warning(f"Network error encountered: '{e}'. Retrying in {delay:.1f}s... ({attempt + 1}/{retries})")
+                    sleep_cancellable(delay)
+                except (OperationCancelled, Exception):
+                    # Cancellation, offline mode and other local failures mean no request got an
+                    # answer from the host, so they neither close nor open the breaker.
+                    if breaker:
+                        breaker.release_probe()
+                    raise
+                else:
+                    if breaker:
+                        breaker.record_success()
+                    connectivity.report_success()
+                    return result
         return wrapper
     return decorator
 
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+    Callers arriving while a call is in flight wait on its future and receive
+    the same result (or exception) instead of running the call again.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key, func, *args, **kwargs):
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = concurrent.futures.Future()
+                self._in_flight[key] = future
+        if not is_leader:
+            logging.debug("Joining in-flight call for %r", key)
+            metrics.increment("single_flight.joined")
+            while True:
+                try:
+                    return future.result(timeout=0.25)
+                except concurrent.futures.TimeoutError:
+                    check_cancelled()
+                except OperationCancelled:
+                    # The leader was cancelled, not this caller; run the call itself.
+                    check_cancelled()
+                    return self.do(key, func, *args, **kwargs)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+class TokenBucket:
+    """
+    A thread-safe token bucket rate limiter.
+    Allows bursts of up to capacity calls and rate calls per second on average.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout=None):
+        """Takes one token, waiting for it if needed. Returns False if timeout expires first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
 def executeAsynchronously(gen):
     if not isinstance(gen, types.GeneratorType):
         raise Exception("Generator function required")